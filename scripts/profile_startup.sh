@@ -0,0 +1,36 @@
+#!/usr/bin/env bash
+# Rank the slowest imports on the Espanded startup path.
+#
+# Usage: scripts/profile_startup.sh [count]
+#
+# Runs `python -X importtime` on the create_app import and prints the
+# modules with the highest self time (microseconds). Set PYTHON to use a
+# specific interpreter, e.g. PYTHON="uv run python". For a flame view,
+# feed the raw log to tuna: `tuna "$log"`.
+
+set -euo pipefail
+
+count="${1:-20}"
+python="${PYTHON:-python}"
+root="$(cd "$(dirname "$0")/.." && pwd)"
+log="$(mktemp -t espanded-importtime.XXXXXX)"
+
+status=0
+PYTHONPATH="$root/src${PYTHONPATH:+:$PYTHONPATH}" \
+    $python -X importtime -c "from espanded.app import create_app" 2> "$log" || status=$?
+
+echo "Raw log: $log"
+if [ "$status" -ne 0 ]; then
+    # Still rank what was imported before the failure
+    echo "warning: import failed (exit $status), timings are partial:" >&2
+    grep -v '^import time:' "$log" | tail -n 1 >&2
+fi
+printf "%10s  %10s  %s\n" "self (us)" "cumul (us)" "module"
+# Lines look like: "import time:      self |  cumulative | module"
+awk -F'|' '/^import time: *[0-9]/ {
+    sub(/^import time: */, "", $1)
+    gsub(/^ +| +$/, "", $3)
+    printf "%10d  %10d  %s\n", $1, $2, $3
+}' "$log" | sort -rn | sed -n "1,${count}p"
+
+exit "$status"
@@ -0,0 +1,31 @@
+"""Lazy re-exports for package __init__ modules."""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def make_lazy_getattr(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Build a module __getattr__ that imports re-exported names on first access.
+
+    Importing one submodule of a package then doesn't pull in every sibling.
+
+    Args:
+        package: The package's __name__
+        exports: Public name -> module that defines it
+
+    Returns:
+        Function to assign to the package's __getattr__
+    """
+    def lazy_getattr(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    lazy_getattr.__name__ = lazy_getattr.__qualname__ = "__getattr__"
+    return lazy_getattr
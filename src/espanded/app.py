@@ -1,128 +1,105 @@
 """PySide6 application setup and configuration."""
 
 import logging
+import os
 import sys
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt
-
 from espanded.core.app_state import get_app_state
-from espanded.ui.theme import ThemeManager, ThemeSettings
-from espanded.ui.main_window import MainWindow
-from espanded.ui.system_tray import SystemTray
-from espanded.ui.quick_add import QuickAddPopup
+from espanded.services.hotkey_service import DEFAULT_HOTKEY, get_hotkey_service
 from espanded.ui.fonts import load_custom_fonts
-from espanded.services.hotkey_service import get_hotkey_service
-from espanded.services.autocomplete_service import init_autocomplete_service, get_autocomplete_service
-from espanded.hotkeys.listener import get_keystroke_monitor
-
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stdout
-)
-
-# Optional sync support
-try:
-    from espanded.sync import SyncManager
-    SYNC_AVAILABLE = True
-except ImportError:
-    SYNC_AVAILABLE = False
-    SyncManager = None
+from espanded.ui.main_window import MainWindow
+from espanded.ui.theme import ThemeManager, ThemeSettings
 
 logger = logging.getLogger(__name__)
 
+# Skip the startup GitHub connection test if one succeeded this recently
+SYNC_CHECK_TTL = 300  # seconds
 
-def create_app() -> tuple[MainWindow | None, dict]:
-    """Create and configure the Qt application.
 
-    Returns:
-        tuple: (MainWindow instance or None, dict of initialized services)
-    """
-    print("=" * 80)
-    print("ESPANDED STARTUP - BEGIN (Qt)")
-    print("=" * 80)
+def _configure_logging():
+    """Configure root logging - verbose only when ESPANDED_DEBUG is set."""
+    if os.environ.get("ESPANDED_DEBUG"):
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            stream=sys.stdout,
+        )
+    else:
+        logging.basicConfig(level=logging.WARNING)
 
-    services = {
-        'hotkey_service': None,
-        'autocomplete_service': None,
-        'keystroke_monitor': None,
-        'sync_manager': None,
-        'tray': None,
-        'cleanup_func': None,
-    }
 
-    try:
-        # Initialize app state
-        print("[1/8] Initializing app state...")
-        app_state = get_app_state()
-        print("✓ App state initialized")
+# Optional sync support - resolved on first use so the GitHub client stack
+# is only imported when sync is actually configured
+_sync_cls = None
 
-        # Initialize tag color manager with app_state
-        from espanded.ui.tag_colors import get_tag_color_manager
-        tag_color_manager = get_tag_color_manager()
-        tag_color_manager.set_app_state(app_state)
-        print("✓ Tag color manager initialized")
 
-        # Load custom fonts
-        print("[2/8] Loading custom fonts...")
-        font_family = load_custom_fonts()
-        if font_family:
-            print(f"✓ Custom font loaded: {font_family}")
-        else:
-            print("⚠ Custom font not loaded, using system default")
+def _load_sync():
+    """Import and cache the SyncManager class.
 
-        # Load settings
-        print("[3/8] Loading settings...")
-        settings = app_state.settings
-        print(f"✓ Settings loaded: theme={settings.theme}, has_imported={settings.has_imported}")
+    Returns:
+        SyncManager class, or None if sync dependencies are unavailable.
+    """
+    global _sync_cls
+    if _sync_cls is None:
+        try:
+            from espanded.sync import SyncManager
 
-        # Initialize theme manager
-        print("[4/8] Initializing theme manager...")
-        theme_settings = ThemeSettings(
-            theme=settings.theme,
-            custom_colors=settings.custom_colors,
-        )
-        theme_manager = ThemeManager(theme_settings)
-        app_state.theme_manager = theme_manager
-        print("✓ Theme manager created")
+            _sync_cls = SyncManager
+        except ImportError:
+            _sync_cls = False
+    return _sync_cls or None
 
-    except Exception as e:
-        print(f"✗ ERROR during initialization: {e}")
-        traceback.print_exc()
-        return None, services
 
-    # Initialize hotkey service
+def _init_hotkeys(settings) -> tuple[str, object, Exception | None]:
+    """Start the global hotkey service.
+
+    Returns:
+        tuple: (service name, HotkeyService or None, error or None)
+    """
     try:
-        print("[4/8] Initializing hotkey service...")
+        logger.debug("[4/8] Initializing hotkey service...")
         hotkey_service = get_hotkey_service()
-        if hotkey_service.is_available:
-            # Use the quick add hotkey from settings
-            quick_add_hotkey = settings.quick_add_hotkey or "<ctrl>+<alt>+`"
-            print(f"  Starting hotkey listener with: {quick_add_hotkey}")
+        # Use the quick add hotkey from settings
+        quick_add_hotkey = settings.quick_add_hotkey or DEFAULT_HOTKEY
+        if not settings.hotkeys_enabled:
+            # Only remember the hotkey so a later enable() can attach the
+            # listener - pynput is not imported until then
+            hotkey_service.start(quick_add_hotkey, enabled=False)
+            logger.debug("Hotkey service configured (disabled in settings)")
+        elif hotkey_service.is_available:
+            logger.debug(f"Starting hotkey listener with: {quick_add_hotkey}")
             hotkey_service.start(quick_add_hotkey)
-            # Respect enabled/disabled setting
-            if not getattr(settings, 'hotkeys_enabled', True):
-                hotkey_service.disable()
-            print(f"✓ Hotkey service started: {quick_add_hotkey} (enabled: {hotkey_service.is_enabled})")
+            logger.debug(f"Hotkey service started: {quick_add_hotkey}")
         else:
-            print("⚠ Hotkey service not available (pynput not installed or failed to import)")
-        services['hotkey_service'] = hotkey_service
+            logger.warning(
+                "Hotkey service not available (pynput not installed or failed to import)"
+            )
+        return "hotkey_service", hotkey_service, None
     except Exception as e:
-        print(f"⚠ WARNING: Hotkey service initialization failed: {e}")
-        traceback.print_exc()
-        # Continue without hotkeys
+        return "hotkey_service", None, e
+
+
+def _init_autocomplete(settings, app_state, theme_manager) -> tuple[str, object, Exception | None]:
+    """Start the autocomplete service and keystroke monitor.
+
+    Must run on the Qt main thread - the service owns a QTimer and popup widget.
 
-    # Initialize autocomplete service (inline suggestions)
+    Returns:
+        tuple: (service name, (AutocompleteService, KeystrokeMonitor) or None, error or None)
+    """
     try:
-        print("[5/8] Initializing autocomplete service...")
+        logger.debug("[5/8] Initializing autocomplete service...")
         autocomplete_service = None
         keystroke_monitor = None
 
         if settings.autocomplete_enabled:
+            from espanded.hotkeys.listener import get_keystroke_monitor
+            from espanded.services.autocomplete_service import init_autocomplete_service
+
             # Initialize the autocomplete service
             autocomplete_service = init_autocomplete_service(app_state, theme_manager)
 
@@ -132,126 +109,295 @@ def create_app() -> tuple[MainWindow | None, dict]:
                 # Set the callback to route keystrokes to autocomplete service
                 keystroke_monitor.set_callback(autocomplete_service.on_key_press)
                 keystroke_monitor.start()
-                print(f"✓ Autocomplete service started with triggers: {settings.autocomplete_triggers}")
+                logger.debug(
+                    f"Autocomplete service started with triggers: {settings.autocomplete_triggers}"
+                )
             else:
-                print("⚠ Keystroke monitor not available")
+                logger.warning("Keystroke monitor not available")
 
             # Start the autocomplete service
             autocomplete_service.start()
         else:
-            print("✓ Autocomplete service skipped (disabled in settings)")
+            logger.debug("Autocomplete service skipped (disabled in settings)")
 
-        services['autocomplete_service'] = autocomplete_service
-        services['keystroke_monitor'] = keystroke_monitor
+        return "autocomplete_service", (autocomplete_service, keystroke_monitor), None
     except Exception as e:
-        print(f"⚠ WARNING: Autocomplete service initialization failed: {e}")
-        traceback.print_exc()
-        # Continue without autocomplete
+        return "autocomplete_service", None, e
+
+
+def _init_sync(settings) -> tuple[str, object, Exception | None]:
+    """Create the sync manager and verify the GitHub connection.
+
+    Runs on a startup worker while the main thread builds widgets from the
+    same settings, so it only reads them; the caller applies the returned
+    connection test result.
 
-    # Initialize sync manager (if available and configured)
+    Returns:
+        tuple: (service name, (SyncManager or None, sync check or None),
+        error or None). The sync check is the new (last_sync_check,
+        last_sync_fingerprint) pair, or None if no connection test ran.
+    """
     try:
-        print("[6/8] Initializing sync manager...")
+        logger.debug("[6/8] Initializing sync manager...")
         sync_manager = None
-        if SYNC_AVAILABLE and SyncManager and settings.github_repo and settings.github_token:
+        sync_check = None
+        sync_cls = None
+        if settings.github_repo and settings.github_token:
+            sync_cls = _load_sync()
+        if sync_cls:
             try:
-                sync_manager = SyncManager(
+                sync_manager = sync_cls(
                     repo=settings.github_repo,
                     token=settings.github_token,
-                    local_path=Path(settings.espanso_config_path) if settings.espanso_config_path else Path.home() / ".config" / "espanso",
+                    local_path=Path(settings.espanso_config_path)
+                    if settings.espanso_config_path
+                    else Path.home() / ".config" / "espanso",
                     on_conflict=None,  # TODO: Wire up conflict resolution UI
                 )
 
-                # Test connection
-                if sync_manager.test_connection():
-                    print(f"✓ GitHub sync connected to {settings.github_repo}")
+                # Test connection, unless a recent startup already did with
+                # the same repo and token
+                fingerprint = settings.sync_fingerprint()
+                if (
+                    time.time() - settings.last_sync_check < SYNC_CHECK_TTL
+                    and settings.last_sync_fingerprint == fingerprint
+                ):
+                    logger.debug("GitHub sync connection test skipped (checked recently)")
+                    connected = True
+                else:
+                    connected = sync_manager.test_connection()
+                    sync_check = (time.time(), fingerprint) if connected else (0.0, "")
+
+                if connected:
+                    logger.debug(f"GitHub sync connected to {settings.github_repo}")
 
                     # Start auto-sync if enabled
                     if settings.auto_sync:
                         sync_manager.start_auto_sync(settings.sync_interval)
-                        print(f"✓ Auto-sync started (interval: {settings.sync_interval}s)")
+                        logger.debug(f"Auto-sync started (interval: {settings.sync_interval}s)")
                 else:
-                    print("⚠ GitHub sync connection test failed")
+                    logger.warning("GitHub sync connection test failed")
                     sync_manager = None
 
             except Exception as e:
-                print(f"⚠ Failed to initialize sync manager: {e}")
+                logger.warning(f"Failed to initialize sync manager: {e}")
                 sync_manager = None
         else:
-            print("✓ Sync manager skipped (not configured)")
+            logger.debug("Sync manager skipped (not configured)")
 
-        # Store sync manager in app state for later access
-        app_state.sync_manager = sync_manager
-        services['sync_manager'] = sync_manager
+        return "sync_manager", (sync_manager, sync_check), None
     except Exception as e:
-        print(f"⚠ WARNING: Sync manager initialization failed: {e}")
-        traceback.print_exc()
-        app_state.sync_manager = None
-        # Continue without sync
+        return "sync_manager", None, e
+
+
+def _init_tray(settings, theme_manager) -> tuple[str, object, Exception | None]:
+    """Create the Qt system tray icon.
+
+    Must run on the Qt main thread.
 
-    # Initialize system tray (Qt-based)
+    Returns:
+        tuple: (service name, SystemTray or None, error or None)
+    """
     try:
-        print("[7/8] Initializing system tray...")
+        logger.debug("[7/8] Initializing system tray...")
         tray = None
         # Check if system tray is available
         from PySide6.QtWidgets import QSystemTrayIcon
+
         if not QSystemTrayIcon.isSystemTrayAvailable():
-            print("⚠ System tray not available on this platform")
+            logger.warning("System tray not available on this platform")
         elif settings.minimize_to_tray:
+            from espanded.ui.system_tray import SystemTray
+
             tray = SystemTray(theme_manager)
-            print("✓ Qt system tray created")
+            logger.debug("Qt system tray created")
         else:
-            print("✓ System tray skipped (minimize_to_tray disabled)")
-        services['tray'] = tray
+            logger.debug("System tray skipped (minimize_to_tray disabled)")
+        return "tray", tray, None
     except Exception as e:
-        print(f"⚠ WARNING: System tray initialization failed: {e}")
+        return "tray", None, e
+
+
+def _apply_app_props(theme_manager: ThemeManager):
+    """Apply the global font and theme stylesheet to the QApplication.
+
+    Done once before any widget exists - setting either on a populated
+    application re-polishes and re-lays-out every widget in the tree.
+
+    Args:
+        theme_manager: Theme manager providing the application stylesheet
+    """
+    from PySide6.QtGui import QFont, QFontDatabase
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        return
+
+    if "Lexend" in QFontDatabase.families():
+        app_font = QFont("Lexend")
+        app_font.setPointSize(10)
+        app.setFont(app_font)
+        logger.debug("Lexend font applied globally")
+    else:
+        logger.warning("Lexend font not found in available families")
+
+    theme_manager.apply_to_app(app)
+
+
+def create_app() -> tuple[MainWindow | None, dict]:
+    """Create and configure the Qt application.
+
+    Returns:
+        tuple: (MainWindow instance or None, dict of initialized services)
+    """
+    # Before anything logs, including the background init workers
+    _configure_logging()
+
+    services = {
+        "hotkey_service": None,
+        "autocomplete_service": None,
+        "keystroke_monitor": None,
+        "sync_manager": None,
+        "tray": None,
+        "cleanup_func": None,
+    }
+
+    try:
+        # Initialize app state
+        logger.debug("[1/8] Initializing app state...")
+        app_state = get_app_state()
+        logger.debug("App state initialized")
+
+        # Load settings once - a single DB read; the startup helpers below
+        # (including the worker threads) only read from this snapshot
+        logger.debug("[2/8] Loading settings...")
+        settings = app_state.settings
+        logger.debug(
+            f"Settings loaded: theme={settings.theme}, has_imported={settings.has_imported}"
+        )
+
+        # Initialize tag color manager with app_state
+        from espanded.ui.tag_colors import get_tag_color_manager
+
+        tag_color_manager = get_tag_color_manager()
+        tag_color_manager.set_app_state(app_state)
+        logger.debug("Tag color manager initialized")
+
+        # Load custom fonts
+        logger.debug("[3/8] Loading custom fonts...")
+        font_family = load_custom_fonts()
+        if font_family:
+            logger.debug(f"Custom font loaded: {font_family}")
+        else:
+            logger.warning("Custom font not loaded, using system default")
+
+        # Initialize theme manager
+        logger.debug("[4/8] Initializing theme manager...")
+        theme_settings = ThemeSettings(
+            theme=settings.theme,
+            custom_colors=settings.custom_colors,
+        )
+        theme_manager = ThemeManager(theme_settings)
+        app_state.theme_manager = theme_manager
+        _apply_app_props(theme_manager)
+        logger.debug("Theme manager created and applied")
+
+    except Exception as e:
+        logger.error(f"Error during initialization: {e}")
         traceback.print_exc()
-        tray = None
-        # Continue without tray
+        return None, services
+
+    # Hotkey attach and the GitHub connection test are I/O bound, so run them
+    # in the background while the Qt-bound services and the main window are
+    # created on this thread. Sync goes first: the gitpython/httpx imports
+    # plus the HTTPS round-trip are the slowest startup work (see
+    # scripts/profile_startup.sh)
+    main_window = None
+    sync_check = None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        f_sync = executor.submit(_init_sync, settings)
+        f_hotkeys = executor.submit(_init_hotkeys, settings)
+
+        autocomplete_result = _init_autocomplete(settings, app_state, theme_manager)
+        tray_result = _init_tray(settings, theme_manager)
+
+        # Services are attached once the background work has finished
+        try:
+            logger.debug("[8/8] Creating main window...")
+            main_window = MainWindow(theme_manager)
+            logger.debug("Main window created with custom title bar, sidebar, and content area")
+        except Exception as e:
+            logger.error(f"Error during window creation: {e}")
+            traceback.print_exc()
+
+    for name, obj, error in (
+        f_hotkeys.result(),
+        autocomplete_result,
+        f_sync.result(),
+        tray_result,
+    ):
+        if error is not None:
+            logger.warning(f"{name} initialization failed: {error}")
+            traceback.print_exception(error)
+            continue
+        if name == "autocomplete_service":
+            services["autocomplete_service"], services["keystroke_monitor"] = obj
+        elif name == "sync_manager":
+            services["sync_manager"], sync_check = obj
+        else:
+            services[name] = obj
+
+    # Store sync manager in app state for later access
+    app_state.sync_manager = services["sync_manager"]
+
+    # Apply the sync worker's connection test result here, on the thread
+    # that owns settings
+    if sync_check is not None and sync_check != (
+        settings.last_sync_check,
+        settings.last_sync_fingerprint,
+    ):
+        settings.last_sync_check, settings.last_sync_fingerprint = sync_check
+        app_state.save_settings()
 
     def cleanup_and_exit():
         """Cleanup resources and exit."""
         # Stop keystroke monitor
-        if services['keystroke_monitor']:
-            services['keystroke_monitor'].stop()
+        if services["keystroke_monitor"]:
+            services["keystroke_monitor"].stop()
 
         # Stop autocomplete service
-        if services['autocomplete_service']:
-            services['autocomplete_service'].stop()
+        if services["autocomplete_service"]:
+            services["autocomplete_service"].stop()
 
         # Stop hotkey service
-        if services['hotkey_service']:
-            services['hotkey_service'].stop()
+        if services["hotkey_service"]:
+            services["hotkey_service"].stop()
 
         # Stop sync manager
-        if services['sync_manager']:
-            services['sync_manager'].close()
+        if services["sync_manager"]:
+            services["sync_manager"].close()
 
         # Stop tray (Qt tray uses cleanup method)
-        if services['tray']:
-            services['tray'].cleanup()
+        if services["tray"]:
+            services["tray"].cleanup()
 
-        # Save settings
-        app_state.save_settings()
+        # Write out an Espanso sync still waiting on its debounce timer
+        app_state.entry_manager.flush_sync()
 
-    services['cleanup_func'] = cleanup_and_exit
+        # Write history rows still queued in the database
+        app_state.database.flush_history()
 
-    # Create main window
-    try:
-        print("[8/8] Creating main window...")
-        main_window = MainWindow(
-            theme_manager,
-            tray=services['tray'],
-            hotkey_service=services['hotkey_service'],
-        )
-        print("✓ Main window created with custom title bar, sidebar, and content area")
-
-        print("=" * 80)
-        print("ESPANDED STARTUP - COMPLETE (Qt)")
-        print("=" * 80)
+        # Save settings
+        app_state.save_settings()
 
-        return main_window, services
+    services["cleanup_func"] = cleanup_and_exit
 
-    except Exception as e:
-        print(f"✗ ERROR during window creation: {e}")
-        traceback.print_exc()
+    if main_window is None:
         return None, services
+
+    main_window.attach_services(
+        tray=services["tray"],
+        hotkey_service=services["hotkey_service"],
+    )
+    return main_window, services
@@ -1,5 +1,6 @@
 """Application state - singleton for shared services."""
 
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,80 +12,97 @@ if TYPE_CHECKING:
     from espanded.sync.sync_manager import SyncManager
 
 
-class AppState:
-    """Singleton application state holding shared services."""
+# Core service classes, imported together on the first lazy service miss
+_backends: SimpleNamespace | None = None
+
+
+def _load_backends() -> SimpleNamespace:
+    """Import the core service classes in one pass and cache them."""
+    global _backends
+    if _backends is None:
+        from espanded.core.database import Database
+        from espanded.core.entry_manager import EntryManager
+        from espanded.core.espanso import EspansoManager
+
+        _backends = SimpleNamespace(
+            Database=Database,
+            EntryManager=EntryManager,
+            EspansoManager=EspansoManager,
+        )
+    return _backends
 
-    _instance: "AppState | None" = None
+
+class AppState:
+    """Singleton application state holding shared services.
+
+    Services are stored in slots. The lazily-created ones (database,
+    entry_manager, espanso, theme_manager) start unset and are resolved by
+    __getattr__ on first access, after which reads are plain slot loads.
+    """
+
+    __slots__ = (
+        "database",
+        "entry_manager",
+        "espanso",
+        "theme_manager",
+        "sync_manager",
+        "_settings",
+    )
+
+    database: "Database"
+    entry_manager: "EntryManager"
+    espanso: "EspansoManager"
+    theme_manager: "ThemeManager"
+    sync_manager: "SyncManager | None"
 
     def __init__(self):
         """Initialize app state - use get_instance() instead."""
-        self._database: "Database | None" = None
-        self._entry_manager: "EntryManager | None" = None
-        self._espanso: "EspansoManager | None" = None
         self._settings: "Settings | None" = None
-        self._theme_manager: "ThemeManager | None" = None
-        self._sync_manager: "SyncManager | None" = None
+        self.sync_manager = None
 
     @classmethod
     def get_instance(cls) -> "AppState":
         """Get the singleton instance."""
-        if cls._instance is None:
-            cls._instance = AppState()
-        return cls._instance
+        return get_app_state()
 
     @classmethod
     def reset(cls):
         """Reset the singleton (for testing)."""
-        cls._instance = None
-
-    @property
-    def database(self) -> "Database":
-        """Get the database instance."""
-        if self._database is None:
-            from espanded.core.database import Database
-            self._database = Database()
-        return self._database
-
-    @database.setter
-    def database(self, db: "Database"):
-        """Set the database instance."""
-        self._database = db
-
-    @property
-    def entry_manager(self) -> "EntryManager":
-        """Get the entry manager instance."""
-        if self._entry_manager is None:
-            from espanded.core.entry_manager import EntryManager
-            self._entry_manager = EntryManager(
+        global _app_state
+        _app_state = None
+
+    def __getattr__(self, name: str):
+        """Create a lazily-initialized service on first access."""
+        if name == "database":
+            value = _load_backends().Database()
+        elif name == "entry_manager":
+            value = _load_backends().EntryManager(
                 database=self.database,
                 espanso=self.espanso,
             )
-        return self._entry_manager
-
-    @entry_manager.setter
-    def entry_manager(self, manager: "EntryManager"):
-        """Set the entry manager instance."""
-        self._entry_manager = manager
+        elif name == "espanso":
+            value = _load_backends().EspansoManager()
+        elif name == "theme_manager":
+            # PySide6-backed, so kept out of _load_backends()
+            from espanded.ui.theme import ThemeManager, ThemeSettings
+            theme_settings = ThemeSettings(
+                theme=self.settings.theme,
+                custom_colors=self.settings.custom_colors,
+            )
+            value = ThemeManager(theme_settings)
+        else:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
-    @property
-    def espanso(self) -> "EspansoManager":
-        """Get the Espanso manager instance."""
-        if self._espanso is None:
-            from espanded.core.espanso import EspansoManager
-            self._espanso = EspansoManager()
-        return self._espanso
-
-    @espanso.setter
-    def espanso(self, manager: "EspansoManager"):
-        """Set the Espanso manager instance."""
-        self._espanso = manager
+        object.__setattr__(self, name, value)
+        return value
 
     @property
     def settings(self) -> "Settings":
         """Get the settings instance."""
-        if self._settings is None:
-            self._settings = self.database.get_settings()
-        return self._settings
+        settings = self._settings
+        if settings is None:
+            settings = self._settings = self.database.get_settings()
+        return settings
 
     @settings.setter
     def settings(self, settings: "Settings"):
@@ -92,40 +110,20 @@ class AppState:
         self._settings = settings
         self.database.save_settings(settings)
 
-    @property
-    def theme_manager(self) -> "ThemeManager":
-        """Get the theme manager instance."""
-        if self._theme_manager is None:
-            from espanded.ui.theme import ThemeManager, ThemeSettings
-            theme_settings = ThemeSettings(
-                theme=self.settings.theme,
-                custom_colors=self.settings.custom_colors,
-            )
-            self._theme_manager = ThemeManager(theme_settings)
-        return self._theme_manager
-
-    @theme_manager.setter
-    def theme_manager(self, manager: "ThemeManager"):
-        """Set the theme manager instance."""
-        self._theme_manager = manager
-
-    @property
-    def sync_manager(self) -> "SyncManager | None":
-        """Get the sync manager instance."""
-        return self._sync_manager
-
-    @sync_manager.setter
-    def sync_manager(self, manager: "SyncManager | None"):
-        """Set the sync manager instance."""
-        self._sync_manager = manager
-
     def save_settings(self):
         """Persist current settings to database."""
         if self._settings:
             self.database.save_settings(self._settings)
 
 
-# Convenience function
+# Singleton instance
+_app_state: AppState | None = None
+
+
 def get_app_state() -> AppState:
     """Get the application state singleton."""
-    return AppState.get_instance()
+    global _app_state
+    state = _app_state
+    if state is None:
+        state = _app_state = AppState()
+    return state
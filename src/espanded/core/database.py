@@ -1,17 +1,170 @@
 """SQLite database for storing entries, settings, and history."""
 
 import json
+import queue
 import sqlite3
+import threading
+from collections.abc import Iterator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from espanded.core.models import Entry, Settings, HistoryEntry
 
+# orjson is optional - it encodes/decodes the small JSON columns written on
+# every save several times faster than the stdlib. Both produce plain JSON
+# text, so the json_each() triggers and existing databases are unaffected.
+try:
+    import orjson
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+@lru_cache(maxsize=1024)
+def _parse_str_list(text: str) -> tuple[str, ...]:
+    """Decode a JSON string-array column, cached by its raw text.
+
+    Entries share a handful of tag/app combinations, so the same column
+    text repeats across rows. Returns a tuple so the cached value can't be
+    mutated through an Entry.
+    """
+    return tuple(_loads(text))
+
+
+@lru_cache(maxsize=1024)
+def _dump_str_list(items: tuple[str, ...]) -> str:
+    """Encode a string list column, cached by its contents.
+
+    The inverse of _parse_str_list - saving an entry whose tags or apps
+    match an earlier save reuses the encoded text.
+    """
+    return _dumps(list(items))
+
+
+# Statements run on every call are kept here so each method reuses one
+# string (and the connection's cached prepared statement) instead of
+# rebuilding it inline
+
+_SQL_INSERT_ENTRY = """
+    INSERT OR REPLACE INTO entries
+    (id, trigger, prefix, replacement, tags, word, propagate_case,
+     uppercase_style, regex, case_insensitive, force_clipboard,
+     passive, markdown, cursor_hint, filter_apps, created_at,
+     modified_at, deleted_at, source_file)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_ENTRY = "SELECT * FROM entries WHERE id = ?"
+_SQL_ENTRY_EXISTS = "SELECT 1 FROM entries WHERE id = ? LIMIT 1"
+_SQL_SELECT_ENTRY_TRIGGER = "SELECT prefix || trigger FROM entries WHERE id = ?"
+_SQL_SELECT_ENTRY_CONTENT = "SELECT trigger, replacement, tags FROM entries WHERE id = ?"
+_SQL_SELECT_ALL_ENTRIES = "SELECT * FROM entries ORDER BY modified_at DESC"
+_SQL_SELECT_ACTIVE_ENTRIES = (
+    "SELECT * FROM entries WHERE deleted_at IS NULL ORDER BY modified_at DESC"
+)
+_SQL_SELECT_DELETED_ENTRIES = (
+    "SELECT * FROM entries WHERE deleted_at IS NOT NULL ORDER BY deleted_at DESC"
+)
+_SQL_SOFT_DELETE_ENTRY = (
+    "UPDATE entries SET deleted_at = ? WHERE id = ? RETURNING prefix || trigger"
+)
+_SQL_RESTORE_ENTRY = (
+    "UPDATE entries SET deleted_at = NULL, modified_at = ? WHERE id = ?"
+    " RETURNING prefix || trigger"
+)
+_SQL_DELETE_ENTRY = "DELETE FROM entries WHERE id = ?"
+
+_SQL_UPSERT_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+_SQL_SELECT_SETTINGS = "SELECT key, value FROM settings"
+
+_SQL_INSERT_HISTORY = """
+    INSERT INTO history (id, entry_id, action, timestamp, changes, trigger_name)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_HISTORY = "SELECT * FROM history ORDER BY timestamp DESC LIMIT ?"
+_SQL_SELECT_ALL_HISTORY = "SELECT * FROM history ORDER BY timestamp DESC"
+_SQL_SELECT_ENTRY_HISTORY = (
+    "SELECT * FROM history WHERE entry_id = ? ORDER BY timestamp DESC"
+)
+
+_SQL_TAG_COUNTS = """
+    SELECT entry_tags.tag, COUNT(*) FROM entry_tags
+    JOIN entries ON entries.id = entry_tags.entry_id
+    WHERE entries.deleted_at IS NULL
+    GROUP BY entry_tags.tag
+    ORDER BY entry_tags.tag
+"""
+_SQL_DISTINCT_TAG_COUNT = """
+    SELECT COUNT(DISTINCT entry_tags.tag) FROM entry_tags
+    JOIN entries ON entries.id = entry_tags.entry_id
+    WHERE entries.deleted_at IS NULL
+"""
+_SQL_ENTRY_STATS = """
+    SELECT
+        COALESCE(SUM(deleted_at IS NULL), 0),
+        COALESCE(SUM(deleted_at IS NOT NULL), 0),
+        COALESCE(SUM(deleted_at IS NULL AND date(modified_at) = :today), 0),
+        COALESCE(SUM(deleted_at IS NULL AND date(created_at) = :today), 0),
+        MAX(CASE WHEN deleted_at IS NULL THEN modified_at END)
+    FROM entries
+"""
+
+
+def _entry_to_row(entry: Entry) -> tuple:
+    """Convert an Entry to the parameter tuple for _SQL_INSERT_ENTRY.
+
+    bools are passed as-is - sqlite3 stores them as INTEGER 0/1.
+    """
+    return (
+        entry.id,
+        entry.trigger,
+        entry.prefix,
+        entry.replacement,
+        _dump_str_list(tuple(entry.tags)),
+        entry.word,
+        entry.propagate_case,
+        entry.uppercase_style,
+        entry.regex,
+        entry.case_insensitive,
+        entry.force_clipboard,
+        entry.passive,
+        entry.markdown,
+        entry.cursor_hint,
+        _dump_str_list(tuple(entry.filter_apps)) if entry.filter_apps else None,
+        entry.created_at.isoformat(),
+        entry.modified_at.isoformat(),
+        entry.deleted_at.isoformat() if entry.deleted_at else None,
+        entry.source_file,
+    )
+
+
+def _history_to_row(history: HistoryEntry) -> tuple:
+    """Convert a HistoryEntry to the parameter tuple for _SQL_INSERT_HISTORY."""
+    return (
+        history.id,
+        history.entry_id,
+        history.action,
+        history.timestamp.isoformat(),
+        # Most history rows have no changes - store NULL, not "{}"
+        _dumps(history.changes) if history.changes else None,
+        history.trigger_name,
+    )
+
 
 class Database:
     """SQLite database manager for Espanded."""
 
+    # History rows are queued and written together, once this many are
+    # waiting or HISTORY_FLUSH_DELAY seconds after the first was queued
+    HISTORY_BATCH_SIZE = 50
+    HISTORY_FLUSH_DELAY = 1.0
+
     def __init__(self, db_path: str | Path | None = None):
         """Initialize database connection.
 
@@ -26,14 +179,95 @@ class Database:
             db_path = app_dir / "espanded.db"
 
         self.db_path = Path(db_path)
+        # Single writer connection, shared across threads under _write_lock
         self.conn: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
+        # Idle read-only connections; a private in-memory database can't be
+        # opened twice, so it reads through the writer instead
+        self._readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._pooled_reads = str(self.db_path) != ":memory:"
+        # get_all_tags() result, cleared by every entry write
+        self._tag_counts: dict[str, int] | None = None
+        self._entries_version = 0
+        # Queued add_history() rows and the timer that writes them out
+        self._history_lock = threading.Lock()
+        self._history_buffer: list[HistoryEntry] = []
+        self._history_timer: threading.Timer | None = None
         self._connect()
         self._create_tables()
 
     def _connect(self):
         """Create database connection."""
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = self._open_connection()
+
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection with the shared pragmas applied.
+
+        Args:
+            read_only: Open a query_only reader for the read pool.
+        """
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        else:
+            # WAL lets readers run alongside a writer, and with
+            # synchronous=NORMAL a commit no longer fsyncs a rollback journal
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # INSERT OR REPLACE only fires the delete triggers that keep
+            # entries_fts and entry_tags in sync when recursive triggers are on
+            conn.execute("PRAGMA recursive_triggers=ON")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")  # ~20 MB
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _read(self, sql: str, params: Any = ()) -> list[sqlite3.Row]:
+        """Run a query on a pooled read-only connection.
+
+        Readers don't wait on _write_lock, and in WAL mode they see the last
+        committed state while a write is in progress.
+        """
+        if not self._pooled_reads:
+            with self._write_lock:
+                return self.conn.execute(sql, params).fetchall()
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection(read_only=True)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            self._readers.put(conn)
+
+    def _iter(self, sql: str, params: Any = ()) -> Iterator[sqlite3.Row]:
+        """Yield rows of a query as they are stepped, holding one pooled reader.
+
+        The reader returns to the pool once the generator is exhausted or
+        closed.
+        """
+        if not self._pooled_reads:
+            # Don't hold the write lock across yields
+            yield from self._read(sql, params)
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection(read_only=True)
+        try:
+            yield from conn.execute(sql, params)
+        finally:
+            self._readers.put(conn)
+
+    def _entries_changed(self):
+        """Invalidate caches derived from the entries table."""
+        self._entries_version += 1
+        self._tag_counts = None
 
     def _create_tables(self):
         """Create database tables if they don't exist."""
@@ -64,6 +298,17 @@ class Database:
             )
         """)
 
+        # Tags table - one row per (entry, tag), kept in sync by triggers
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'entry_tags'")
+        tags_table_exists = cursor.fetchone() is not None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS entry_tags (
+                entry_id TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (entry_id, tag)
+            )
+        """)
+
         # Settings table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS settings (
@@ -86,141 +331,301 @@ class Database:
 
         # Create indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_entries_trigger ON entries(trigger)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entries_deleted ON entries(deleted_at)")
+        # Partial indexes matching the list queries, so the active list and
+        # the trash are index scans already in ORDER BY order (no sort step)
+        cursor.execute("DROP INDEX IF EXISTS idx_entries_deleted")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entries_active_modified
+            ON entries(modified_at DESC) WHERE deleted_at IS NULL
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entries_trash
+            ON entries(deleted_at DESC) WHERE deleted_at IS NOT NULL
+        """)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_entry ON history(entry_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history(timestamp)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tags_tag ON entry_tags(tag)")
+
+        self._create_tag_triggers(cursor)
+        if not tags_table_exists:
+            # Fill from the JSON column of entries saved before the table existed
+            cursor.execute("""
+                INSERT OR IGNORE INTO entry_tags (entry_id, tag)
+                SELECT entries.id, json_each.value FROM entries, json_each(entries.tags)
+            """)
+
+        self._fts_enabled = self._create_fts(cursor)
 
         self.conn.commit()
 
+    def _create_tag_triggers(self, cursor: sqlite3.Cursor):
+        """Create the triggers mirroring entries.tags into entry_tags."""
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS entry_tags_insert AFTER INSERT ON entries BEGIN
+                INSERT OR IGNORE INTO entry_tags (entry_id, tag)
+                SELECT new.id, value FROM json_each(new.tags);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS entry_tags_delete AFTER DELETE ON entries BEGIN
+                DELETE FROM entry_tags WHERE entry_id = old.id;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS entry_tags_update AFTER UPDATE OF tags ON entries BEGIN
+                DELETE FROM entry_tags WHERE entry_id = old.id;
+                INSERT OR IGNORE INTO entry_tags (entry_id, tag)
+                SELECT new.id, value FROM json_each(new.tags);
+            END
+        """)
+
+    def _create_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """Create the entries_fts full-text index and the triggers syncing it.
+
+        Uses the trigram tokenizer so MATCH keeps the substring semantics of
+        the old LIKE search.
+
+        Returns:
+            True if the index is available, False if this SQLite build lacks
+            FTS5 (search then falls back to LIKE)
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'entries_fts'")
+        exists = cursor.fetchone() is not None
+
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+                    trigger, replacement,
+                    content='entries', content_rowid='rowid',
+                    tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS entries_fts_insert AFTER INSERT ON entries BEGIN
+                INSERT INTO entries_fts (rowid, trigger, replacement)
+                VALUES (new.rowid, new.trigger, new.replacement);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS entries_fts_delete AFTER DELETE ON entries BEGIN
+                INSERT INTO entries_fts (entries_fts, rowid, trigger, replacement)
+                VALUES ('delete', old.rowid, old.trigger, old.replacement);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS entries_fts_update
+            AFTER UPDATE OF trigger, replacement ON entries BEGIN
+                INSERT INTO entries_fts (entries_fts, rowid, trigger, replacement)
+                VALUES ('delete', old.rowid, old.trigger, old.replacement);
+                INSERT INTO entries_fts (rowid, trigger, replacement)
+                VALUES (new.rowid, new.trigger, new.replacement);
+            END
+        """)
+
+        # Index entries saved before the table existed
+        if not exists:
+            cursor.execute("INSERT INTO entries_fts (entries_fts) VALUES ('rebuild')")
+        return True
+
     def close(self):
         """Close database connection."""
+        self.flush_history()
         if self.conn:
             self.conn.close()
             self.conn = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
 
     # Entry CRUD operations
 
-    def save_entry(self, entry: Entry) -> Entry:
-        """Save an entry to the database."""
-        cursor = self.conn.cursor()
-
-        entry.modified_at = datetime.now()
+    def save_entry(self, entry: Entry, modified_at: datetime | None = None) -> Entry:
+        """Save an entry to the database.
 
-        cursor.execute("""
-            INSERT OR REPLACE INTO entries
-            (id, trigger, prefix, replacement, tags, word, propagate_case,
-             uppercase_style, regex, case_insensitive, force_clipboard,
-             passive, markdown, cursor_hint, filter_apps, created_at,
-             modified_at, deleted_at, source_file)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            entry.id,
-            entry.trigger,
-            entry.prefix,
-            entry.replacement,
-            json.dumps(entry.tags),
-            int(entry.word),
-            int(entry.propagate_case),
-            entry.uppercase_style,
-            int(entry.regex),
-            int(entry.case_insensitive),
-            int(entry.force_clipboard),
-            int(entry.passive),
-            int(entry.markdown),
-            entry.cursor_hint,
-            json.dumps(entry.filter_apps) if entry.filter_apps else None,
-            entry.created_at.isoformat(),
-            entry.modified_at.isoformat(),
-            entry.deleted_at.isoformat() if entry.deleted_at else None,
-            entry.source_file,
-        ))
+        Args:
+            entry: Entry to insert or replace.
+            modified_at: Modification time to stamp; defaults to now.
+        """
+        entry.modified_at = modified_at or datetime.now()
 
-        self.conn.commit()
+        with self._write_lock:
+            self.conn.execute(_SQL_INSERT_ENTRY, _entry_to_row(entry))
+            self.conn.commit()
+            self._entries_changed()
         return entry
 
+    def save_entries(
+        self, entries: list[Entry], modified_at: datetime | None = None
+    ) -> list[Entry]:
+        """Save many entries in a single transaction.
+
+        Args:
+            entries: Entries to insert or replace.
+            modified_at: Modification time to stamp; defaults to now.
+
+        Returns:
+            The saved entries.
+        """
+        now = modified_at or datetime.now()
+        for entry in entries:
+            entry.modified_at = now
+
+        params = [_entry_to_row(entry) for entry in entries]
+        with self._write_lock:
+            with self.conn:
+                self.conn.executemany(_SQL_INSERT_ENTRY, params)
+            # Invalidate only once committed, so readers can't cache the
+            # old rows under the new version
+            self._entries_changed()
+        return entries
+
     def get_entry(self, entry_id: str) -> Entry | None:
         """Get an entry by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM entries WHERE id = ?", (entry_id,))
-        row = cursor.fetchone()
+        rows = self._read(_SQL_SELECT_ENTRY, (entry_id,))
+
+        if rows:
+            return self._row_to_entry(rows[0])
+        return None
+
+    def entry_exists(self, entry_id: str) -> bool:
+        """Check whether an entry exists (active or in trash)."""
+        return bool(self._read(_SQL_ENTRY_EXISTS, (entry_id,)))
 
-        if row:
-            return self._row_to_entry(row)
+    def get_entry_trigger(self, entry_id: str) -> str | None:
+        """Get an entry's full trigger (prefix + trigger) without loading it."""
+        rows = self._read(_SQL_SELECT_ENTRY_TRIGGER, (entry_id,))
+        return rows[0][0] if rows else None
+
+    def get_entry_content(self, entry_id: str) -> tuple[str, str, list[str]] | None:
+        """Get an entry's trigger, replacement and tags without loading it.
+
+        Returns:
+            Tuple of (trigger, replacement, tags), or None if not found.
+        """
+        rows = self._read(_SQL_SELECT_ENTRY_CONTENT, (entry_id,))
+        if rows:
+            row = rows[0]
+            return row["trigger"], row["replacement"], list(_parse_str_list(row["tags"]))
         return None
 
     def get_all_entries(self, include_deleted: bool = False) -> list[Entry]:
         """Get all entries."""
-        cursor = self.conn.cursor()
+        rows = self._read(
+            _SQL_SELECT_ALL_ENTRIES if include_deleted else _SQL_SELECT_ACTIVE_ENTRIES
+        )
 
-        if include_deleted:
-            cursor.execute("SELECT * FROM entries ORDER BY modified_at DESC")
-        else:
-            cursor.execute(
-                "SELECT * FROM entries WHERE deleted_at IS NULL ORDER BY modified_at DESC"
-            )
+        return [self._row_to_entry(row) for row in rows]
 
-        return [self._row_to_entry(row) for row in cursor.fetchall()]
+    def iter_entries(self, include_deleted: bool = False) -> Iterator[Entry]:
+        """Iterate over entries without loading them all at once.
+
+        Same order as get_all_entries(). Close or exhaust the iterator to
+        release its connection.
+        """
+        sql = _SQL_SELECT_ALL_ENTRIES if include_deleted else _SQL_SELECT_ACTIVE_ENTRIES
+        for row in self._iter(sql):
+            yield self._row_to_entry(row)
 
     def get_deleted_entries(self) -> list[Entry]:
         """Get all soft-deleted entries (trash)."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM entries WHERE deleted_at IS NOT NULL ORDER BY deleted_at DESC"
-        )
-        return [self._row_to_entry(row) for row in cursor.fetchall()]
+        rows = self._read(_SQL_SELECT_DELETED_ENTRIES)
+        return [self._row_to_entry(row) for row in rows]
 
     def search_entries(self, query: str, tags: list[str] | None = None) -> list[Entry]:
-        """Search entries by trigger or replacement text."""
-        cursor = self.conn.cursor()
+        """Search entries by trigger or replacement text and/or tags.
 
-        sql = """
-            SELECT * FROM entries
-            WHERE deleted_at IS NULL
-            AND (trigger LIKE ? OR replacement LIKE ?)
-        """
-        params: list[Any] = [f"%{query}%", f"%{query}%"]
+        Args:
+            query: Search text; empty to match every entry.
+            tags: Tags to filter by (any match).
 
-        cursor.execute(sql, params)
-        entries = [self._row_to_entry(row) for row in cursor.fetchall()]
+        Returns:
+            Matching active entries, most recently modified first.
+        """
+        sql = "SELECT entries.* FROM entries"
+        where = ["entries.deleted_at IS NULL"]
+        params: list[Any] = []
+
+        # Trigrams need at least three characters; shorter queries scan
+        if self._fts_enabled and len(query) >= 3:
+            sql += " JOIN entries_fts ON entries_fts.rowid = entries.rowid"
+            where.append("entries_fts MATCH ?")
+            # Quote as a single phrase so FTS5 operators in the input are literal
+            params.append('"' + query.replace('"', '""') + '"')
+        elif query:
+            where.append("(entries.trigger LIKE ? OR entries.replacement LIKE ?)")
+            params += [f"%{query}%", f"%{query}%"]
 
-        # Filter by tags in Python (simpler than JSON parsing in SQL)
         if tags:
-            entries = [e for e in entries if any(t in e.tags for t in tags)]
+            placeholders = ", ".join("?" * len(tags))
+            where.append(
+                "EXISTS (SELECT 1 FROM entry_tags WHERE entry_tags.entry_id = entries.id"
+                f" AND entry_tags.tag IN ({placeholders}))"
+            )
+            params += tags
 
-        return entries
+        sql += " WHERE " + " AND ".join(where) + " ORDER BY entries.modified_at DESC"
+        return [self._row_to_entry(row) for row in self._read(sql, params)]
 
-    def soft_delete_entry(self, entry_id: str) -> bool:
-        """Soft delete an entry (move to trash)."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "UPDATE entries SET deleted_at = ? WHERE id = ?",
-            (datetime.now().isoformat(), entry_id)
-        )
-        self.conn.commit()
-        return cursor.rowcount > 0
+    def soft_delete_entry(
+        self, entry_id: str, deleted_at: datetime | None = None
+    ) -> str | None:
+        """Soft delete an entry (move to trash).
 
-    def restore_entry(self, entry_id: str) -> bool:
-        """Restore a soft-deleted entry from trash."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "UPDATE entries SET deleted_at = NULL, modified_at = ? WHERE id = ?",
-            (datetime.now().isoformat(), entry_id)
-        )
-        self.conn.commit()
-        return cursor.rowcount > 0
+        Args:
+            entry_id: ID of entry to delete.
+            deleted_at: Deletion time to stamp; defaults to now.
+
+        Returns:
+            The entry's full trigger, or None if not found.
+        """
+        with self._write_lock:
+            row = self.conn.execute(
+                _SQL_SOFT_DELETE_ENTRY,
+                ((deleted_at or datetime.now()).isoformat(), entry_id),
+            ).fetchone()
+            self.conn.commit()
+            self._entries_changed()
+        return row[0] if row else None
+
+    def restore_entry(
+        self, entry_id: str, modified_at: datetime | None = None
+    ) -> str | None:
+        """Restore a soft-deleted entry from trash.
+
+        Args:
+            entry_id: ID of entry to restore.
+            modified_at: Modification time to stamp; defaults to now.
+
+        Returns:
+            The entry's full trigger, or None if not found.
+        """
+        with self._write_lock:
+            row = self.conn.execute(
+                _SQL_RESTORE_ENTRY,
+                ((modified_at or datetime.now()).isoformat(), entry_id),
+            ).fetchone()
+            self.conn.commit()
+            self._entries_changed()
+        return row[0] if row else None
 
     def permanent_delete_entry(self, entry_id: str) -> bool:
         """Permanently delete an entry."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
-        self.conn.commit()
+        with self._write_lock:
+            cursor = self.conn.execute(_SQL_DELETE_ENTRY, (entry_id,))
+            self.conn.commit()
+            self._entries_changed()
         return cursor.rowcount > 0
 
     def _row_to_entry(self, row: sqlite3.Row) -> Entry:
         """Convert a database row to an Entry object."""
         filter_apps = None
         if row["filter_apps"]:
-            filter_apps = json.loads(row["filter_apps"])
+            filter_apps = list(_parse_str_list(row["filter_apps"]))
 
         deleted_at = None
         if row["deleted_at"]:
@@ -231,7 +636,9 @@ class Database:
             trigger=row["trigger"],
             prefix=row["prefix"],
             replacement=row["replacement"],
-            tags=json.loads(row["tags"]),
+            tags=list(_parse_str_list(row["tags"])),
+            # Flags come back as 0/1 ints; cast so Entry keeps its declared
+            # bool fields for the UI and sync code
             word=bool(row["word"]),
             propagate_case=bool(row["propagate_case"]),
             uppercase_style=row["uppercase_style"],
@@ -252,25 +659,16 @@ class Database:
 
     def save_settings(self, settings: Settings):
         """Save settings to database."""
-        cursor = self.conn.cursor()
-        settings_dict = settings.to_dict()
-
-        for key, value in settings_dict.items():
-            cursor.execute(
-                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-                (key, json.dumps(value))
-            )
+        params = [(key, _dumps(value)) for key, value in settings.to_dict().items()]
 
-        self.conn.commit()
+        with self._write_lock, self.conn:
+            self.conn.executemany(_SQL_UPSERT_SETTING, params)
 
     def get_settings(self) -> Settings:
         """Get settings from database."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT key, value FROM settings")
-
         settings_dict = {}
-        for row in cursor.fetchall():
-            settings_dict[row["key"]] = json.loads(row["value"])
+        for row in self._read(_SQL_SELECT_SETTINGS):
+            settings_dict[row["key"]] = _loads(row["value"])
 
         if settings_dict:
             return Settings.from_dict(settings_dict)
@@ -279,39 +677,56 @@ class Database:
     # History operations
 
     def add_history(self, history: HistoryEntry):
-        """Add a history entry."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO history (id, entry_id, action, timestamp, changes, trigger_name)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            history.id,
-            history.entry_id,
-            history.action,
-            history.timestamp.isoformat(),
-            json.dumps(history.changes),
-            history.trigger_name,
-        ))
-        self.conn.commit()
+        """Queue a history entry to be written with the next batch.
+
+        The history getters flush first, so queued rows are never missed.
+        """
+        with self._history_lock:
+            self._history_buffer.append(history)
+            full = len(self._history_buffer) >= self.HISTORY_BATCH_SIZE
+            if not full and self._history_timer is None:
+                self._history_timer = threading.Timer(
+                    self.HISTORY_FLUSH_DELAY, self.flush_history
+                )
+                self._history_timer.daemon = True
+                self._history_timer.start()
+        if full:
+            self.flush_history()
+
+    def flush_history(self):
+        """Write queued history entries now in a single transaction."""
+        with self._history_lock:
+            histories, self._history_buffer = self._history_buffer, []
+            timer, self._history_timer = self._history_timer, None
+        if timer is not None:
+            timer.cancel()
+        if histories and self.conn:
+            self.add_history_many(histories)
+
+    def add_history_many(self, histories: list[HistoryEntry]):
+        """Add many history entries in a single transaction."""
+        params = [_history_to_row(history) for history in histories]
+        with self._write_lock, self.conn:
+            self.conn.executemany(_SQL_INSERT_HISTORY, params)
 
     def get_history(self, limit: int = 100) -> list[HistoryEntry]:
         """Get recent history entries."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM history ORDER BY timestamp DESC LIMIT ?",
-            (limit,)
-        )
+        self.flush_history()
+        rows = self._read(_SQL_SELECT_HISTORY, (limit,))
+
+        return [self._row_to_history(row) for row in rows]
 
-        return [self._row_to_history(row) for row in cursor.fetchall()]
+    def iter_history(self) -> Iterator[HistoryEntry]:
+        """Iterate over all history entries, newest first, without loading them all."""
+        self.flush_history()
+        for row in self._iter(_SQL_SELECT_ALL_HISTORY):
+            yield self._row_to_history(row)
 
     def get_entry_history(self, entry_id: str) -> list[HistoryEntry]:
         """Get history for a specific entry."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM history WHERE entry_id = ? ORDER BY timestamp DESC",
-            (entry_id,)
-        )
-        return [self._row_to_history(row) for row in cursor.fetchall()]
+        self.flush_history()
+        rows = self._read(_SQL_SELECT_ENTRY_HISTORY, (entry_id,))
+        return [self._row_to_history(row) for row in rows]
 
     def _row_to_history(self, row: sqlite3.Row) -> HistoryEntry:
         """Convert a database row to a HistoryEntry object."""
@@ -320,7 +735,7 @@ class Database:
             entry_id=row["entry_id"],
             action=row["action"],
             timestamp=datetime.fromisoformat(row["timestamp"]),
-            changes=json.loads(row["changes"]),
+            changes=_loads(row["changes"]) if row["changes"] else {},
             trigger_name=row["trigger_name"],
         )
 
@@ -328,49 +743,39 @@ class Database:
 
     def get_all_tags(self) -> dict[str, int]:
         """Get all unique tags with their counts."""
-        entries = self.get_all_entries()
-        tag_counts: dict[str, int] = {}
-
-        for entry in entries:
-            for tag in entry.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-        return tag_counts
+        tag_counts = self._tag_counts
+        if tag_counts is None:
+            version = self._entries_version
+            tag_counts = {tag: count for tag, count in self._read(_SQL_TAG_COUNTS)}
+            # Don't cache counts a concurrent write has already made stale;
+            # writers bump the version under _write_lock, so check and store
+            # under it too
+            with self._write_lock:
+                if version == self._entries_version:
+                    self._tag_counts = tag_counts
+        # Copy so callers can't modify the cached counts
+        return dict(tag_counts)
 
     # Statistics
 
     def get_stats(self) -> dict[str, Any]:
         """Get database statistics."""
-        cursor = self.conn.cursor()
-
-        # Total entries
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE deleted_at IS NULL")
-        total_entries = cursor.fetchone()[0]
-
-        # Deleted entries
-        cursor.execute("SELECT COUNT(*) FROM entries WHERE deleted_at IS NOT NULL")
-        deleted_entries = cursor.fetchone()[0]
-
-        # Entries modified today
+        # Entry counts and last modified time in one pass over the table
         today = datetime.now().date().isoformat()
-        cursor.execute(
-            "SELECT COUNT(*) FROM entries WHERE deleted_at IS NULL AND date(modified_at) = ?",
-            (today,)
-        )
-        modified_today = cursor.fetchone()[0]
-
-        # Entries created today
-        cursor.execute(
-            "SELECT COUNT(*) FROM entries WHERE deleted_at IS NULL AND date(created_at) = ?",
-            (today,)
-        )
-        created_today = cursor.fetchone()[0]
-
-        # Last modified
-        cursor.execute(
-            "SELECT MAX(modified_at) FROM entries WHERE deleted_at IS NULL"
-        )
-        last_modified = cursor.fetchone()[0]
+        (
+            total_entries,
+            deleted_entries,
+            modified_today,
+            created_today,
+            last_modified,
+        ) = self._read(_SQL_ENTRY_STATS, {"today": today})[0]
+
+        # Distinct tags
+        tag_counts = self._tag_counts
+        if tag_counts is not None:
+            tag_count = len(tag_counts)
+        else:
+            tag_count = self._read(_SQL_DISTINCT_TAG_COUNT)[0][0]
 
         return {
             "total_entries": total_entries,
@@ -378,5 +783,5 @@ class Database:
             "modified_today": modified_today,
             "created_today": created_today,
             "last_modified": last_modified,
-            "tag_count": len(self.get_all_tags()),
+            "tag_count": tag_count,
         }
@@ -1,5 +1,7 @@
 """Entry manager - business logic for entry CRUD operations."""
 
+import threading
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Callable
 
@@ -9,9 +11,21 @@ from espanded.core.yaml_handler import YAMLHandler
 from espanded.core.espanso import EspansoManager
 
 
+def _safe_call(callback: Callable[[], None]):
+    """Call a change listener, ignoring its errors."""
+    try:
+        callback()
+    except Exception:
+        pass  # Don't let callback errors break the flow
+
+
 class EntryManager:
     """Manages entry CRUD operations with database and Espanso sync."""
 
+    # Seconds to wait before writing Espanso files after a mutation, so
+    # back-to-back mutations share one rewrite and reload
+    SYNC_DELAY = 0.2
+
     def __init__(
         self,
         database: Database | None = None,
@@ -27,25 +41,36 @@ class EntryManager:
         self.espanso = espanso or EspansoManager()
         self.yaml_handler = YAMLHandler()
 
-        # Callbacks for UI updates
-        self._on_entries_changed: list[Callable[[], None]] = []
+        # Callbacks for UI updates; replaced rather than mutated, so
+        # _notify_change can iterate it without taking a copy
+        self._on_entries_changed: tuple[Callable[[], None], ...] = ()
+
+        # Pending debounced Espanso sync
+        self._sync_lock = threading.Lock()
+        self._sync_timer: threading.Timer | None = None
+        # Held for a whole sync, so syncs from timers, flush_sync() and
+        # exports never write match files or reload Espanso at once
+        self._sync_run_lock = threading.Lock()
+
+        # Content hash of each match file as last written by _sync_to_espanso;
+        # only touched under _sync_run_lock
+        self._file_hashes: dict[str, int] = {}
 
     def add_change_listener(self, callback: Callable[[], None]):
         """Add a callback to be called when entries change."""
-        self._on_entries_changed.append(callback)
+        self._on_entries_changed += (callback,)
 
     def remove_change_listener(self, callback: Callable[[], None]):
         """Remove a change listener."""
-        if callback in self._on_entries_changed:
-            self._on_entries_changed.remove(callback)
+        listeners = self._on_entries_changed
+        if callback in listeners:
+            i = listeners.index(callback)
+            self._on_entries_changed = listeners[:i] + listeners[i + 1:]
 
     def _notify_change(self):
         """Notify all listeners that entries have changed."""
         for callback in self._on_entries_changed:
-            try:
-                callback()
-            except Exception:
-                pass  # Don't let callback errors break the flow
+            _safe_call(callback)
 
     # CRUD Operations
 
@@ -58,20 +83,22 @@ class EntryManager:
         Returns:
             Created entry with generated ID.
         """
-        entry.created_at = datetime.now()
-        entry.modified_at = datetime.now()
+        # One timestamp for the entry and its history row
+        now = datetime.now()
+        entry.created_at = entry.modified_at = now
 
-        saved_entry = self.db.save_entry(entry)
+        saved_entry = self.db.save_entry(entry, modified_at=now)
 
         # Log history
         self.db.add_history(HistoryEntry(
             entry_id=saved_entry.id,
             action="created",
+            timestamp=now,
             trigger_name=saved_entry.full_trigger,
         ))
 
         # Sync to Espanso
-        self._sync_to_espanso()
+        self._schedule_sync()
         self._notify_change()
 
         return saved_entry
@@ -85,31 +112,33 @@ class EntryManager:
         Returns:
             Updated entry.
         """
-        # Get old entry for history
-        old_entry = self.db.get_entry(entry.id)
+        # Get old values for history
+        old_content = self.db.get_entry_content(entry.id)
 
-        entry.modified_at = datetime.now()
-        saved_entry = self.db.save_entry(entry)
+        now = datetime.now()
+        saved_entry = self.db.save_entry(entry, modified_at=now)
 
         # Log history with changes
         changes = {}
-        if old_entry:
-            if old_entry.trigger != entry.trigger:
-                changes["trigger"] = {"old": old_entry.trigger, "new": entry.trigger}
-            if old_entry.replacement != entry.replacement:
-                changes["replacement"] = {"old": old_entry.replacement[:50], "new": entry.replacement[:50]}
-            if old_entry.tags != entry.tags:
-                changes["tags"] = {"old": old_entry.tags, "new": entry.tags}
+        if old_content:
+            old_trigger, old_replacement, old_tags = old_content
+            if old_trigger != entry.trigger:
+                changes["trigger"] = {"old": old_trigger, "new": entry.trigger}
+            if old_replacement != entry.replacement:
+                changes["replacement"] = {"old": old_replacement[:50], "new": entry.replacement[:50]}
+            if old_tags != entry.tags:
+                changes["tags"] = {"old": old_tags, "new": entry.tags}
 
         self.db.add_history(HistoryEntry(
             entry_id=saved_entry.id,
             action="modified",
+            timestamp=now,
             trigger_name=saved_entry.full_trigger,
             changes=changes,
         ))
 
         # Sync to Espanso
-        self._sync_to_espanso()
+        self._schedule_sync()
         self._notify_change()
 
         return saved_entry
@@ -123,8 +152,7 @@ class EntryManager:
         Returns:
             Saved entry.
         """
-        existing = self.db.get_entry(entry.id) if entry.id else None
-        if existing:
+        if entry.id and self.db.entry_exists(entry.id):
             return self.update_entry(entry)
         return self.create_entry(entry)
 
@@ -137,25 +165,24 @@ class EntryManager:
         Returns:
             True if deleted, False if not found.
         """
-        entry = self.db.get_entry(entry_id)
-        if not entry:
+        now = datetime.now()
+        trigger_name = self.db.soft_delete_entry(entry_id, deleted_at=now)
+        if trigger_name is None:
             return False
 
-        result = self.db.soft_delete_entry(entry_id)
+        # Log history
+        self.db.add_history(HistoryEntry(
+            entry_id=entry_id,
+            action="deleted",
+            timestamp=now,
+            trigger_name=trigger_name,
+        ))
 
-        if result:
-            # Log history
-            self.db.add_history(HistoryEntry(
-                entry_id=entry_id,
-                action="deleted",
-                trigger_name=entry.full_trigger,
-            ))
-
-            # Sync to Espanso
-            self._sync_to_espanso()
-            self._notify_change()
+        # Sync to Espanso
+        self._schedule_sync()
+        self._notify_change()
 
-        return result
+        return True
 
     def restore_entry(self, entry_id: str) -> bool:
         """Restore a deleted entry from trash.
@@ -166,25 +193,24 @@ class EntryManager:
         Returns:
             True if restored, False if not found.
         """
-        entry = self.db.get_entry(entry_id)
-        if not entry:
+        now = datetime.now()
+        trigger_name = self.db.restore_entry(entry_id, modified_at=now)
+        if trigger_name is None:
             return False
 
-        result = self.db.restore_entry(entry_id)
+        # Log history
+        self.db.add_history(HistoryEntry(
+            entry_id=entry_id,
+            action="restored",
+            timestamp=now,
+            trigger_name=trigger_name,
+        ))
 
-        if result:
-            # Log history
-            self.db.add_history(HistoryEntry(
-                entry_id=entry_id,
-                action="restored",
-                trigger_name=entry.full_trigger,
-            ))
-
-            # Sync to Espanso
-            self._sync_to_espanso()
-            self._notify_change()
+        # Sync to Espanso
+        self._schedule_sync()
+        self._notify_change()
 
-        return result
+        return True
 
     def permanent_delete(self, entry_id: str) -> bool:
         """Permanently delete an entry.
@@ -245,6 +271,14 @@ class EntryManager:
         """Get all active entries."""
         return self.db.get_all_entries(include_deleted=False)
 
+    def iter_entries(self) -> Iterator[Entry]:
+        """Iterate over active entries without loading them all at once.
+
+        Same order as get_all_entries(). Close or exhaust the iterator to
+        release its database connection.
+        """
+        return self.db.iter_entries(include_deleted=False)
+
     def get_deleted_entries(self) -> list[Entry]:
         """Get all deleted entries (trash)."""
         return self.db.get_deleted_entries()
@@ -263,14 +297,9 @@ class EntryManager:
         Returns:
             List of matching entries.
         """
-        if query:
-            entries = self.db.search_entries(query, tags)
-        else:
-            entries = self.db.get_all_entries()
-            if tags:
-                entries = [e for e in entries if any(t in e.tags for t in tags)]
-
-        return entries
+        if query or tags:
+            return self.db.search_entries(query, tags)
+        return self.db.get_all_entries()
 
     def get_all_tags(self) -> dict[str, int]:
         """Get all unique tags with counts."""
@@ -282,28 +311,78 @@ class EntryManager:
 
     # Espanso Sync
 
-    def _sync_to_espanso(self):
-        """Sync all entries to Espanso configuration files."""
-        if not self.espanso.exists():
-            return
+    def _schedule_sync(self):
+        """Sync to Espanso after SYNC_DELAY, coalescing repeated calls."""
+        with self._sync_lock:
+            if self._sync_timer is not None:
+                return
+            self._sync_timer = threading.Timer(self.SYNC_DELAY, self.flush_sync)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+
+    def _cancel_sync(self) -> bool:
+        """Cancel the pending Espanso sync.
+
+        Returns:
+            True if a sync was pending.
+        """
+        with self._sync_lock:
+            timer, self._sync_timer = self._sync_timer, None
+        if timer is None:
+            return False
+        timer.cancel()
+        return True
+
+    def flush_sync(self):
+        """Run a pending Espanso sync now instead of waiting for its timer.
+
+        Also waits for a sync already running on a timer thread, so nothing
+        is left mid-write when this returns.
+        """
+        with self._sync_run_lock:
+            pending = self._cancel_sync()
+        if pending:
+            self._sync_to_espanso()
 
-        # Group entries by source file
-        entries = self.get_all_entries()
-        by_file: dict[str, list[Entry]] = {}
+    def _sync_to_espanso(self, rewrite_all: bool = False):
+        """Sync all entries to Espanso configuration files.
 
-        for entry in entries:
-            file_name = entry.source_file or "base.yml"
-            if file_name not in by_file:
-                by_file[file_name] = []
-            by_file[file_name].append(entry)
+        Args:
+            rewrite_all: Rewrite every file, even ones unchanged since the last sync
+        """
+        with self._sync_run_lock:
+            if rewrite_all:
+                self._file_hashes.clear()
+            if not self.espanso.exists():
+                return
 
-        # Write each file
-        for file_name, file_entries in by_file.items():
-            file_path = self.espanso.match_dir / file_name
-            self.yaml_handler.write_match_file(file_path, file_entries)
+            # Group entries by source file
+            entries = self.get_all_entries()
+            by_file: dict[str, list[Entry]] = {}
 
-        # Reload Espanso
-        self.espanso.reload()
+            for entry in entries:
+                file_name = entry.source_file or "base.yml"
+                if file_name not in by_file:
+                    by_file[file_name] = []
+                by_file[file_name].append(entry)
+
+            # Write only the files whose entries changed since the last sync
+            written = False
+            for file_name, file_entries in by_file.items():
+                file_hash = hash(tuple(
+                    (e.id, e.trigger, e.replacement, e.modified_at) for e in file_entries
+                ))
+                if self._file_hashes.get(file_name) == file_hash:
+                    continue
+
+                file_path = self.espanso.match_dir / file_name
+                self.yaml_handler.write_match_file(file_path, file_entries)
+                self._file_hashes[file_name] = file_hash
+                written = True
+
+            # Reload Espanso
+            if written:
+                self.espanso.reload()
 
     def import_from_espanso(self, clear_existing: bool = False) -> int:
         """Import entries from existing Espanso configuration.
@@ -323,18 +402,17 @@ class EntryManager:
             for entry in all_existing:
                 self.db.permanent_delete_entry(entry.id)
 
+        # read_match_file already sets each entry's source_file to its file name
         all_entries = self.yaml_handler.read_all_match_files(self.espanso.config_path)
-        count = 0
+        imported = [entry for entries in all_entries.values() for entry in entries]
 
-        for file_name, entries in all_entries.items():
-            for entry in entries:
-                entry.source_file = file_name
-                self.db.save_entry(entry)
-                count += 1
+        # One transaction for the whole import
+        self.db.save_entries(imported)
 
         self._notify_change()
-        return count
+        return len(imported)
 
     def export_to_espanso(self):
         """Export all entries to Espanso configuration."""
-        self._sync_to_espanso()
+        self._cancel_sync()
+        self._sync_to_espanso(rewrite_all=True)
@@ -2,13 +2,27 @@
 
 import os
 import platform
+import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from espanded.core.yaml_handler import YAMLHandler
+
+# The OS can't change while the app runs
+_SYSTEM = platform.system()
 
 
 class EspansoManager:
     """Manages Espanso integration - paths, restart, and configuration."""
 
+    # Seconds a CLI probe result is reused before espanso is run again
+    PROBE_TTL = 2.0
+
     def __init__(self, config_path: str | Path | None = None):
         """Initialize Espanso manager.
 
@@ -16,31 +30,47 @@ class EspansoManager:
             config_path: Override config path. If None, auto-detects.
         """
         self._config_path = Path(config_path) if config_path else None
-        self._system = platform.system()
+        # (monotonic time, probe result) from the last _probe()
+        self._probe_cache: tuple[float, dict] | None = None
+        # (match_dir st_mtime_ns, sorted match files) from get_match_files()
+        self._match_files_cache: tuple[int, list[Path]] | None = None
 
-    @property
+    @cached_property
+    def yaml_handler(self) -> "YAMLHandler":
+        """YAML handler for counting matches, kept so its parse cache lasts."""
+        from espanded.core.yaml_handler import YAMLHandler
+
+        return YAMLHandler()
+
+    @cached_property
     def config_path(self) -> Path:
-        """Get Espanso configuration directory path."""
+        """Get Espanso configuration directory path.
+
+        Resolved once; use set_config_path() to change it.
+        """
         if self._config_path:
             return self._config_path
 
         return self._detect_config_path()
 
-    @config_path.setter
-    def config_path(self, path: str | Path):
-        """Set custom config path."""
-        self._config_path = Path(path)
+    def set_config_path(self, path: str | Path | None):
+        """Set a custom config path, or None to auto-detect again."""
+        self._config_path = Path(path) if path else None
+        # Drop the cached paths derived from the old value
+        for name in ("config_path", "match_dir", "config_file"):
+            self.__dict__.pop(name, None)
+        self._match_files_cache = None
 
     def _detect_config_path(self) -> Path:
         """Detect Espanso config path based on operating system."""
-        if self._system == "Windows":
+        if _SYSTEM == "Windows":
             # Windows: %APPDATA%\espanso
             appdata = os.environ.get("APPDATA", "")
             if appdata:
                 return Path(appdata) / "espanso"
             return Path.home() / "AppData" / "Roaming" / "espanso"
 
-        elif self._system == "Darwin":
+        elif _SYSTEM == "Darwin":
             # macOS: ~/Library/Application Support/espanso
             return Path.home() / "Library" / "Application Support" / "espanso"
 
@@ -51,12 +81,12 @@ class EspansoManager:
                 return Path(xdg_config) / "espanso"
             return Path.home() / ".config" / "espanso"
 
-    @property
+    @cached_property
     def match_dir(self) -> Path:
         """Get path to match files directory."""
         return self.config_path / "match"
 
-    @property
+    @cached_property
     def config_file(self) -> Path:
         """Get path to main config file."""
         return self.config_path / "config" / "default.yml"
@@ -65,21 +95,24 @@ class EspansoManager:
         """Check if Espanso configuration exists."""
         return self.config_path.exists()
 
-    def is_installed(self) -> bool:
-        """Check if Espanso is installed and accessible."""
-        try:
-            result = subprocess.run(
-                ["espanso", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            return result.returncode == 0
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return False
+    def _probe(self, force: bool = False) -> dict:
+        """Query the Espanso CLI for install state, version and status.
 
-    def get_version(self) -> str | None:
-        """Get installed Espanso version."""
+        Runs `espanso --version` and `espanso status` once and reuses the
+        result for PROBE_TTL seconds.
+
+        Args:
+            force: Run the CLI even if a fresh result is cached.
+
+        Returns:
+            Dictionary with "installed", "version" and "status" keys.
+        """
+        cached = self._probe_cache
+        now = time.monotonic()
+        if not force and cached and now - cached[0] < self.PROBE_TTL:
+            return cached[1]
+
+        probe = {"installed": False, "version": None, "status": "unknown"}
         try:
             result = subprocess.run(
                 ["espanso", "--version"],
@@ -88,10 +121,25 @@ class EspansoManager:
                 timeout=5,
             )
             if result.returncode == 0:
-                return result.stdout.strip()
+                probe["installed"] = True
+                probe["version"] = result.stdout.strip()
         except (subprocess.SubprocessError, FileNotFoundError):
             pass
-        return None
+
+        # Only a working install can report its status
+        if probe["installed"]:
+            probe["status"] = self._query_status()
+
+        self._probe_cache = (now, probe)
+        return probe
+
+    def is_installed(self) -> bool:
+        """Check if Espanso is installed and accessible."""
+        return self._probe()["installed"]
+
+    def get_version(self) -> str | None:
+        """Get installed Espanso version."""
+        return self._probe()["version"]
 
     def restart(self) -> bool:
         """Restart Espanso to apply configuration changes.
@@ -99,18 +147,21 @@ class EspansoManager:
         Returns:
             True if restart was successful, False otherwise.
         """
+        self._probe_cache = None
         try:
             # Stop Espanso
             subprocess.run(
                 ["espanso", "stop"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10,
             )
 
             # Start Espanso
             result = subprocess.run(
                 ["espanso", "start"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10,
             )
 
@@ -127,11 +178,13 @@ class EspansoManager:
         Returns:
             True if reload was successful, False otherwise.
         """
+        self._probe_cache = None
         try:
             # Try the restart command which is more reliable
             result = subprocess.run(
                 ["espanso", "restart"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10,
             )
             return result.returncode == 0
@@ -146,6 +199,10 @@ class EspansoManager:
         Returns:
             Status string: "running", "stopped", or "unknown".
         """
+        return self._probe()["status"]
+
+    def _query_status(self) -> str:
+        """Run `espanso status` and classify its output."""
         try:
             result = subprocess.run(
                 ["espanso", "status"],
@@ -166,13 +223,31 @@ class EspansoManager:
         return "unknown"
 
     def get_match_files(self) -> list[Path]:
-        """Get list of all match files in the config directory."""
-        if not self.match_dir.exists():
+        """Get list of all match files in the config directory.
+
+        The directory is only rescanned when its mtime changes, i.e. when a
+        file is added, removed or renamed.
+        """
+        try:
+            mtime = self.match_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        files = list(self.match_dir.glob("*.yml"))
-        files.extend(self.match_dir.glob("*.yaml"))
-        return sorted(files)
+        cached = self._match_files_cache
+        if cached is None or cached[0] != mtime:
+            # One directory pass for both extensions
+            try:
+                with os.scandir(self.match_dir) as it:
+                    files = [
+                        Path(entry.path) for entry in it
+                        if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+                    ]
+            except FileNotFoundError:
+                return []
+            files.sort()
+            cached = self._match_files_cache = (mtime, files)
+        # Copy so callers can't modify the cached list
+        return list(cached[1])
 
     def ensure_directories(self):
         """Ensure required directories exist."""
@@ -189,16 +264,14 @@ class EspansoManager:
         Returns:
             Path to the backup directory.
         """
-        import shutil
-        from datetime import datetime
-
         backup_dir = Path(backup_dir)
         backup_dir.mkdir(parents=True, exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
         backup_path = backup_dir / f"espanso_backup_{timestamp}"
 
-        shutil.copytree(self.config_path, backup_path)
+        # Only contents matter for a backup - skip copying timestamps
+        shutil.copytree(self.config_path, backup_path, copy_function=shutil.copy)
         return backup_path
 
     def get_config_info(self) -> dict:
@@ -207,12 +280,13 @@ class EspansoManager:
         Returns:
             Dictionary with config information.
         """
+        probe = self._probe(force=True)
         info = {
             "path": str(self.config_path),
             "exists": self.exists(),
-            "is_installed": self.is_installed(),
-            "version": self.get_version(),
-            "status": self.get_status(),
+            "is_installed": probe["installed"],
+            "version": probe["version"],
+            "status": probe["status"],
             "match_files": [],
             "total_entries": 0,
         }
@@ -221,15 +295,13 @@ class EspansoManager:
             match_files = self.get_match_files()
             info["match_files"] = [f.name for f in match_files]
 
-            # Count entries (basic count without parsing)
-            from espanded.core.yaml_handler import YAMLHandler
-            yaml_handler = YAMLHandler()
-
-            total = 0
-            for match_file in match_files:
-                entries = yaml_handler.read_match_file(match_file)
-                total += len(entries)
-
-            info["total_entries"] = total
+            # Count entries, reading the files in parallel; the handler is
+            # safe to share between threads and skips unchanged files
+            count = self.yaml_handler.count_matches
+            if len(match_files) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(match_files))) as pool:
+                    info["total_entries"] = sum(pool.map(count, match_files))
+            else:
+                info["total_entries"] = sum(map(count, match_files))
 
         return info
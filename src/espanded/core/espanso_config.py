@@ -1,10 +1,13 @@
 """Espanso default.yml configuration management."""
 
-from dataclasses import dataclass, field
+import os
+from dataclasses import dataclass, fields
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ruamel.yaml import YAML
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
 
 
 # Toggle key options
@@ -32,7 +35,15 @@ BACKEND_OPTIONS = [
 ]
 
 
-@dataclass
+# Espanso's default word separators
+DEFAULT_WORD_SEPARATORS = (
+    " ", ",", ".", "?", "!", "@", "#", "$", "%", "^", "&", "*",
+    "(", ")", "[", "]", "{", "}", "<", ">", "/", "\\", "|", "-",
+    "_", "+", "=", ";", ":", "'", '"', "`", "~", "\n", "\t", "\r",
+)
+
+
+@dataclass(slots=True)
 class EspansoConfig:
     """Espanso default.yml configuration options."""
 
@@ -113,12 +124,45 @@ class EspansoConfig:
     # Apply built-in patches
     apply_patch: bool = True
 
-    # Word separators (stored as list)
-    word_separators: list[str] = field(default_factory=lambda: [
-        " ", ",", ".", "?", "!", "@", "#", "$", "%", "^", "&", "*",
-        "(", ")", "[", "]", "{", "}", "<", ">", "/", "\\", "|", "-",
-        "_", "+", "=", ";", ":", "'", '"', "`", "~", "\n", "\t", "\r"
-    ])
+    # Word separators - a shared tuple, replaced rather than mutated
+    word_separators: tuple[str, ...] = DEFAULT_WORD_SEPARATORS
+
+
+# default.yml keys read by load() - each is also the EspansoConfig attribute name
+_CONFIG_KEYS = frozenset(f.name for f in fields(EspansoConfig))
+
+# Keys written by save() when they differ from the defaults. backend is
+# lower-cased first so it's handled separately, and word_separators is
+# never written.
+_SAVED_KEYS = (
+    # Global options
+    "auto_restart",
+    "backspace_limit",
+    "preserve_clipboard",
+    "search_shortcut",
+    "search_trigger",
+    "show_icon",
+    "show_notifications",
+    "toggle_key",
+    "undo_backspace",
+    "win32_exclude_orphan_events",
+    "win32_keyboard_layout_cache_interval",
+    # App-specific options
+    "clipboard_threshold",
+    "enable",
+    "inject_delay",
+    "key_delay",
+    "paste_shortcut",
+    "pre_paste_delay",
+    "restore_clipboard_delay",
+    "post_form_delay",
+    "post_search_delay",
+    "paste_shortcut_event_delay",
+    "max_form_width",
+    "max_form_height",
+    "apply_patch",
+)
+_DEFAULTS = EspansoConfig()
 
 
 class EspansoConfigHandler:
@@ -128,9 +172,33 @@ class EspansoConfigHandler:
         """Initialize with path to Espanso config directory."""
         self.config_dir = Path(espanso_config_path) / "config"
         self.default_yml_path = self.config_dir / "default.yml"
-        self.yaml = YAML()
-        self.yaml.preserve_quotes = True
-        self.yaml.indent(mapping=2, sequence=4, offset=2)
+        # ((st_mtime_ns, st_size), data) of default.yml as last parsed or written
+        self._cache: tuple[tuple[int, int], dict[str, Any]] | None = None
+
+    @cached_property
+    def yaml(self) -> "YAML":
+        """ruamel.yaml instance, imported and built on first load or save."""
+        from ruamel.yaml import YAML
+
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        yaml.indent(mapping=2, sequence=4, offset=2)
+        return yaml
+
+    def _read_yaml(self) -> dict[str, Any]:
+        """Parse default.yml, reusing the last result if the file is unchanged.
+
+        Callers must not modify the returned dict.
+        """
+        stat = os.stat(self.default_yml_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == key:
+            return self._cache[1]
+
+        with open(self.default_yml_path, "r", encoding="utf-8") as f:
+            data = self.yaml.load(f) or {}
+        self._cache = (key, data)
+        return data
 
     def load(self) -> EspansoConfig:
         """Load configuration from default.yml."""
@@ -140,46 +208,16 @@ class EspansoConfigHandler:
             return config
 
         try:
-            with open(self.default_yml_path, "r", encoding="utf-8") as f:
-                data = self.yaml.load(f) or {}
-
-            # Map YAML keys to config attributes
-            mapping = {
-                "auto_restart": "auto_restart",
-                "backspace_limit": "backspace_limit",
-                "preserve_clipboard": "preserve_clipboard",
-                "search_shortcut": "search_shortcut",
-                "search_trigger": "search_trigger",
-                "show_icon": "show_icon",
-                "show_notifications": "show_notifications",
-                "toggle_key": "toggle_key",
-                "undo_backspace": "undo_backspace",
-                "win32_exclude_orphan_events": "win32_exclude_orphan_events",
-                "win32_keyboard_layout_cache_interval": "win32_keyboard_layout_cache_interval",
-                "backend": "backend",
-                "clipboard_threshold": "clipboard_threshold",
-                "enable": "enable",
-                "inject_delay": "inject_delay",
-                "key_delay": "key_delay",
-                "paste_shortcut": "paste_shortcut",
-                "pre_paste_delay": "pre_paste_delay",
-                "restore_clipboard_delay": "restore_clipboard_delay",
-                "post_form_delay": "post_form_delay",
-                "post_search_delay": "post_search_delay",
-                "paste_shortcut_event_delay": "paste_shortcut_event_delay",
-                "max_form_width": "max_form_width",
-                "max_form_height": "max_form_height",
-                "apply_patch": "apply_patch",
-                "word_separators": "word_separators",
-            }
-
-            for yaml_key, attr_name in mapping.items():
-                if yaml_key in data:
-                    value = data[yaml_key]
-                    # Handle backend capitalization
-                    if attr_name == "backend" and isinstance(value, str):
-                        value = value.capitalize()
-                    setattr(config, attr_name, value)
+            data = self._read_yaml()
+
+            for key in _CONFIG_KEYS & data.keys():
+                setattr(config, key, data[key])
+            # A tuple like the default, not the cached parse's list
+            if "word_separators" in data:
+                config.word_separators = tuple(config.word_separators)
+            # Espanso accepts any case for backend; the UI options are capitalized
+            if isinstance(config.backend, str):
+                config.backend = config.backend.capitalize()
 
         except Exception as e:
             print(f"Error loading Espanso config: {e}")
@@ -195,58 +233,44 @@ class EspansoConfigHandler:
             # Load existing data to preserve unknown keys
             existing_data: dict[str, Any] = {}
             if self.default_yml_path.exists():
-                with open(self.default_yml_path, "r", encoding="utf-8") as f:
-                    existing_data = self.yaml.load(f) or {}
+                existing_data = self._read_yaml()
 
             # Update with our config values
             data = existing_data.copy()
 
-            # Only write non-default values to keep file clean
-            defaults = EspansoConfig()
-
-            def set_if_changed(key: str, value: Any, default: Any):
-                if value != default:
+            # Only write non-default values to keep file clean; a value set
+            # back to its default is removed
+            backend = config.backend.lower() if config.backend else "auto"
+            if backend != "auto":
+                data["backend"] = backend
+            elif "backend" in data:
+                del data["backend"]
+
+            for key in _SAVED_KEYS:
+                value = getattr(config, key)
+                if value != getattr(_DEFAULTS, key):
                     data[key] = value
                 elif key in data:
-                    # Remove if set back to default
                     del data[key]
 
-            # Global options
-            set_if_changed("auto_restart", config.auto_restart, defaults.auto_restart)
-            set_if_changed("backspace_limit", config.backspace_limit, defaults.backspace_limit)
-            set_if_changed("preserve_clipboard", config.preserve_clipboard, defaults.preserve_clipboard)
-            set_if_changed("search_shortcut", config.search_shortcut, defaults.search_shortcut)
-            set_if_changed("search_trigger", config.search_trigger, defaults.search_trigger)
-            set_if_changed("show_icon", config.show_icon, defaults.show_icon)
-            set_if_changed("show_notifications", config.show_notifications, defaults.show_notifications)
-            set_if_changed("toggle_key", config.toggle_key, defaults.toggle_key)
-            set_if_changed("undo_backspace", config.undo_backspace, defaults.undo_backspace)
-            set_if_changed("win32_exclude_orphan_events", config.win32_exclude_orphan_events, defaults.win32_exclude_orphan_events)
-            set_if_changed("win32_keyboard_layout_cache_interval", config.win32_keyboard_layout_cache_interval, defaults.win32_keyboard_layout_cache_interval)
-
-            # App-specific options
-            backend_value = config.backend.lower() if config.backend else "auto"
-            set_if_changed("backend", backend_value, "auto")
-            set_if_changed("clipboard_threshold", config.clipboard_threshold, defaults.clipboard_threshold)
-            set_if_changed("enable", config.enable, defaults.enable)
-            set_if_changed("inject_delay", config.inject_delay, defaults.inject_delay)
-            set_if_changed("key_delay", config.key_delay, defaults.key_delay)
-            set_if_changed("paste_shortcut", config.paste_shortcut, defaults.paste_shortcut)
-            set_if_changed("pre_paste_delay", config.pre_paste_delay, defaults.pre_paste_delay)
-            set_if_changed("restore_clipboard_delay", config.restore_clipboard_delay, defaults.restore_clipboard_delay)
-            set_if_changed("post_form_delay", config.post_form_delay, defaults.post_form_delay)
-            set_if_changed("post_search_delay", config.post_search_delay, defaults.post_search_delay)
-            set_if_changed("paste_shortcut_event_delay", config.paste_shortcut_event_delay, defaults.paste_shortcut_event_delay)
-            set_if_changed("max_form_width", config.max_form_width, defaults.max_form_width)
-            set_if_changed("max_form_height", config.max_form_height, defaults.max_form_height)
-            set_if_changed("apply_patch", config.apply_patch, defaults.apply_patch)
-
-            # Write to file
-            with open(self.default_yml_path, "w", encoding="utf-8") as f:
-                if data:
-                    self.yaml.dump(data, f)
-                else:
-                    f.write("# Espanso default configuration\n")
+            # Write a sibling temp file and swap it in, so a crash or a
+            # concurrent load() never sees a half-written default.yml
+            tmp_path = self.default_yml_path.with_suffix(".yml.tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+                    if data:
+                        self.yaml.dump(data, f)
+                    else:
+                        f.write("# Espanso default configuration\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                    # Cache what was written so the next load or save skips parsing it
+                    stat = os.fstat(f.fileno())
+                os.replace(tmp_path, self.default_yml_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            self._cache = ((stat.st_mtime_ns, stat.st_size), data)
 
             return True
 
@@ -1,12 +1,67 @@
 """Data models for Espanded."""
 
-from dataclasses import dataclass, field
+import hashlib
+import os
+import sys
+import threading
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Any
-from uuid import uuid4
 
+# Random bytes for _new_id(), drawn from the OS 256 IDs at a time
+_ID_BATCH = 4096
+_id_lock = threading.Lock()
+_id_pool = b""
+_id_pos = 0
 
-@dataclass
+
+def _new_id() -> str:
+    """Generate a random 128-bit ID as 32 hex characters.
+
+    Bulk imports create thousands of entries; slicing a shared batch of
+    os.urandom() bytes avoids one getrandom syscall and UUID object per ID.
+    """
+    global _id_pool, _id_pos
+    with _id_lock:
+        if _id_pos >= len(_id_pool):
+            _id_pool = os.urandom(_ID_BATCH)
+            _id_pos = 0
+        start = _id_pos
+        _id_pos += 16
+        raw = _id_pool[start:start + 16]
+    return raw.hex()
+
+
+def _reset_id_pool():
+    """Drop the parent's random bytes (and lock state) in a forked child."""
+    global _id_lock, _id_pool, _id_pos
+    _id_lock = threading.Lock()
+    _id_pool = b""
+    _id_pos = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+# Trigger prefixes recognised on import, longest first so "::" wins over ":"
+_TRIGGER_PREFIXES = ("//", "::", ":", ";")
+
+# (attribute, Espanso key, default) for the match options to_espanso_dict()
+# writes only when they differ from Espanso's default
+_ESPANSO_OPTIONS = (
+    ("word", "word", True),
+    ("propagate_case", "propagate_case", False),
+    ("uppercase_style", "uppercase_style", "capitalize"),
+    ("regex", "regex", False),
+    ("case_insensitive", "case_insensitive", False),
+    ("force_clipboard", "force_clipboard", False),
+    ("passive", "passive_only", False),
+    ("markdown", "markdown", False),
+)
+
+
+@dataclass(slots=True)
 class Entry:
     """Represents a single Espanso text expansion entry."""
 
@@ -41,9 +96,15 @@ class Entry:
     source_file: str = "base.yml"
 
     def __post_init__(self):
-        """Generate ID if not provided."""
+        """Generate ID if not provided and intern the low-cardinality strings."""
         if not self.id:
-            self.id = str(uuid4())
+            self.id = _new_id()
+        # A handful of prefixes and match files are shared by every entry;
+        # str() because sys.intern rejects the str subclasses YAML loads
+        if self.prefix:
+            self.prefix = sys.intern(str(self.prefix))
+        if self.source_file:
+            self.source_file = sys.intern(str(self.source_file))
 
     @property
     def full_trigger(self) -> str:
@@ -63,29 +124,11 @@ class Entry:
         }
 
         # Add optional fields only if they differ from defaults
-        if not self.word:
-            entry["word"] = False
-
-        if self.propagate_case:
-            entry["propagate_case"] = True
-
-        if self.uppercase_style != "capitalize":
-            entry["uppercase_style"] = self.uppercase_style
-
-        if self.regex:
-            entry["regex"] = True
-
-        if self.case_insensitive:
-            entry["case_insensitive"] = True
-
-        if self.force_clipboard:
-            entry["force_clipboard"] = True
-
-        if self.passive:
-            entry["passive_only"] = True
-
-        if self.markdown:
-            entry["markdown"] = True
+        entry.update(
+            (key, value)
+            for attr, key, default in _ESPANSO_OPTIONS
+            if (value := getattr(self, attr)) != default
+        )
 
         if self.cursor_hint:
             entry["cursor_hint"] = self.cursor_hint
@@ -101,21 +144,37 @@ class Entry:
         data: dict[str, Any],
         source_file: str = "base.yml",
         entry_id: str | None = None,
+        timestamp: datetime | None = None,
     ) -> "Entry":
-        """Create Entry from Espanso YAML data."""
+        """Create Entry from Espanso YAML data.
+
+        Args:
+            data: One item of a match file's "matches" list.
+            source_file: Name of the match file the item came from.
+            entry_id: ID to use; generated if None.
+            timestamp: created_at/modified_at to set; defaults to now.
+        """
+        now = timestamp or datetime.now()
+        # Copy so the entry doesn't share a list with the parsed YAML
+        filter_apps = data.get("filter_apps")
+        if filter_apps is not None:
+            filter_apps = list(filter_apps)
+
         trigger = data.get("trigger", "")
         prefix = ""
         trigger_text = trigger
 
-        # Extract prefix from trigger
-        for p in ["//", "::", ":", ";"]:
-            if trigger.startswith(p):
-                prefix = p
-                trigger_text = trigger[len(p):]
-                break
+        # Extract prefix from trigger; one startswith call settles the
+        # common unprefixed case
+        if trigger.startswith(_TRIGGER_PREFIXES):
+            for p in _TRIGGER_PREFIXES:
+                if trigger.startswith(p):
+                    prefix = p
+                    trigger_text = trigger[len(p):]
+                    break
 
         return cls(
-            id=entry_id or str(uuid4()),
+            id=entry_id or _new_id(),
             trigger=trigger_text,
             prefix=prefix,
             replacement=data.get("replace", ""),
@@ -129,12 +188,24 @@ class Entry:
             passive=data.get("passive_only", False),
             markdown=data.get("markdown", False),
             cursor_hint=data.get("cursor_hint"),
-            filter_apps=data.get("filter_apps"),
+            filter_apps=filter_apps,
+            created_at=now,
+            modified_at=now,
             source_file=source_file,
         )
 
+    @classmethod
+    def from_espanso_dicts(
+        cls,
+        items: list[dict[str, Any]],
+        source_file: str = "base.yml",
+    ) -> list["Entry"]:
+        """Create Entries from many Espanso YAML items sharing one timestamp."""
+        now = datetime.now()
+        return [cls.from_espanso_dict(data, source_file, timestamp=now) for data in items]
+
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Application settings."""
 
@@ -157,7 +228,7 @@ class Settings:
 
     # Autocomplete (inline suggestions while typing)
     autocomplete_enabled: bool = True
-    autocomplete_triggers: list[str] = field(default_factory=lambda: [":"])
+    autocomplete_triggers: tuple[str, ...] = (":",)
     autocomplete_min_chars: int = 0  # chars after trigger before showing popup
     autocomplete_max_suggestions: int = 8
     autocomplete_show_delay_ms: int = 100  # delay before showing popup
@@ -168,62 +239,47 @@ class Settings:
     # First Run
     has_imported: bool = False
     last_sync: datetime | None = None
+    last_sync_check: float = 0.0  # epoch time of last successful connection test
+    last_sync_fingerprint: str = ""  # sync_fingerprint() at last_sync_check
+
+    def sync_fingerprint(self) -> str:
+        """Return a digest of the GitHub repo and token.
+
+        Stored alongside last_sync_check so a changed repo or token forces
+        a fresh connection test; the token itself never leaves github_token.
+        """
+        key = f"{self.github_repo or ''}\0{self.github_token or ''}"
+        return hashlib.sha256(key.encode()).hexdigest()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert settings to dictionary for storage."""
-        return {
-            "github_repo": self.github_repo,
-            "github_token": self.github_token,
-            "auto_sync": self.auto_sync,
-            "sync_interval": self.sync_interval,
-            "default_prefix": self.default_prefix,
-            "theme": self.theme,
-            "custom_colors": self.custom_colors,
-            "tag_colors": self.tag_colors,
-            "quick_add_hotkey": self.quick_add_hotkey,
-            "hotkeys_enabled": self.hotkeys_enabled,
-            "minimize_to_tray": self.minimize_to_tray,
-            "autocomplete_enabled": self.autocomplete_enabled,
-            "autocomplete_triggers": self.autocomplete_triggers,
-            "autocomplete_min_chars": self.autocomplete_min_chars,
-            "autocomplete_max_suggestions": self.autocomplete_max_suggestions,
-            "autocomplete_show_delay_ms": self.autocomplete_show_delay_ms,
-            "espanso_config_path": self.espanso_config_path,
-            "has_imported": self.has_imported,
-            "last_sync": self.last_sync.isoformat() if self.last_sync else None,
-        }
+        data = {name: getattr(self, name) for name in _SETTINGS_FIELDS}
+        data["last_sync"] = self.last_sync.isoformat() if self.last_sync else None
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Settings":
-        """Create Settings from dictionary."""
-        last_sync = data.get("last_sync")
+        """Create Settings from dictionary.
+
+        Keys missing from data (settings saved by an older version) get
+        the field defaults; unknown keys are ignored.
+        """
+        values = {name: data[name] for name in _SETTINGS_FIELDS if name in data}
+
+        last_sync = values.get("last_sync")
         if last_sync and isinstance(last_sync, str):
-            last_sync = datetime.fromisoformat(last_sync)
+            values["last_sync"] = datetime.fromisoformat(last_sync)
+        if "autocomplete_triggers" in values:
+            values["autocomplete_triggers"] = tuple(values["autocomplete_triggers"])
 
-        return cls(
-            github_repo=data.get("github_repo"),
-            github_token=data.get("github_token"),
-            auto_sync=data.get("auto_sync", True),
-            sync_interval=data.get("sync_interval", 10800),
-            default_prefix=data.get("default_prefix", ":"),
-            theme=data.get("theme", "system"),
-            custom_colors=data.get("custom_colors", {}),
-            tag_colors=data.get("tag_colors", {}),
-            quick_add_hotkey=data.get("quick_add_hotkey", "<ctrl>+<alt>+e"),
-            hotkeys_enabled=data.get("hotkeys_enabled", True),
-            minimize_to_tray=data.get("minimize_to_tray", True),
-            autocomplete_enabled=data.get("autocomplete_enabled", True),
-            autocomplete_triggers=data.get("autocomplete_triggers", [":"]),
-            autocomplete_min_chars=data.get("autocomplete_min_chars", 0),
-            autocomplete_max_suggestions=data.get("autocomplete_max_suggestions", 8),
-            autocomplete_show_delay_ms=data.get("autocomplete_show_delay_ms", 100),
-            espanso_config_path=data.get("espanso_config_path", ""),
-            has_imported=data.get("has_imported", False),
-            last_sync=last_sync,
-        )
+        return cls(**values)
+
+
+# Settings field names, in declaration order, for to_dict()/from_dict()
+_SETTINGS_FIELDS = tuple(f.name for f in fields(Settings))
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryEntry:
     """Represents a change history entry."""
 
@@ -235,6 +291,8 @@ class HistoryEntry:
     trigger_name: str = ""  # For display purposes
 
     def __post_init__(self):
-        """Generate ID if not provided."""
+        """Generate ID if not provided and intern the action name."""
         if not self.id:
-            self.id = str(uuid4())
+            self.id = _new_id()
+        if self.action:
+            self.action = sys.intern(str(self.action))
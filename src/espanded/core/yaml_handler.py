@@ -1,22 +1,228 @@
 """YAML handler for reading and writing Espanso configuration files."""
 
+import copy
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from io import StringIO
 from pathlib import Path
-from typing import Any
-
-from ruamel.yaml import YAML
+from typing import IO, TYPE_CHECKING, Any
 
 from espanded.core.models import Entry
 
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
+
+
+# Bump when the sidecar layout or the stored match items change
+_SIDECAR_VERSION = 3
+
+
+def _match_items(data: Any, strings: dict[str, str] | None = None) -> list[dict[str, Any]]:
+    """Return the items under a parsed file's "matches" key that can become Entries.
+
+    An item needs both a trigger and a replacement; one missing either (or
+    with an empty YAML value for it) is skipped.
+
+    Args:
+        data: A match file as loaded by the safe loader.
+        strings: Replacement texts seen so far; an item whose replacement
+            equals one of them is pointed at that same string object.
+    """
+    if not data:
+        return []
+    matches = [
+        match for match in data.get("matches") or ()
+        if match.get("trigger") is not None and match.get("replace") is not None
+    ]
+    if strings is not None:
+        # Templated configs repeat replacement texts; keep one copy of each
+        for match in matches:
+            replace = match["replace"]
+            if isinstance(replace, str):
+                match["replace"] = strings.setdefault(replace, replace)
+    return matches
+
+
+def _match_problem(match: Any) -> str | None:
+    """Describe what makes one match item invalid, or None if it's valid."""
+    if not isinstance(match, dict):
+        return "must be a dictionary"
+    if "trigger" not in match:
+        return "is missing 'trigger'"
+    if "replace" not in match:
+        return "is missing 'replace'"
+    return None
+
 
 class YAMLHandler:
     """Handles reading and writing Espanso YAML configuration files."""
 
-    def __init__(self):
-        """Initialize YAML handler with ruamel.yaml for format preservation."""
-        self.yaml = YAML()
-        self.yaml.preserve_quotes = True
-        self.yaml.default_flow_style = False
-        self.yaml.indent(mapping=2, sequence=4, offset=2)
+    # Parsed files kept per cache, least recently read dropped first
+    CACHE_SIZE = 128
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        """Initialize the parse caches.
+
+        Each maps a path to ((st_mtime_ns, st_size), parsed data); a file is
+        parsed again only when its mtime or size changes.
+
+        Args:
+            cache_dir: Directory for the sidecar parse caches that outlive
+                the process. If None, uses ~/.espanded/cache.
+        """
+        # Sidecars live in the app's own directory, never the user's
+        # (often synced) Espanso config
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".espanded" / "cache"
+        self._match_cache: OrderedDict[Path, tuple[tuple[int, int], list]] = OrderedDict()
+        self._config_cache: OrderedDict[Path, tuple[tuple[int, int], Any]] = OrderedDict()
+        # read_all_match_files() reads on worker threads
+        self._cache_lock = threading.Lock()
+        self._local = threading.local()
+
+    def clear_cache(self):
+        """Forget every parsed file."""
+        with self._cache_lock:
+            self._match_cache.clear()
+            self._config_cache.clear()
+
+    def _cache_get(self, cache: OrderedDict, file_path: Path, key: tuple[int, int]) -> Any:
+        """Return the cached parse of file_path if it was taken at key, else None."""
+        with self._cache_lock:
+            hit = cache.get(file_path)
+            if hit is None or hit[0] != key:
+                return None
+            cache.move_to_end(file_path)
+            return hit[1]
+
+    def _cache_put(self, cache: OrderedDict, file_path: Path, key: tuple[int, int], value: Any):
+        """Store a parse of file_path, evicting the least recently read file."""
+        with self._cache_lock:
+            cache[file_path] = (key, value)
+            cache.move_to_end(file_path)
+            if len(cache) > self.CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _sidecar_path(self, file_path: Path) -> Path:
+        """Path of the parse cache for a match file, named by its absolute path."""
+        digest = hashlib.sha256(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+        return self.cache_dir / "matches" / f"{digest[:32]}.json"
+
+    def _read_sidecar(self, file_path: Path, key: tuple[int, int]) -> list | None:
+        """Return the match items cached for file_path if taken at key, else None."""
+        try:
+            with open(self._sidecar_path(file_path), encoding="utf-8") as f:
+                sidecar = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Truncated or unreadable - parse the YAML instead
+            return None
+        if (
+            not isinstance(sidecar, dict)
+            or sidecar.get("version") != _SIDECAR_VERSION
+            or sidecar.get("path") != os.path.abspath(file_path)
+            or sidecar.get("key") != list(key)
+            or not isinstance(sidecar.get("matches"), list)
+        ):
+            return None
+        return sidecar["matches"]
+
+    def _write_sidecar(self, file_path: Path, key: tuple[int, int], matches: list):
+        """Cache parsed match items as JSON so the next start skips YAML.
+
+        Best effort: items JSON can't hold as-is (dates, non-string keys) or
+        an unwritable cache directory just mean no sidecar.
+        """
+        sidecar = {
+            "version": _SIDECAR_VERSION,
+            "path": os.path.abspath(file_path),
+            "key": list(key),
+            "matches": matches,
+        }
+        try:
+            content = json.dumps(sidecar, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+        if json.loads(content)["matches"] != matches:
+            return
+
+        sidecar_path = self._sidecar_path(file_path)
+        # Parallel reads may write the same sidecar; never leave half of one
+        tmp_path = sidecar_path.with_name(
+            f"{sidecar_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, sidecar_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _dump(self, file_path: Path, data: Any) -> os.stat_result:
+        """Write data as YAML to file_path atomically.
+
+        The YAML is rendered in memory and written to a sibling temp file in
+        one call, then swapped in, so Espanso never reloads a half-written
+        file and a crash leaves the old one intact.
+
+        Returns:
+            The stat of the written file.
+        """
+        buf = StringIO()
+        self.yaml.dump(data, buf)
+        content = buf.getvalue().encode("utf-8")
+
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+                stat = os.fstat(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return stat
+
+    @cached_property
+    def yaml(self) -> "YAML":
+        """ruamel.yaml instance for format preservation, built on first use.
+
+        Importing ruamel.yaml is deferred so creating a handler (at app
+        startup, via EntryManager) costs nothing until a file is touched.
+        """
+        from ruamel.yaml import YAML
+
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        yaml.default_flow_style = False
+        yaml.indent(mapping=2, sequence=4, offset=2)
+        return yaml
+
+    @property
+    def safe_yaml(self) -> "YAML":
+        """ruamel.yaml safe loader for read-only parsing, one per thread.
+
+        Builds plain dicts and lists instead of the comment-preserving
+        round-trip tree, and parses through libyaml when ruamel.yaml.clib is
+        installed. Unlike PyYAML it keeps YAML 1.2 scalars, so a replacement
+        such as "yes" or "on" stays a string. A YAML instance keeps parser
+        state between loads, so each thread gets its own.
+        """
+        yaml = getattr(self._local, "safe_yaml", None)
+        if yaml is None:
+            from ruamel.yaml import YAML
+
+            yaml = self._local.safe_yaml = YAML(typ="safe")
+        return yaml
 
     def read_match_file(self, file_path: Path | str) -> list[Entry]:
         """Read entries from an Espanso match file.
@@ -28,27 +234,51 @@ class YAMLHandler:
             List of Entry objects parsed from the file.
         """
         file_path = Path(file_path)
-        if not file_path.exists():
-            return []
+        return Entry.from_espanso_dicts(self._read_matches(file_path), source_file=file_path.name)
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = self.yaml.load(f)
+    def count_matches(self, file_path: Path | str) -> int:
+        """Count the usable matches in a match file without building Entries.
 
-        if not data:
-            return []
+        Args:
+            file_path: Path to the YAML match file.
 
-        entries = []
-        matches = data.get("matches", [])
+        Returns:
+            Number of matches read_match_file would return.
+        """
+        return len(self._read_matches(Path(file_path)))
 
-        for match in matches:
-            if "trigger" in match and "replace" in match:
-                entry = Entry.from_espanso_dict(
-                    match,
-                    source_file=file_path.name,
-                )
-                entries.append(entry)
+    def _read_matches(
+        self, file_path: Path, strings: dict[str, str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Return a match file's usable match items, from cache when unchanged.
 
-        return entries
+        Callers must not modify the returned list or its items.
+
+        Args:
+            file_path: Path to the YAML match file.
+            strings: Replacement texts to share with other files parsed in
+                the same batch; a fresh table for this file if None.
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return []
+
+        # Cache the match items, not Entries - each read still returns fresh
+        # Entry objects with their own IDs
+        key = (stat.st_mtime_ns, stat.st_size)
+        matches = self._cache_get(self._match_cache, file_path, key)
+        if matches is None:
+            matches = self._read_sidecar(file_path, key)
+            if matches is None:
+                if strings is None:
+                    strings = {}
+                with open(file_path, "r", encoding="utf-8", buffering=1 << 16) as f:
+                    matches = _match_items(self.safe_yaml.load(f), strings)
+                self._write_sidecar(file_path, key, matches)
+            self._cache_put(self._match_cache, file_path, key, matches)
+
+        return matches
 
     def write_match_file(self, file_path: Path | str, entries: list[Entry]):
         """Write entries to an Espanso match file.
@@ -65,8 +295,14 @@ class YAMLHandler:
 
         data = {"matches": matches}
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            self.yaml.dump(data, f)
+        with self._cache_lock:
+            self._match_cache.pop(file_path, None)
+        stat = self._dump(file_path, data)
+
+        # The written items are what a parse would give back
+        key = (stat.st_mtime_ns, stat.st_size)
+        self._write_sidecar(file_path, key, matches)
+        self._cache_put(self._match_cache, file_path, key, matches)
 
     def read_config_file(self, file_path: Path | str) -> dict[str, Any]:
         """Read Espanso config file (default.yml).
@@ -78,13 +314,22 @@ class YAMLHandler:
             Dictionary of configuration values.
         """
         file_path = Path(file_path)
-        if not file_path.exists():
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             return {}
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = self.yaml.load(f)
+        key = (stat.st_mtime_ns, stat.st_size)
+        data = self._cache_get(self._config_cache, file_path, key)
+        if data is None:
+            # Round-trip loader, so comments and key order survive when the
+            # config is written back
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = self.yaml.load(f) or {}
+            self._cache_put(self._config_cache, file_path, key, data)
 
-        return data or {}
+        # Callers may edit the returned config and write it back
+        return copy.deepcopy(data)
 
     def write_config_file(self, file_path: Path | str, config: dict[str, Any]):
         """Write Espanso config file.
@@ -96,8 +341,9 @@ class YAMLHandler:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            self.yaml.dump(config, f)
+        with self._cache_lock:
+            self._config_cache.pop(file_path, None)
+        self._dump(file_path, config)
 
     def read_all_match_files(self, config_dir: Path | str) -> dict[str, list[Entry]]:
         """Read all match files from an Espanso config directory.
@@ -111,22 +357,34 @@ class YAMLHandler:
         config_dir = Path(config_dir)
         match_dir = config_dir / "match"
 
-        if not match_dir.exists():
+        # One directory pass for both extensions
+        try:
+            with os.scandir(match_dir) as it:
+                files = [
+                    Path(entry.path) for entry in it
+                    if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+                ]
+        except FileNotFoundError:
             return {}
-
-        result = {}
-        for yaml_file in match_dir.glob("*.yml"):
-            entries = self.read_match_file(yaml_file)
-            if entries:
-                result[yaml_file.name] = entries
-
-        # Also check for .yaml extension
-        for yaml_file in match_dir.glob("*.yaml"):
-            entries = self.read_match_file(yaml_file)
-            if entries:
-                result[yaml_file.name] = entries
-
-        return result
+        # .yml files before .yaml ones, each sorted by name
+        files.sort(key=lambda f: (f.suffix == ".yaml", f.name))
+
+        # Files are independent - read and parse them in parallel, sharing
+        # one table of replacement texts so duplicates across files are
+        # stored once (dict.setdefault is atomic, so threads can share it)
+        read = functools.partial(self._read_matches, strings={})
+        if len(files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+                results = list(pool.map(read, files))
+        else:
+            results = [read(f) for f in files]
+
+        # Entries are only built for files that have matches
+        return {
+            f.name: Entry.from_espanso_dicts(matches, source_file=f.name)
+            for f, matches in zip(files, results)
+            if matches
+        }
 
     def export_to_yaml(self, entry: Entry) -> str:
         """Export a single entry to YAML string.
@@ -137,56 +395,43 @@ class YAMLHandler:
         Returns:
             YAML formatted string.
         """
-        from io import StringIO
-
         data = {"matches": [entry.to_espanso_dict()]}
         stream = StringIO()
         self.yaml.dump(data, stream)
         return stream.getvalue()
 
-    def import_from_yaml(self, yaml_content: str, source_file: str = "imported.yml") -> list[Entry]:
-        """Import entries from YAML string.
+    def import_from_yaml(
+        self, yaml_content: str | IO[str], source_file: str = "imported.yml"
+    ) -> list[Entry]:
+        """Import entries from YAML text or an open text stream.
 
         Args:
-            yaml_content: YAML formatted string.
+            yaml_content: YAML formatted string, or a file object to parse
+                directly without reading it into memory first.
             source_file: Name to use for source_file attribute.
 
         Returns:
             List of Entry objects.
         """
-        from io import StringIO
+        matches = _match_items(self.safe_yaml.load(yaml_content))
+        return Entry.from_espanso_dicts(matches, source_file=source_file)
 
-        data = self.yaml.load(StringIO(yaml_content))
-
-        if not data:
-            return []
-
-        entries = []
-        matches = data.get("matches", [])
-
-        for match in matches:
-            if "trigger" in match and "replace" in match:
-                entry = Entry.from_espanso_dict(match, source_file=source_file)
-                entries.append(entry)
-
-        return entries
-
-    def validate_yaml(self, yaml_content: str) -> tuple[bool, str]:
+    def validate_yaml(self, yaml_content: str | IO[str]) -> tuple[bool, str]:
         """Validate YAML content.
 
         Args:
-            yaml_content: YAML string to validate.
+            yaml_content: YAML string or open text stream to validate.
 
         Returns:
             Tuple of (is_valid, error_message).
         """
-        from io import StringIO
-
         try:
-            data = self.yaml.load(StringIO(yaml_content))
+            data = self.safe_yaml.load(yaml_content)
 
             if data is None:
                 return True, ""
+            if not isinstance(data, dict):
+                return False, "Top level must be a dictionary"
 
             # Check for required structure
             if "matches" in data:
@@ -194,13 +439,18 @@ class YAMLHandler:
                 if not isinstance(matches, list):
                     return False, "'matches' must be a list"
 
-                for i, match in enumerate(matches):
-                    if not isinstance(match, dict):
-                        return False, f"Match {i+1} must be a dictionary"
-                    if "trigger" not in match:
-                        return False, f"Match {i+1} is missing 'trigger'"
-                    if "replace" not in match:
-                        return False, f"Match {i+1} is missing 'replace'"
+                # Stop at the first bad match; only its message is built
+                first_bad = next(
+                    (
+                        (i, problem)
+                        for i, match in enumerate(matches, 1)
+                        if (problem := _match_problem(match))
+                    ),
+                    None,
+                )
+                if first_bad:
+                    i, problem = first_bad
+                    return False, f"Match {i} {problem}"
 
             return True, ""
 
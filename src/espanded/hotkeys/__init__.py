@@ -1,17 +1,42 @@
 """Global hotkey and clipboard functionality."""
 
-from espanded.hotkeys.clipboard import ClipboardManager, get_selected_text
-from espanded.hotkeys.listener import (
-    HotkeyListener,
-    KeystrokeMonitor,
-    get_hotkey_listener,
-    get_keystroke_monitor,
-    normalize_hotkey,
-    display_hotkey,
-)
-from espanded.hotkeys.keystroke_buffer import KeystrokeBuffer, TriggerMatch
-from espanded.hotkeys.cursor_position import get_cursor_position, CursorPosition
-from espanded.hotkeys.text_inserter import TextInserter
+from typing import TYPE_CHECKING
+
+from espanded._lazy import make_lazy_getattr
+
+if TYPE_CHECKING:
+    from espanded.hotkeys.clipboard import ClipboardManager, get_selected_text
+    from espanded.hotkeys.cursor_position import CursorPosition, get_cursor_position
+    from espanded.hotkeys.keystroke_buffer import KeystrokeBuffer, TriggerMatch
+    from espanded.hotkeys.listener import (
+        HotkeyListener,
+        KeystrokeMonitor,
+        display_hotkey,
+        get_hotkey_listener,
+        get_keystroke_monitor,
+        normalize_hotkey,
+    )
+    from espanded.hotkeys.text_inserter import TextInserter
+
+# Default quick add hotkey (using 'e' instead of backtick - backtick has issues
+# on Windows). Defined here so it's known without importing pynput
+DEFAULT_HOTKEY = "<ctrl>+<alt>+e"
+
+_EXPORTS = {
+    "ClipboardManager": "espanded.hotkeys.clipboard",
+    "get_selected_text": "espanded.hotkeys.clipboard",
+    "HotkeyListener": "espanded.hotkeys.listener",
+    "KeystrokeMonitor": "espanded.hotkeys.listener",
+    "get_hotkey_listener": "espanded.hotkeys.listener",
+    "get_keystroke_monitor": "espanded.hotkeys.listener",
+    "normalize_hotkey": "espanded.hotkeys.listener",
+    "display_hotkey": "espanded.hotkeys.listener",
+    "KeystrokeBuffer": "espanded.hotkeys.keystroke_buffer",
+    "TriggerMatch": "espanded.hotkeys.keystroke_buffer",
+    "get_cursor_position": "espanded.hotkeys.cursor_position",
+    "CursorPosition": "espanded.hotkeys.cursor_position",
+    "TextInserter": "espanded.hotkeys.text_inserter",
+}
 
 __all__ = [
     "ClipboardManager",
@@ -28,3 +53,5 @@ __all__ = [
     "CursorPosition",
     "TextInserter",
 ]
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
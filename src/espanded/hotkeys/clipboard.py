@@ -1,16 +1,201 @@
 """Clipboard operations for getting selected text."""
 
+import ctypes
+import functools
 import platform
 import subprocess
 import time
 from typing import Callable
 
+# The OS can't change while the app runs
+_SYSTEM = platform.system()
+
+# Win32 clipboard format and input constants
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+VK_C = 0x43
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_uint16),
+        ("wScan", ctypes.c_uint16),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUT(ctypes.Structure):
+    # MOUSEINPUT is the largest union member, so it fixes sizeof(INPUT)
+    class _U(ctypes.Union):
+        _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+    _anonymous_ = ("u",)
+    _fields_ = [("type", ctypes.c_uint32), ("u", _U)]
+
+
+@functools.cache
+def _win32():
+    """Load user32 and kernel32 with the prototypes used here (Windows only).
+
+    Handles and pointers are 64-bit, so restype must be set or ctypes would
+    truncate them to a C int.
+
+    Returns:
+        Tuple of (user32, kernel32)
+    """
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.CloseClipboard.argtypes = []
+    user32.CloseClipboard.restype = wintypes.BOOL
+    user32.EmptyClipboard.argtypes = []
+    user32.EmptyClipboard.restype = wintypes.BOOL
+    user32.GetClipboardData.argtypes = [wintypes.UINT]
+    user32.GetClipboardData.restype = wintypes.HANDLE
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    user32.GetClipboardSequenceNumber.argtypes = []
+    user32.GetClipboardSequenceNumber.restype = wintypes.DWORD
+    user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+    user32.SendInput.restype = wintypes.UINT
+
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalUnlock.restype = wintypes.BOOL
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.restype = wintypes.HGLOBAL
+
+    return user32, kernel32
+
+
+@functools.cache
+def _pynput_keyboard():
+    """Return pynput.keyboard, or None if pynput isn't installed.
+
+    Resolved once, so a missing pynput costs one failed import rather than
+    one per copy.
+    """
+    try:
+        from pynput import keyboard
+    except ImportError:
+        return None
+    return keyboard
+
+
+@functools.cache
+def _copy_keys():
+    """Return a shared pynput Controller and this platform's copy modifier.
+
+    Creating a Controller probes the platform input backend, so one is made
+    on first use and reused for every copy.
+
+    Returns:
+        Tuple of (controller, modifier key), or None if pynput isn't installed
+    """
+    pynput_keyboard = _pynput_keyboard()
+    if pynput_keyboard is None:
+        return None
+    key = pynput_keyboard.Key
+    return pynput_keyboard.Controller(), key.cmd if _SYSTEM == "Darwin" else key.ctrl
+
+
+def _press_copy() -> bool:
+    """Press Ctrl+C (Cmd+C on macOS) with pynput.
+
+    Returns:
+        False if pynput isn't installed and nothing was pressed
+    """
+    keys = _copy_keys()
+    if keys is None:
+        return False
+    keyboard, modifier = keys
+    # pressed() releases the modifier even if the tap fails
+    with keyboard.pressed(modifier):
+        keyboard.tap("c")
+    return True
+
+
+@functools.cache
+def _macos_pasteboard():
+    """Return the general NSPasteboard, or None without pyobjc (macOS only)."""
+    try:
+        from AppKit import NSPasteboard
+    except ImportError:
+        return None
+    return NSPasteboard.generalPasteboard()
+
+
+def _clipboard_change_count() -> int | None:
+    """Return a counter that advances whenever the clipboard changes.
+
+    Returns:
+        The Windows clipboard sequence number or macOS pasteboard change
+        count, or None where the platform has no such counter (X11)
+    """
+    try:
+        if _SYSTEM == "Windows":
+            return _win32()[0].GetClipboardSequenceNumber()
+        if _SYSTEM == "Darwin":
+            pasteboard = _macos_pasteboard()
+            return pasteboard.changeCount() if pasteboard is not None else None
+    except Exception:
+        pass
+    return None
+
+
+def _wait_for_clipboard_change(before: int | None, timeout: float = 0.1):
+    """Wait until the clipboard changes from before, at most timeout seconds.
+
+    Without a change counter this just sleeps for the whole timeout.
+    """
+    if before is None:
+        time.sleep(timeout)
+        return
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if _clipboard_change_count() != before:
+            return
+        time.sleep(0.002)
+
+
+def _open_clipboard_win32(user32):
+    """Open the clipboard, retrying briefly while another app holds it."""
+    for _ in range(10):
+        if user32.OpenClipboard(None):
+            return
+        time.sleep(0.01)
+    raise ctypes.WinError(ctypes.get_last_error())
+
 
 class ClipboardManager:
     """Cross-platform clipboard operations."""
 
     def __init__(self):
-        self._system = platform.system()
+        self._system = _SYSTEM
 
     def get_clipboard(self) -> str:
         """Get current clipboard content."""
@@ -37,6 +222,71 @@ class ClipboardManager:
             pass
 
     def _get_clipboard_windows(self) -> str:
+        """Get clipboard on Windows, through the Win32 API if possible."""
+        try:
+            return self._get_clipboard_win32()
+        except OSError:
+            return self._get_clipboard_powershell()
+
+    def _set_clipboard_windows(self, text: str):
+        """Set clipboard on Windows, through the Win32 API if possible."""
+        try:
+            self._set_clipboard_win32(text)
+        except OSError:
+            self._set_clipboard_powershell(text)
+
+    def _get_clipboard_win32(self) -> str:
+        """Get clipboard text with the Win32 clipboard API."""
+        user32, kernel32 = _win32()
+        _open_clipboard_win32(user32)
+        try:
+            handle = user32.GetClipboardData(CF_UNICODETEXT)
+            if not handle:
+                return ""
+            data = kernel32.GlobalLock(handle)
+            if not data:
+                return ""
+            try:
+                return ctypes.wstring_at(data)
+            finally:
+                kernel32.GlobalUnlock(handle)
+        finally:
+            user32.CloseClipboard()
+
+    def _set_clipboard_win32(self, text: str):
+        """Set clipboard text with the Win32 clipboard API."""
+        user32, kernel32 = _win32()
+
+        # Copy the NUL-terminated UTF-16 text into movable global memory,
+        # which the clipboard takes ownership of on success
+        data = (text + "\0").encode("utf-16-le")
+        handle = None
+        if text:
+            handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+            if not handle:
+                raise ctypes.WinError(ctypes.get_last_error())
+            locked = kernel32.GlobalLock(handle)
+            if not locked:
+                kernel32.GlobalFree(handle)
+                raise ctypes.WinError(ctypes.get_last_error())
+            ctypes.memmove(locked, data, len(data))
+            kernel32.GlobalUnlock(handle)
+
+        try:
+            _open_clipboard_win32(user32)
+        except OSError:
+            if handle:
+                kernel32.GlobalFree(handle)
+            raise
+        try:
+            user32.EmptyClipboard()
+            if handle and not user32.SetClipboardData(CF_UNICODETEXT, handle):
+                kernel32.GlobalFree(handle)
+                raise ctypes.WinError(ctypes.get_last_error())
+        finally:
+            user32.CloseClipboard()
+
+    def _get_clipboard_powershell(self) -> str:
         """Get clipboard on Windows using PowerShell."""
         result = subprocess.run(
             ["powershell.exe", "-Command", "Get-Clipboard"],
@@ -46,7 +296,7 @@ class ClipboardManager:
         )
         return result.stdout.strip() if result.returncode == 0 else ""
 
-    def _set_clipboard_windows(self, text: str):
+    def _set_clipboard_powershell(self, text: str):
         """Set clipboard on Windows using PowerShell."""
         # Escape special characters for PowerShell
         escaped = text.replace("'", "''")
@@ -138,19 +388,20 @@ def get_selected_text() -> str:
     reads the clipboard, and restores the original content.
     """
     clipboard = ClipboardManager()
-    system = platform.system()
 
     # Save current clipboard
     original = clipboard.get_clipboard()
 
-    # Clear clipboard
-    clipboard.set_clipboard("")
+    # Clear clipboard, unless it's already empty
+    if original:
+        clipboard.set_clipboard("")
+    change_count = _clipboard_change_count()
 
     # Simulate Ctrl+C to copy selection
     try:
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             _simulate_copy_windows()
-        elif system == "Darwin":
+        elif _SYSTEM == "Darwin":
             _simulate_copy_macos()
         else:
             _simulate_copy_linux()
@@ -159,48 +410,46 @@ def get_selected_text() -> str:
         clipboard.set_clipboard(original)
         return ""
 
-    # Small delay for clipboard to update
-    time.sleep(0.1)
+    # Wait for the copy to land on the clipboard, up to 100 ms
+    _wait_for_clipboard_change(change_count)
 
     # Get the copied text
     selected = clipboard.get_clipboard()
 
-    # Restore original clipboard
-    clipboard.set_clipboard(original)
+    # Restore original clipboard, unless the copy left it unchanged
+    if selected != original:
+        clipboard.set_clipboard(original)
 
     return selected
 
 
 def _simulate_copy_windows():
     """Simulate Ctrl+C on Windows."""
-    try:
-        # Try using pynput if available
-        from pynput.keyboard import Controller, Key
-        keyboard = Controller()
-        keyboard.press(Key.ctrl)
-        keyboard.press('c')
-        keyboard.release('c')
-        keyboard.release(Key.ctrl)
-    except ImportError:
-        # Fall back to PowerShell
-        subprocess.run(
-            ["powershell.exe", "-Command",
-             "[System.Windows.Forms.SendKeys]::SendWait('^c')"],
-            capture_output=True,
-            timeout=5,
-        )
+    if not _press_copy():
+        # Fall back to injecting the keystrokes with SendInput
+        _send_copy_win32()
+
+
+def _send_copy_win32():
+    """Send Ctrl+C through the Win32 SendInput API."""
+    user32, _ = _win32()
+    inputs = (_INPUT * 4)()
+    for i, (vk, flags) in enumerate((
+        (VK_CONTROL, 0),
+        (VK_C, 0),
+        (VK_C, KEYEVENTF_KEYUP),
+        (VK_CONTROL, KEYEVENTF_KEYUP),
+    )):
+        inputs[i].type = INPUT_KEYBOARD
+        inputs[i].ki.wVk = vk
+        inputs[i].ki.dwFlags = flags
+    if user32.SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT)) != len(inputs):
+        raise ctypes.WinError(ctypes.get_last_error())
 
 
 def _simulate_copy_macos():
     """Simulate Cmd+C on macOS."""
-    try:
-        from pynput.keyboard import Controller, Key
-        keyboard = Controller()
-        keyboard.press(Key.cmd)
-        keyboard.press('c')
-        keyboard.release('c')
-        keyboard.release(Key.cmd)
-    except ImportError:
+    if not _press_copy():
         subprocess.run(
             ["osascript", "-e",
              'tell application "System Events" to keystroke "c" using command down'],
@@ -211,14 +460,7 @@ def _simulate_copy_macos():
 
 def _simulate_copy_linux():
     """Simulate Ctrl+C on Linux."""
-    try:
-        from pynput.keyboard import Controller, Key
-        keyboard = Controller()
-        keyboard.press(Key.ctrl)
-        keyboard.press('c')
-        keyboard.release('c')
-        keyboard.release(Key.ctrl)
-    except ImportError:
+    if not _press_copy():
         # Try xdotool
         subprocess.run(
             ["xdotool", "key", "ctrl+c"],
@@ -8,12 +8,148 @@ to do reliably across all applications, it uses multiple strategies:
 2. Fallback: Use mouse cursor position (less accurate but always works)
 """
 
+import atexit
+import ctypes
+import ctypes.util
+import functools
+import importlib
 import logging
 import platform
+import threading
+from ctypes import wintypes
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# The OS can't change while the app runs
+_SYSTEM = platform.system()
+
+# Xlib calls on one display connection must not interleave between threads
+_x11_lock = threading.Lock()
+
+
+class _GUITHREADINFO(ctypes.Structure):
+    """Win32 GUITHREADINFO, filled in by GetGUIThreadInfo."""
+
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("hwndActive", wintypes.HWND),
+        ("hwndFocus", wintypes.HWND),
+        ("hwndCapture", wintypes.HWND),
+        ("hwndMenuOwner", wintypes.HWND),
+        ("hwndMoveSize", wintypes.HWND),
+        ("hwndCaret", wintypes.HWND),
+        ("rcCaret", wintypes.RECT),
+    ]
+
+
+@functools.cache
+def _optional_import(name: str):
+    """Import an optional dependency once.
+
+    Returns:
+        The module, or None if it isn't installed - remembered, so a missing
+        module costs one failed import rather than one per query
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+@functools.cache
+def _user32():
+    """Load user32 with the prototypes used here (Windows only).
+
+    Loaded once so each query is a plain foreign call; restype is set so
+    window handles aren't truncated to a C int on 64-bit Windows.
+    """
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+    user32.GetGUIThreadInfo.argtypes = [wintypes.DWORD, ctypes.POINTER(_GUITHREADINFO)]
+    user32.GetGUIThreadInfo.restype = wintypes.BOOL
+    user32.ClientToScreen.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.POINT)]
+    user32.ClientToScreen.restype = wintypes.BOOL
+    user32.GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+    user32.GetCursorPos.restype = wintypes.BOOL
+    user32.GetForegroundWindow.argtypes = []
+    user32.GetForegroundWindow.restype = wintypes.HWND
+    user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+    user32.GetWindowTextLengthW.restype = ctypes.c_int
+    user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    user32.GetWindowTextW.restype = ctypes.c_int
+
+    return user32
+
+
+@functools.cache
+def _x11():
+    """Open one X display through libX11 for pointer queries (Linux only).
+
+    The connection stays open for the life of the process instead of a new
+    socket handshake with the X server per query.
+
+    Returns:
+        Tuple of (libX11, display, root window), or None without libX11 or
+        an X server
+    """
+    name = ctypes.util.find_library("X11") or "libX11.so.6"
+    try:
+        xlib = ctypes.CDLL(name)
+    except OSError:
+        return None
+
+    xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    xlib.XOpenDisplay.restype = ctypes.c_void_p
+    xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+    xlib.XCloseDisplay.restype = ctypes.c_int
+    xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+    xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+    xlib.XQueryPointer.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_ulong,
+        ctypes.POINTER(ctypes.c_ulong),
+        ctypes.POINTER(ctypes.c_ulong),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_uint),
+    ]
+    xlib.XQueryPointer.restype = ctypes.c_int
+
+    display = xlib.XOpenDisplay(None)
+    if not display:
+        return None
+    atexit.register(xlib.XCloseDisplay, display)
+    return xlib, display, xlib.XDefaultRootWindow(display)
+
+
+def _query_x11_pointer() -> tuple[int, int] | None:
+    """Return the pointer's root-window coordinates from libX11, or None."""
+    x11 = _x11()
+    if x11 is None:
+        return None
+    xlib, display, root = x11
+
+    root_return = ctypes.c_ulong()
+    child_return = ctypes.c_ulong()
+    root_x, root_y = ctypes.c_int(), ctypes.c_int()
+    win_x, win_y = ctypes.c_int(), ctypes.c_int()
+    mask = ctypes.c_uint()
+    with _x11_lock:
+        found = xlib.XQueryPointer(
+            display, root,
+            ctypes.byref(root_return), ctypes.byref(child_return),
+            ctypes.byref(root_x), ctypes.byref(root_y),
+            ctypes.byref(win_x), ctypes.byref(win_y),
+            ctypes.byref(mask),
+        )
+    if not found:
+        return None
+    return root_x.value, root_y.value
+
 
 @dataclass
 class CursorPosition:
@@ -36,9 +172,7 @@ def get_cursor_position() -> CursorPosition:
     Returns:
         CursorPosition with screen coordinates
     """
-    system = platform.system()
-
-    if system == "Windows":
+    if _SYSTEM == "Windows":
         pos = _get_windows_caret_position()
         if pos:
             return pos
@@ -53,56 +187,40 @@ def _get_windows_caret_position() -> CursorPosition | None:
     Returns:
         CursorPosition if successful, None otherwise
     """
+    # Every failure below is reported through a return value - no caret is
+    # the common case, so it's handled without raising
     try:
-        import ctypes
-        from ctypes import wintypes
-
-        user32 = ctypes.windll.user32
-
-        # Define GUITHREADINFO structure
-        class GUITHREADINFO(ctypes.Structure):
-            _fields_ = [
-                ("cbSize", wintypes.DWORD),
-                ("flags", wintypes.DWORD),
-                ("hwndActive", wintypes.HWND),
-                ("hwndFocus", wintypes.HWND),
-                ("hwndCapture", wintypes.HWND),
-                ("hwndMenuOwner", wintypes.HWND),
-                ("hwndMoveSize", wintypes.HWND),
-                ("hwndCaret", wintypes.HWND),
-                ("rcCaret", wintypes.RECT),
-            ]
-
-        # Get GUI thread info for foreground thread (0 = current foreground)
-        gui_info = GUITHREADINFO()
-        gui_info.cbSize = ctypes.sizeof(GUITHREADINFO)
-
-        if not user32.GetGUIThreadInfo(0, ctypes.byref(gui_info)):
-            logger.debug("GetGUIThreadInfo failed")
-            return None
+        user32 = _user32()
+    except OSError as e:
+        logger.debug("Could not load user32: %s", e)
+        return None
 
-        # Check if we have a caret window
-        if not gui_info.hwndCaret:
-            logger.debug("No caret window found")
-            return None
+    # Get GUI thread info for foreground thread (0 = current foreground)
+    gui_info = _GUITHREADINFO()
+    gui_info.cbSize = ctypes.sizeof(_GUITHREADINFO)
 
-        # Get caret position (bottom-left of caret for popup positioning)
-        point = wintypes.POINT()
-        point.x = gui_info.rcCaret.left
-        point.y = gui_info.rcCaret.bottom
+    if not user32.GetGUIThreadInfo(0, ctypes.byref(gui_info)):
+        logger.debug("GetGUIThreadInfo failed (error %d)", ctypes.get_last_error())
+        return None
 
-        # Convert client coordinates to screen coordinates
-        if not user32.ClientToScreen(gui_info.hwndCaret, ctypes.byref(point)):
-            logger.debug("ClientToScreen failed")
-            return None
+    # Check if we have a caret window
+    if not gui_info.hwndCaret:
+        logger.debug("No caret window found")
+        return None
 
-        logger.debug(f"Got caret position: ({point.x}, {point.y})")
-        return CursorPosition(point.x, point.y, is_caret=True)
+    # Get caret position (bottom-left of caret for popup positioning)
+    point = wintypes.POINT()
+    point.x = gui_info.rcCaret.left
+    point.y = gui_info.rcCaret.bottom
 
-    except Exception as e:
-        logger.debug(f"Windows caret detection failed: {e}")
+    # Convert client coordinates to screen coordinates
+    if not user32.ClientToScreen(gui_info.hwndCaret, ctypes.byref(point)):
+        logger.debug("ClientToScreen failed (error %d)", ctypes.get_last_error())
         return None
 
+    logger.debug("Got caret position: (%d, %d)", point.x, point.y)
+    return CursorPosition(point.x, point.y, is_caret=True)
+
 
 def _get_mouse_position() -> CursorPosition:
     """Get mouse cursor position as fallback.
@@ -110,55 +228,40 @@ def _get_mouse_position() -> CursorPosition:
     Returns:
         CursorPosition with mouse coordinates
     """
-    try:
-        # Try using Qt if available (more reliable cross-platform)
-        from PySide6.QtGui import QCursor
-
-        pos = QCursor.pos()
-        logger.debug(f"Using mouse position (Qt): ({pos.x()}, {pos.y()})")
+    # Try using Qt if available (more reliable cross-platform)
+    qtgui = _optional_import("PySide6.QtGui")
+    if qtgui is not None:
+        pos = qtgui.QCursor.pos()
+        logger.debug("Using mouse position (Qt): (%d, %d)", pos.x(), pos.y())
         return CursorPosition(pos.x(), pos.y(), is_caret=False)
-    except ImportError:
-        pass
 
     # Fallback to platform-specific methods
-    system = platform.system()
-
-    if system == "Windows":
+    if _SYSTEM == "Windows":
+        point = wintypes.POINT()
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            class POINT(ctypes.Structure):
-                _fields_ = [("x", wintypes.LONG), ("y", wintypes.LONG)]
-
-            point = POINT()
-            ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
-            logger.debug(f"Using mouse position (Win32): ({point.x}, {point.y})")
+            found = _user32().GetCursorPos(ctypes.byref(point))
+        except OSError as e:
+            logger.debug("Could not load user32: %s", e)
+            found = False
+        if found:
+            logger.debug("Using mouse position (Win32): (%d, %d)", point.x, point.y)
             return CursorPosition(point.x, point.y, is_caret=False)
-        except Exception as e:
-            logger.debug(f"Win32 mouse position failed: {e}")
+        logger.debug("Win32 mouse position failed (error %d)", ctypes.get_last_error())
 
-    elif system == "Darwin":
+    elif _SYSTEM == "Darwin" and (quartz := _optional_import("Quartz")) is not None:
         try:
-            from Quartz import CGEventGetLocation, CGEventCreate
-
-            event = CGEventCreate(None)
-            pos = CGEventGetLocation(event)
-            logger.debug(f"Using mouse position (macOS): ({pos.x}, {pos.y})")
+            event = quartz.CGEventCreate(None)
+            pos = quartz.CGEventGetLocation(event)
+            logger.debug("Using mouse position (macOS): (%s, %s)", pos.x, pos.y)
             return CursorPosition(int(pos.x), int(pos.y), is_caret=False)
         except Exception as e:
-            logger.debug(f"macOS mouse position failed: {e}")
+            logger.debug("macOS mouse position failed: %s", e)
 
-    elif system == "Linux":
-        try:
-            from Xlib import display
-
-            d = display.Display()
-            data = d.screen().root.query_pointer()._data
-            logger.debug(f"Using mouse position (X11): ({data['root_x']}, {data['root_y']})")
-            return CursorPosition(data["root_x"], data["root_y"], is_caret=False)
-        except Exception as e:
-            logger.debug(f"X11 mouse position failed: {e}")
+    elif _SYSTEM == "Linux":
+        pointer = _query_x11_pointer()
+        if pointer is not None:
+            logger.debug("Using mouse position (libX11): %s", pointer)
+            return CursorPosition(pointer[0], pointer[1], is_caret=False)
 
     # Ultimate fallback - center of screen
     logger.warning("Could not get cursor position, using screen center")
@@ -171,14 +274,9 @@ def get_active_window_info() -> dict | None:
     Returns:
         Dict with 'title', 'process', etc. or None if unavailable
     """
-    system = platform.system()
-
-    if system == "Windows":
+    if _SYSTEM == "Windows":
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            user32 = ctypes.windll.user32
+            user32 = _user32()
 
             # Get foreground window
             hwnd = user32.GetForegroundWindow()
@@ -195,7 +293,7 @@ def get_active_window_info() -> dict | None:
                 "title": buffer.value,
             }
         except Exception as e:
-            logger.debug(f"Could not get window info: {e}")
+            logger.debug("Could not get window info: %s", e)
             return None
 
     return None
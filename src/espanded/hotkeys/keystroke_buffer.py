@@ -3,15 +3,24 @@
 import logging
 import threading
 import time
-from dataclasses import dataclass, field
-from typing import Callable
+from collections import deque
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Seconds of typing pause before on_trigger_updated reports the filter text,
+# so a burst of keystrokes costs one update
+UPDATE_DEBOUNCE = 0.03
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TriggerMatch:
-    """Represents a detected trigger match."""
+    """Represents a detected trigger match.
+
+    Immutable, since each one is handed to a callback on another thread.
+    """
 
     trigger: str  # The trigger character(s) that were typed
     filter_text: str  # Text typed after the trigger
@@ -23,6 +32,90 @@ class TriggerMatch:
         return f"{self.trigger}{self.filter_text}"
 
 
+class _TriggerAutomaton:
+    """Aho-Corasick automaton over the trigger strings.
+
+    Fed one character at a time, it tracks the longest suffix of the typed
+    text that starts some trigger, so checking for a completed trigger is
+    amortized O(1) per keystroke however many triggers there are.
+    """
+
+    __slots__ = ("_goto", "_fail", "_output", "max_length")
+
+    def __init__(self, triggers: Collection[str]):
+        """Build the trie and its failure links.
+
+        Args:
+            triggers: Trigger strings to detect; empty strings are ignored
+        """
+        # State 0 is the root; _goto[state] maps a character to the next state
+        goto: list[dict[str, int]] = [{}]
+        output: list[str | None] = [None]
+        for trigger in triggers:
+            if not trigger:
+                continue
+            state = 0
+            for char in trigger:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    output.append(None)
+                state = nxt
+            output[state] = trigger
+
+        # Breadth-first, so a state's failure target (a shorter string) is
+        # finished before the state itself
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # The longest trigger ending here is this state's own, or else
+            # the longest one ending at its failure state
+            if output[state] is None:
+                output[state] = output[fail[state]]
+            for char, nxt in goto[state].items():
+                f = fail[state]
+                while f and char not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(char, 0)
+                queue.append(nxt)
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+        # A state stands for at most this many trailing characters, so
+        # reading only that tail of a text reaches the same state
+        self.max_length = max((len(t) for t in triggers if t), default=0)
+
+    def step(self, state: int, char: str) -> int:
+        """Return the state after reading char in state."""
+        goto = self._goto
+        while True:
+            nxt = goto[state].get(char)
+            if nxt is not None:
+                return nxt
+            if not state:
+                return 0
+            state = self._fail[state]
+
+    def run(self, chars: Iterable[str]) -> int:
+        """Return the state after reading chars from the start."""
+        state = 0
+        for char in chars:
+            state = self.step(state, char)
+        return state
+
+    def run_tail(self, text: str) -> int:
+        """Return the state after reading text, reading only the part that matters."""
+        return self.run(text[max(0, len(text) - self.max_length):])
+
+    def match(self, state: int) -> str | None:
+        """Return the longest trigger the text read so far ends with, if any."""
+        return self._output[state]
+
+
 class KeystrokeBuffer:
     """Tracks typed characters and detects trigger patterns.
 
@@ -57,14 +150,34 @@ class KeystrokeBuffer:
         self.on_trigger_cancelled = on_trigger_cancelled
         self.buffer_timeout = buffer_timeout
 
-        self._buffer: list[str] = []
+        # Typed text, kept as one string so reading it back doesn't join
+        self._buffer_str = ""
+        self._automaton = _TriggerAutomaton(self.triggers)
+        self._ac_state = 0  # automaton state after reading the buffer
         self._active_trigger: str | None = None
         self._filter_start_idx: int = 0
-        self._last_keystroke_time: float = 0
         self._lock = threading.Lock()
 
-        # Timer for timeout-based clearing
-        self._timeout_timer: threading.Timer | None = None
+        # One thread for timeout-based clearing and the debounced update: it
+        # waits on the lock's condition until the earlier monotonic deadline.
+        # _deadline is None while the buffer is empty, _update_deadline while
+        # no update is pending
+        self._deadline: float | None = None
+        self._update_deadline: float | None = None
+        self._deadline_cv = threading.Condition(self._lock)
+        self._closed = False
+        self._timeout_thread = threading.Thread(
+            target=self._watch_timeout, name="espanded-buffer-timeout", daemon=True
+        )
+        self._timeout_thread.start()
+
+        # One worker, so callbacks run in the order they were scheduled
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="espanded-keystroke"
+        )
+        # [match] of the update callback still waiting on the worker, which
+        # later updates overwrite instead of queueing another; None if none waits
+        self._queued_update: list[TriggerMatch] | None = None
 
     @property
     def is_active(self) -> bool:
@@ -78,12 +191,7 @@ class KeystrokeBuffer:
             return None
 
         with self._lock:
-            filter_text = "".join(self._buffer[self._filter_start_idx:])
-            return TriggerMatch(
-                trigger=self._active_trigger,
-                filter_text=filter_text,
-                total_chars=len(self._buffer),
-            )
+            return self._current_match_locked()
 
     def add_character(self, char: str):
         """Add a typed character to the buffer.
@@ -92,60 +200,54 @@ class KeystrokeBuffer:
             char: The character that was typed
         """
         with self._lock:
-            self._last_keystroke_time = time.time()
-            self._reset_timeout_timer()
+            # The listener can still deliver keys while close() tears down
+            if self._closed:
+                return
+            self._reset_timeout()
 
             # Add to buffer
-            self._buffer.append(char)
-            buffer_str = "".join(self._buffer)
+            self._buffer_str += char
+            for c in char:
+                self._ac_state = self._automaton.step(self._ac_state, c)
 
-            # Check if we just completed a trigger
+            # Check if we just completed a trigger - the longest one wins
             if not self._active_trigger:
-                for trigger in sorted(self.triggers, key=len, reverse=True):
-                    if buffer_str.endswith(trigger):
-                        self._active_trigger = trigger
-                        self._filter_start_idx = len(self._buffer)
-                        logger.debug(f"Trigger detected: {trigger}")
-
-                        if self.on_trigger_detected:
-                            match = TriggerMatch(
-                                trigger=trigger,
-                                filter_text="",
-                                total_chars=len(self._buffer),
-                            )
-                            self._schedule_callback(self.on_trigger_detected, match)
-                        return
+                trigger = self._automaton.match(self._ac_state)
+                if trigger:
+                    self._active_trigger = trigger
+                    self._filter_start_idx = len(self._buffer_str)
+                    logger.debug("Trigger detected: %s", trigger)
+
+                    if self.on_trigger_detected:
+                        match = TriggerMatch(
+                            trigger=trigger,
+                            filter_text="",
+                            total_chars=len(self._buffer_str),
+                        )
+                        self._schedule_callback(self.on_trigger_detected, match)
+                    return
             else:
                 # Trigger is active, update filter text
-                if self.on_trigger_updated:
-                    match = self.current_match
-                    if match:
-                        self._schedule_callback(self.on_trigger_updated, match)
+                self._schedule_update()
 
     def handle_backspace(self):
         """Handle backspace key - remove last character."""
         with self._lock:
-            if not self._buffer:
+            if not self._buffer_str:
                 return
 
-            self._buffer.pop()
-            self._last_keystroke_time = time.time()
-            self._reset_timeout_timer()
+            self._buffer_str = self._buffer_str[:-1]
+            # Replaying the tail is cheaper than keeping a state history
+            self._ac_state = self._automaton.run_tail(self._buffer_str)
+            self._reset_timeout()
 
-            # Check if we deleted back past the trigger
+            # The trigger ends where the filter text starts, so deleting
+            # below that point deleted part of the trigger
             if self._active_trigger:
-                if len(self._buffer) < len(self._active_trigger):
-                    # Deleted the trigger itself
+                if len(self._buffer_str) < self._filter_start_idx:
                     self._cancel_trigger()
-                elif len(self._buffer) < self._filter_start_idx:
-                    # Shouldn't happen, but handle it
-                    self._filter_start_idx = len(self._buffer)
                 else:
-                    # Still have filter text, update
-                    if self.on_trigger_updated:
-                        match = self.current_match
-                        if match:
-                            self._schedule_callback(self.on_trigger_updated, match)
+                    self._schedule_update()
 
     def handle_cancel(self):
         """Handle cancel keys (Escape, etc.) - cancel any active trigger."""
@@ -171,7 +273,7 @@ class KeystrokeBuffer:
             if not self._active_trigger:
                 return None
 
-            match = self.current_match
+            match = self._current_match_locked()
             self._active_trigger = None
             self._filter_start_idx = 0
             self._clear_buffer()
@@ -191,67 +293,138 @@ class KeystrokeBuffer:
             triggers: New list of triggers
         """
         with self._lock:
+            # Called on every settings change, which mostly leaves the
+            # triggers alone
+            if tuple(triggers) == tuple(self.triggers):
+                return
             self.triggers = triggers
+            self._automaton = _TriggerAutomaton(triggers)
+            self._ac_state = self._automaton.run_tail(self._buffer_str)
             # If current trigger is no longer valid, cancel it
             if self._active_trigger and self._active_trigger not in triggers:
                 self._cancel_trigger()
                 self._clear_buffer()
 
+    def _current_match_locked(self) -> TriggerMatch | None:
+        """Get the current trigger match, if active (must hold lock)."""
+        if not self._active_trigger:
+            return None
+
+        return TriggerMatch(
+            trigger=self._active_trigger,
+            filter_text=self._buffer_str[self._filter_start_idx:],
+            total_chars=len(self._buffer_str),
+        )
+
     def _clear_buffer(self):
         """Clear the internal buffer (must hold lock)."""
-        self._buffer.clear()
+        self._buffer_str = ""
+        self._ac_state = 0
         self._filter_start_idx = 0
-        self._cancel_timeout_timer()
+        self._deadline = None
+        self._update_deadline = None
 
     def _cancel_trigger(self):
         """Cancel the active trigger (must hold lock)."""
-        logger.debug(f"Trigger cancelled: {self._active_trigger}")
+        logger.debug("Trigger cancelled: %s", self._active_trigger)
         self._active_trigger = None
         self._filter_start_idx = 0
+        self._update_deadline = None
 
         if self.on_trigger_cancelled:
             self._schedule_callback(self.on_trigger_cancelled)
 
-    def _reset_timeout_timer(self):
-        """Reset the timeout timer (must hold lock)."""
-        self._cancel_timeout_timer()
+    def _reset_timeout(self):
+        """Restart the inactivity timeout (must hold lock)."""
+        # A thread already waiting for a deadline rechecks it when it wakes,
+        # so only an unarmed one needs waking
+        if self._deadline is None:
+            self._deadline_cv.notify()
+        self._deadline = time.monotonic() + self.buffer_timeout
 
-        def on_timeout():
-            with self._lock:
-                if time.time() - self._last_keystroke_time >= self.buffer_timeout:
+    def _watch_timeout(self):
+        """Send debounced updates and clear the buffer once it goes idle.
+
+        The buffer clears after buffer_timeout without a keystroke. Runs on the buffer's one timeout thread until close().
+        """
+        with self._deadline_cv:
+            while not self._closed:
+                now = time.monotonic()
+                if self._update_deadline is not None and self._update_deadline <= now:
+                    self._update_deadline = None
+                    # The match is taken now, so it has every keystroke of the burst
+                    match = self._current_match_locked()
+                    if match:
+                        self._queue_update(match)
+                    continue
+                if self._deadline is not None and self._deadline <= now:
                     logger.debug("Buffer timeout - clearing")
                     if self._active_trigger:
                         self._cancel_trigger()
                     self._clear_buffer()
+                    continue
+
+                pending = [d for d in (self._deadline, self._update_deadline) if d is not None]
+                self._deadline_cv.wait(min(pending) - now if pending else None)
 
-        self._timeout_timer = threading.Timer(self.buffer_timeout, on_timeout)
-        self._timeout_timer.daemon = True
-        self._timeout_timer.start()
+    def _schedule_update(self):
+        """Report the match once typing pauses for UPDATE_DEBOUNCE (must hold lock)."""
+        if not self.on_trigger_updated or self._closed:
+            return
 
-    def _cancel_timeout_timer(self):
-        """Cancel the timeout timer (must hold lock)."""
-        if self._timeout_timer:
-            self._timeout_timer.cancel()
-            self._timeout_timer = None
+        # As in _reset_timeout, a pushed-back deadline is rechecked on waking
+        if self._update_deadline is None:
+            self._deadline_cv.notify()
+        self._update_deadline = time.monotonic() + UPDATE_DEBOUNCE
+
+    def _queue_update(self, match: TriggerMatch):
+        """Schedule on_trigger_updated, merging with one still waiting (must hold lock).
+
+        A slow callback therefore never backs up more than one update, and the
+        update that does run carries the latest match.
+        """
+        slot = self._queued_update
+        if slot is not None:
+            slot[0] = match
+            return
+
+        slot = self._queued_update = [match]
+
+        def run_update():
+            with self._lock:
+                if self._queued_update is slot:
+                    self._queued_update = None
+                latest = slot[0]
+            self._run_callback(self.on_trigger_updated, latest)
+
+        self._executor.submit(run_update)
 
     def _schedule_callback(self, callback: Callable, *args):
-        """Schedule a callback to run outside the lock.
+        """Schedule a callback to run outside the lock (must hold lock).
 
         This prevents deadlocks if callbacks try to access the buffer.
+        Unlike updates, these are never merged or dropped.
         """
-        # Run callback in a separate thread to avoid blocking
-        def run_callback():
-            try:
-                callback(*args)
-            except Exception as e:
-                logger.error(f"Error in keystroke buffer callback: {e}")
-
-        thread = threading.Thread(target=run_callback, daemon=True)
-        thread.start()
+        # Updates after this callback must run after it, not merge into one before
+        self._queued_update = None
+        # Run callback on the worker thread to avoid blocking
+        self._executor.submit(self._run_callback, callback, *args)
+
+    @staticmethod
+    def _run_callback(callback: Callable, *args):
+        """Call a callback on the worker thread, logging its errors."""
+        try:
+            callback(*args)
+        except Exception as e:
+            logger.error("Error in keystroke buffer callback: %s", e)
 
     def close(self):
         """Clean up resources."""
         with self._lock:
-            self._cancel_timeout_timer()
+            self._closed = True
             self._clear_buffer()
             self._active_trigger = None
+            self._deadline_cv.notify()
+        self._timeout_thread.join()
+        # Callbacks already queued still run
+        self._executor.shutdown(wait=False)
@@ -2,8 +2,13 @@
 
 import logging
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Callable
 
+from espanded.hotkeys import DEFAULT_HOTKEY
+
 # pynput is required
 try:
     from pynput import keyboard
@@ -17,10 +22,20 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-# Default hotkey (using 'e' instead of backtick - backtick has issues on Windows)
-DEFAULT_HOTKEY = "<ctrl>+<alt>+e"
+# Runs hotkey callbacks off the listener thread; its threads start on the
+# first hotkey press and are reused for later ones
+_callback_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="espanded-hotkey")
+
+# Seconds HotkeyListener waits for further register/unregister calls before
+# restarting, so a batch of changes costs one restart
+RESTART_DELAY = 0.05
 
+# Keystrokes waiting for KeystrokeMonitor's callback; past this the oldest
+# are dropped
+KEYSTROKE_QUEUE_SIZE = 1024
 
+
+@lru_cache(maxsize=256)
 def normalize_hotkey(hotkey_string: str) -> str:
     """Normalize hotkey string to pynput format.
 
@@ -146,10 +161,19 @@ class HotkeyListener:
             )
 
         self._hotkeys: dict[str, Callable] = {}
+        # The same hotkeys mapped to their wrapped callbacks, kept so a
+        # restart hands them straight to GlobalHotKeys
+        self._wrapped: dict[str, Callable] = {}
         self._listener = None
         self._running = False
         self._enabled = True
 
+        # Set when hotkeys change while running; the pending restart timer
+        # picks up every change made before it fires
+        self._dirty = False
+        self._restart_timer: threading.Timer | None = None
+        self._restart_lock = threading.Lock()
+
     def register(self, hotkey_string: str, callback: Callable):
         """Register a hotkey callback.
 
@@ -158,19 +182,24 @@ class HotkeyListener:
             callback: Function to call when hotkey is pressed
         """
         normalized = normalize_hotkey(hotkey_string)
+        if self._hotkeys.get(normalized) == callback:
+            # Already registered - nothing to restart for
+            return
         self._hotkeys[normalized] = callback
+        self._wrapped[normalized] = self._wrap_callback(callback)
 
         # If already running, restart to pick up new hotkey
         if self._running:
-            self._restart()
+            self._schedule_restart()
 
     def unregister(self, hotkey_string: str):
         """Unregister a hotkey."""
         normalized = normalize_hotkey(hotkey_string)
         if normalized in self._hotkeys:
             del self._hotkeys[normalized]
+            del self._wrapped[normalized]
             if self._running:
-                self._restart()
+                self._schedule_restart()
 
     def start(self):
         """Start listening for hotkeys."""
@@ -194,29 +223,57 @@ class HotkeyListener:
             finally:
                 self._listener = None
 
+    def apply(self):
+        """Restart now if hotkeys changed since the listener started.
+
+        Called by the pending restart timer; call it directly to skip the wait.
+        """
+        with self._restart_lock:
+            if self._restart_timer:
+                self._restart_timer.cancel()
+                self._restart_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            if self._running:
+                self._restart()
+
+    def _schedule_restart(self):
+        """Restart in RESTART_DELAY seconds unless a restart is already pending."""
+        with self._restart_lock:
+            self._dirty = True
+            if self._restart_timer is None:
+                self._restart_timer = threading.Timer(RESTART_DELAY, self.apply)
+                self._restart_timer.daemon = True
+                self._restart_timer.start()
+
     def _restart(self):
         """Restart the listener with updated hotkeys."""
         self.stop()
         if self._hotkeys:
             self.start()
 
+    def _wrap_callback(self, cb: Callable) -> Callable:
+        """Wrap a hotkey callback to check enabled state and run off the listener thread."""
+        def run():
+            # The executor would keep the exception in a future nobody reads
+            try:
+                cb()
+            except Exception as e:
+                print(f"Error in hotkey callback: {e}")
+
+        def wrapper():
+            if self._enabled:
+                # Run on a pool thread to not block
+                _callback_executor.submit(run)
+        return wrapper
+
     def _create_listener(self):
         """Create the GlobalHotKeys listener."""
         if not self._hotkeys:
             return
 
-        # Create wrapper callbacks that check enabled state
-        def make_callback(cb):
-            def wrapper():
-                if self._enabled:
-                    # Run in separate thread to not block
-                    try:
-                        threading.Thread(target=cb, daemon=True).start()
-                    except Exception as e:
-                        print(f"Error in hotkey callback: {e}")
-            return wrapper
-
-        hotkey_map = {k: make_callback(v) for k, v in self._hotkeys.items()}
+        hotkey_map = self._wrapped
 
         try:
             self._listener = keyboard.GlobalHotKeys(hotkey_map)
@@ -257,6 +314,16 @@ class HotkeyListener:
         return self._running
 
 
+@lru_cache(maxsize=32)
+def _parse_hotkey(hotkey_string: str) -> tuple:
+    """Parse a normalized hotkey string into pynput keys (memoized).
+
+    Raises:
+        ValueError: If the hotkey string is invalid.
+    """
+    return tuple(keyboard.HotKey.parse(hotkey_string))
+
+
 def test_hotkey(hotkey_string: str) -> tuple[bool, str]:
     """Test if a hotkey can be registered.
 
@@ -273,7 +340,7 @@ def test_hotkey(hotkey_string: str) -> tuple[bool, str]:
 
     try:
         # Try to parse the hotkey
-        keyboard.HotKey.parse(normalized)
+        _parse_hotkey(normalized)
         return True, f"Hotkey '{display_hotkey(normalized)}' is valid"
     except Exception as e:
         return False, f"Invalid hotkey: {str(e)}"
@@ -326,6 +393,12 @@ class KeystrokeMonitor:
         self._running = False
         self._enabled = True
 
+        # pynput's thread only queues keystrokes; the consumer thread runs
+        # the callback, so a slow callback can't stall the keyboard hook
+        self._queue: deque = deque(maxlen=KEYSTROKE_QUEUE_SIZE)
+        self._queue_cv = threading.Condition()
+        self._consumer: threading.Thread | None = None
+
     def set_callback(self, on_key_press: Callable):
         """Set the key press callback.
 
@@ -343,32 +416,29 @@ class KeystrokeMonitor:
             if not self._enabled or not self._on_key_press:
                 return
 
-            try:
-                # Get the character if it's a printable key
-                char = None
-                if isinstance(key, KeyCode):
-                    if key.char:
-                        char = key.char
-                    elif key.vk is not None:
-                        # Try to get character from virtual key code
-                        # This handles some edge cases
-                        pass
-
-                self._on_key_press(key, char)
+            # Get the character if it's a printable key
+            char = None
+            if isinstance(key, KeyCode) and key.char:
+                char = key.char
 
-            except Exception as e:
-                logger.error(f"Error in keystroke callback: {e}")
+            self._queue.append((key, char))
+            with self._queue_cv:
+                self._queue_cv.notify()
 
         try:
             self._listener = keyboard.Listener(on_press=on_press)
             self._listener.start()
             self._running = True
+            self._consumer = threading.Thread(
+                target=self._deliver_keys, name="espanded-keystrokes", daemon=True
+            )
+            self._consumer.start()
             logger.info("Keystroke monitor started")
         except PermissionError as e:
-            logger.error(f"Permission error starting keystroke monitor: {e}")
+            logger.error("Permission error starting keystroke monitor: %s", e)
             self._listener = None
         except Exception as e:
-            logger.error(f"Error starting keystroke monitor: {e}")
+            logger.error("Error starting keystroke monitor: %s", e)
             self._listener = None
 
     def stop(self):
@@ -380,8 +450,35 @@ class KeystrokeMonitor:
             except Exception:
                 pass
             self._listener = None
+
+        consumer, self._consumer = self._consumer, None
+        if consumer:
+            with self._queue_cv:
+                self._queue_cv.notify()
+            # The callback itself may stop the monitor
+            if consumer is not threading.current_thread():
+                consumer.join()
+        self._queue.clear()
         logger.info("Keystroke monitor stopped")
 
+    def _deliver_keys(self):
+        """Pass queued keystrokes to the callback in order until stopped."""
+        while True:
+            with self._queue_cv:
+                self._queue_cv.wait_for(lambda: self._queue or not self._running)
+            if not self._running:
+                return
+
+            while self._queue and self._running:
+                key, char = self._queue.popleft()
+                callback = self._on_key_press
+                if callback is None:
+                    continue
+                try:
+                    callback(key, char)
+                except Exception as e:
+                    logger.error("Error in keystroke callback: %s", e)
+
     def enable(self):
         """Enable keystroke handling."""
         self._enabled = True
@@ -15,6 +15,9 @@ from typing import Callable
 
 logger = logging.getLogger(__name__)
 
+# The OS can't change while the app runs
+_SYSTEM = platform.system()
+
 
 class TextInserter:
     """Handles text insertion after autocomplete selection.
@@ -167,9 +170,7 @@ class TextInserter:
         if not self._controller:
             return
 
-        system = platform.system()
-
-        if system == "Darwin":
+        if _SYSTEM == "Darwin":
             # macOS: Cmd+V
             self._controller.press(self._Key.cmd)
             self._controller.press("v")
@@ -200,9 +201,7 @@ class TextInserter:
             pass
 
         # Platform-specific fallbacks
-        system = platform.system()
-
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             try:
                 import ctypes
 
@@ -244,9 +243,7 @@ class TextInserter:
             pass
 
         # Platform-specific fallbacks
-        system = platform.system()
-
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             try:
                 import ctypes
                 from ctypes import wintypes
@@ -275,7 +272,7 @@ class TextInserter:
             except Exception as e:
                 logger.debug(f"Win32 clipboard write failed: {e}")
 
-        elif system == "Darwin":
+        elif _SYSTEM == "Darwin":
             try:
                 import subprocess
 
@@ -286,7 +283,7 @@ class TextInserter:
             except Exception as e:
                 logger.debug(f"macOS clipboard write failed: {e}")
 
-        elif system == "Linux":
+        elif _SYSTEM == "Linux":
             try:
                 import subprocess
 
@@ -4,7 +4,6 @@ import sys
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 
 from espanded.app import create_app
 
@@ -25,30 +24,14 @@ def main():
     app.setOrganizationName("Espanded")
     app.setApplicationDisplayName("Espanded - Espanso GUI Manager")
 
-    # Create main window and initialize services
+    # Create main window and initialize services (also applies the global
+    # font and theme before any widget is built)
     main_window, services = create_app()
 
     if main_window is None:
         print("Failed to create main window - exiting")
         return 1
 
-    # Set global font
-    from PySide6.QtGui import QFontDatabase
-    font_families = QFontDatabase().families()
-    if "Lexend" in font_families:
-        app_font = QFont("Lexend")
-        app_font.setPointSize(10)
-        app.setFont(app_font)
-        print("✓ Lexend font applied globally")
-    else:
-        print("⚠ Lexend font not found in available families")
-
-    # Apply theme to application
-    from espanded.core.app_state import get_app_state
-    app_state = get_app_state()
-    if app_state.theme_manager:
-        app_state.theme_manager.apply_to_app(app)
-
     # Show the main window
     main_window.show()
 
@@ -1,11 +1,24 @@
 """Application services for Espanded."""
 
-from espanded.services.hotkey_service import HotkeyService, get_hotkey_service
-from espanded.services.autocomplete_service import (
-    AutocompleteService,
-    get_autocomplete_service,
-    init_autocomplete_service,
-)
+from typing import TYPE_CHECKING
+
+from espanded._lazy import make_lazy_getattr
+
+if TYPE_CHECKING:
+    from espanded.services.autocomplete_service import (
+        AutocompleteService,
+        get_autocomplete_service,
+        init_autocomplete_service,
+    )
+    from espanded.services.hotkey_service import HotkeyService, get_hotkey_service
+
+_EXPORTS = {
+    "HotkeyService": "espanded.services.hotkey_service",
+    "get_hotkey_service": "espanded.services.hotkey_service",
+    "AutocompleteService": "espanded.services.autocomplete_service",
+    "get_autocomplete_service": "espanded.services.autocomplete_service",
+    "init_autocomplete_service": "espanded.services.autocomplete_service",
+}
 
 __all__ = [
     "HotkeyService",
@@ -14,3 +27,5 @@ __all__ = [
     "get_autocomplete_service",
     "init_autocomplete_service",
 ]
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
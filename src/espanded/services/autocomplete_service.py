@@ -364,9 +364,18 @@ class AutocompleteService(QObject):
         """
         logger.info(f"Entry selected: {entry.full_trigger}")
 
-        if self._current_match and self._text_inserter:
+        # Take the match from the buffer rather than the last debounced
+        # update, so keys typed since that update are deleted too
+        match = None
+        if self._keystroke_buffer:
+            match = self._keystroke_buffer.handle_selection()
+        match = match or self._current_match
+        self._show_timer.stop()
+        self._pending_show_data = None
+
+        if match and self._text_inserter:
             # Calculate how many chars to delete
-            chars_to_delete = self._current_match.total_chars
+            chars_to_delete = match.total_chars
 
             # Insert the replacement
             self._text_inserter.insert_replacement(
@@ -2,25 +2,31 @@
 
 from typing import Callable
 
-# Check for hotkey dependencies
-try:
-    from espanded.hotkeys.listener import (
-        HotkeyListener,
-        PYNPUT_AVAILABLE,
-        DEFAULT_HOTKEY,
-        normalize_hotkey,
-        display_hotkey,
-        test_hotkey,
-    )
-    from espanded.hotkeys.clipboard import get_selected_text
-except ImportError:
-    PYNPUT_AVAILABLE = False
-    HotkeyListener = None
-    get_selected_text = None
-    DEFAULT_HOTKEY = "<ctrl>+<alt>+`"
-    normalize_hotkey = lambda x: x
-    display_hotkey = lambda x: x
-    test_hotkey = lambda x: (False, "pynput not available")
+from espanded.hotkeys import DEFAULT_HOTKEY
+
+# Hotkey dependencies, resolved by _load_hotkeys() on first use - importing
+# pynput probes the platform input backends, which is slow at startup
+PYNPUT_AVAILABLE: bool | None = None
+HotkeyListener = None
+get_selected_text = None
+
+
+def _load_hotkeys() -> bool:
+    """Import the pynput-backed listener and clipboard helpers once.
+
+    Returns:
+        True if pynput is installed and hotkeys can be registered
+    """
+    global PYNPUT_AVAILABLE, HotkeyListener, get_selected_text
+    if PYNPUT_AVAILABLE is None:
+        try:
+            from espanded.hotkeys import listener
+            from espanded.hotkeys.clipboard import get_selected_text
+            HotkeyListener = listener.HotkeyListener
+            PYNPUT_AVAILABLE = listener.PYNPUT_AVAILABLE
+        except ImportError:
+            PYNPUT_AVAILABLE = False
+    return PYNPUT_AVAILABLE
 
 
 class HotkeyService:
@@ -43,6 +49,7 @@ class HotkeyService:
 
     def __init__(self):
         self._listener: "HotkeyListener | None" = None
+        self._hotkey: str | None = None
         self._running = False
         self._enabled = True
 
@@ -53,7 +60,7 @@ class HotkeyService:
     @property
     def is_available(self) -> bool:
         """Check if hotkey functionality is available."""
-        return PYNPUT_AVAILABLE
+        return _load_hotkeys()
 
     @property
     def is_running(self) -> bool:
@@ -80,20 +87,28 @@ class HotkeyService:
         self._on_quick_add = on_quick_add
         self._on_show_main = on_show_main
 
-    def start(self, quick_add_hotkey: str | None = None):
+    def start(self, quick_add_hotkey: str | None = None, enabled: bool = True):
         """Start listening for hotkeys.
 
         Args:
-            quick_add_hotkey: Custom hotkey string (default: ctrl+shift+e)
+            quick_add_hotkey: Custom hotkey string (default: last used or ctrl+alt+e)
+            enabled: If False, only remember the hotkey - the OS listener is
+                     attached later by enable()
         """
-        if not PYNPUT_AVAILABLE:
-            print("Hotkeys not available: pynput not installed")
+        if self._running:
             return
 
-        if self._running:
+        hotkey = quick_add_hotkey or self._hotkey or self.DEFAULT_QUICK_ADD_HOTKEY
+        self._hotkey = hotkey
+        self._enabled = enabled
+
+        if not enabled:
+            print(f"Hotkey service configured (disabled): {hotkey} for quick add")
             return
 
-        hotkey = quick_add_hotkey or self.DEFAULT_QUICK_ADD_HOTKEY
+        if not _load_hotkeys():
+            print("Hotkeys not available: pynput not installed")
+            return
 
         self._listener = HotkeyListener()
         self._listener.register(hotkey, self._handle_quick_add)
@@ -127,7 +142,8 @@ class HotkeyService:
         if was_running:
             time.sleep(0.2)
 
-        # Start with new hotkey
+        # Start with new hotkey (or remember it for the next start)
+        self._hotkey = new_hotkey
         if was_running:
             self.start(new_hotkey)
 
@@ -1,8 +1,20 @@
 """GitHub sync module for Espanded."""
 
-from espanded.sync.github_sync import GitHubSync
-from espanded.sync.sync_manager import SyncManager
-from espanded.sync.conflict_resolver import ConflictResolver, ConflictResolution
+from typing import TYPE_CHECKING
+
+from espanded._lazy import make_lazy_getattr
+
+if TYPE_CHECKING:
+    from espanded.sync.conflict_resolver import ConflictResolution, ConflictResolver
+    from espanded.sync.github_sync import GitHubSync
+    from espanded.sync.sync_manager import SyncManager
+
+_EXPORTS = {
+    "GitHubSync": "espanded.sync.github_sync",
+    "SyncManager": "espanded.sync.sync_manager",
+    "ConflictResolver": "espanded.sync.conflict_resolver",
+    "ConflictResolution": "espanded.sync.conflict_resolver",
+}
 
 __all__ = [
     "GitHubSync",
@@ -10,3 +22,5 @@ __all__ = [
     "ConflictResolver",
     "ConflictResolution",
 ]
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
@@ -1,15 +1,35 @@
 """UI components for Espanded."""
 
-from espanded.ui.theme import ThemeManager, ColorPalette, ThemeSettings
-from espanded.ui.main_window import MainWindow
-from espanded.ui.sidebar import Sidebar
-from espanded.ui.dashboard import Dashboard
-from espanded.ui.entry_editor import EntryEditor
-from espanded.ui.settings_view import SettingsView
-from espanded.ui.history_view import HistoryView
-from espanded.ui.trash_view import TrashView
-from espanded.ui.quick_add import QuickAddPopup
-from espanded.ui.system_tray import SystemTray
+from typing import TYPE_CHECKING
+
+from espanded._lazy import make_lazy_getattr
+
+if TYPE_CHECKING:
+    from espanded.ui.dashboard import Dashboard
+    from espanded.ui.entry_editor import EntryEditor
+    from espanded.ui.history_view import HistoryView
+    from espanded.ui.main_window import MainWindow
+    from espanded.ui.quick_add import QuickAddPopup
+    from espanded.ui.settings_view import SettingsView
+    from espanded.ui.sidebar import Sidebar
+    from espanded.ui.system_tray import SystemTray
+    from espanded.ui.theme import ColorPalette, ThemeManager, ThemeSettings
+    from espanded.ui.trash_view import TrashView
+
+_EXPORTS = {
+    "ThemeManager": "espanded.ui.theme",
+    "ColorPalette": "espanded.ui.theme",
+    "ThemeSettings": "espanded.ui.theme",
+    "MainWindow": "espanded.ui.main_window",
+    "Sidebar": "espanded.ui.sidebar",
+    "Dashboard": "espanded.ui.dashboard",
+    "EntryEditor": "espanded.ui.entry_editor",
+    "SettingsView": "espanded.ui.settings_view",
+    "HistoryView": "espanded.ui.history_view",
+    "TrashView": "espanded.ui.trash_view",
+    "QuickAddPopup": "espanded.ui.quick_add",
+    "SystemTray": "espanded.ui.system_tray",
+}
 
 __all__ = [
     "ThemeManager",
@@ -25,3 +45,5 @@ __all__ = [
     "QuickAddPopup",
     "SystemTray",
 ]
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
@@ -1,19 +1,39 @@
 """Reusable UI components for Espanded."""
 
-from espanded.ui.components.title_bar import TitleBar
-from espanded.ui.components.status_bar import StatusBar
-from espanded.ui.components.search_bar import SearchBar
-from espanded.ui.components.view_tabs import ViewTabs
-from espanded.ui.components.entry_item import EntryItem
-from espanded.ui.components.hotkey_recorder import HotkeyRecorder
-from espanded.ui.components.message_dialog import (
-    MessageDialog,
-    MessageType,
-    show_information,
-    show_warning,
-    show_critical,
-    show_question,
-)
+from typing import TYPE_CHECKING
+
+from espanded._lazy import make_lazy_getattr
+
+if TYPE_CHECKING:
+    from espanded.ui.components.entry_item import EntryItem
+    from espanded.ui.components.hotkey_recorder import HotkeyRecorder
+    from espanded.ui.components.message_dialog import (
+        MessageDialog,
+        MessageType,
+        show_critical,
+        show_information,
+        show_question,
+        show_warning,
+    )
+    from espanded.ui.components.search_bar import SearchBar
+    from espanded.ui.components.status_bar import StatusBar
+    from espanded.ui.components.title_bar import TitleBar
+    from espanded.ui.components.view_tabs import ViewTabs
+
+_EXPORTS = {
+    "TitleBar": "espanded.ui.components.title_bar",
+    "StatusBar": "espanded.ui.components.status_bar",
+    "SearchBar": "espanded.ui.components.search_bar",
+    "ViewTabs": "espanded.ui.components.view_tabs",
+    "EntryItem": "espanded.ui.components.entry_item",
+    "HotkeyRecorder": "espanded.ui.components.hotkey_recorder",
+    "MessageDialog": "espanded.ui.components.message_dialog",
+    "MessageType": "espanded.ui.components.message_dialog",
+    "show_information": "espanded.ui.components.message_dialog",
+    "show_warning": "espanded.ui.components.message_dialog",
+    "show_critical": "espanded.ui.components.message_dialog",
+    "show_question": "espanded.ui.components.message_dialog",
+}
 
 __all__ = [
     "TitleBar",
@@ -29,3 +49,5 @@ __all__ = [
     "show_critical",
     "show_question",
 ]
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
@@ -1,6 +1,8 @@
 """History view showing entry change log."""
 
+from contextlib import closing
 from datetime import datetime, timedelta
+from itertools import islice
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -192,19 +194,19 @@ class HistoryView(QWidget):
             if child.widget():
                 child.widget().deleteLater()
 
-        # Get history entries
-        all_history = self.app_state.database.get_history(limit=200)
-
-        # Filter by action type
-        if self.filter_action != "all":
-            all_history = [h for h in all_history if h.action == self.filter_action]
-
-        # Filter by search query
-        if self.search_query:
-            all_history = [
-                h for h in all_history
-                if self.search_query in h.trigger_name.lower()
-            ]
+        # Stream history newest first, keeping the first 200 entries that
+        # pass the action and search filters
+        action = self.filter_action
+        query = self.search_query
+        with closing(self.app_state.database.iter_history()) as history:
+            all_history = list(islice(
+                (
+                    h for h in history
+                    if (action == "all" or h.action == action)
+                    and (not query or query in h.trigger_name.lower())
+                ),
+                200,
+            ))
 
         # Group by date
         grouped = self._group_by_date(all_history)
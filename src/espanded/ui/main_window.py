@@ -67,6 +67,20 @@ class MainWindow(QMainWindow):
         self._setup_window()
         self._setup_ui()
         self._connect_signals()
+        self.attach_services(tray=tray, hotkey_service=hotkey_service)
+
+    def attach_services(self, tray=None, hotkey_service=None):
+        """Attach the system tray and hotkey service.
+
+        Lets the window be built while services are still starting up;
+        call once both are available.
+
+        Args:
+            tray: SystemTray instance, or None if unavailable
+            hotkey_service: HotkeyService instance, or None if unavailable
+        """
+        self.tray = tray
+        self.hotkey_service = hotkey_service
         self._connect_tray_signals()
         self._connect_hotkey_service()
 
@@ -1403,7 +1403,7 @@ class SettingsView(QWidget):
             # Default to colon if nothing selected
             if not triggers:
                 triggers = [":"]
-            self.settings.autocomplete_triggers = triggers
+            self.settings.autocomplete_triggers = tuple(triggers)
 
             # Parse max suggestions
             try:
@@ -1416,7 +1416,7 @@ class SettingsView(QWidget):
             from espanded.services.hotkey_service import get_hotkey_service
 
             hotkey_service = get_hotkey_service()
-            if hotkey_service and hotkey_service.is_running:
+            if hotkey_service and hotkey_service.is_available:
                 hotkey_service.update_hotkey(self.settings.quick_add_hotkey)
                 if self.settings.hotkeys_enabled:
                     hotkey_service.enable()
@@ -121,7 +121,7 @@ class Sidebar(QWidget):
         elif self._current_view == "favorites":
             entries = [
                 e
-                for e in self.app_state.entry_manager.get_all_entries()
+                for e in self.app_state.entry_manager.iter_entries()
                 if hasattr(e, "favorited") and e.favorited
             ]
         elif self._current_view == "tags":
@@ -130,7 +130,7 @@ class Sidebar(QWidget):
                     query="", tags=[self._selected_tag]
                 )
             else:
-                entries = [e for e in self.app_state.entry_manager.get_all_entries() if e.tags]
+                entries = [e for e in self.app_state.entry_manager.iter_entries() if e.tags]
         elif self._current_view == "trash":
             entries = self.app_state.entry_manager.get_deleted_entries()
         else:
@@ -12,6 +12,16 @@ from espanded.core.database import Database
 from espanded.core.entry_manager import EntryManager
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Point the home directory at a temp dir, so app data (~/.espanded) stays out of the real one."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    return home
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
@@ -0,0 +1,102 @@
+"""Tests for application setup."""
+
+import logging
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from espanded import app  # noqa: E402
+from espanded.core.models import Settings  # noqa: E402
+
+
+@pytest.fixture
+def root_logger(monkeypatch):
+    """Give the root logger no handlers, so basicConfig applies, restoring it afterwards."""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", logging.WARNING)
+    return root
+
+
+class TestConfigureLogging:
+    """Tests for logging setup."""
+
+    def test_debug_env_enables_debug_logging(self, root_logger, monkeypatch):
+        """Test ESPANDED_DEBUG turns on debug output."""
+        monkeypatch.setenv("ESPANDED_DEBUG", "1")
+
+        app._configure_logging()
+
+        assert root_logger.level == logging.DEBUG
+
+    def test_default_is_warning(self, root_logger, monkeypatch):
+        """Test logging stays at WARNING without ESPANDED_DEBUG."""
+        monkeypatch.delenv("ESPANDED_DEBUG", raising=False)
+
+        app._configure_logging()
+
+        assert root_logger.level == logging.WARNING
+
+    def test_create_app_configures_logging_first(self, monkeypatch):
+        """Test create_app sets up logging before initializing anything."""
+        calls = []
+        monkeypatch.setattr(app, "_configure_logging", lambda: calls.append("logging"))
+
+        def fail():
+            calls.append("app_state")
+            raise RuntimeError("stop here")
+
+        monkeypatch.setattr(app, "get_app_state", fail)
+
+        assert app.create_app()[0] is None
+        assert calls == ["logging", "app_state"]
+
+
+class FakeSyncManager:
+    """SyncManager stand-in that counts connection tests."""
+
+    tests = 0
+
+    def __init__(self, **kwargs):
+        pass
+
+    def test_connection(self):
+        FakeSyncManager.tests += 1
+        return True
+
+
+class TestInitSync:
+    """Tests for the startup GitHub connection check."""
+
+    @pytest.fixture
+    def settings(self, monkeypatch):
+        monkeypatch.setattr(app, "_load_sync", lambda: FakeSyncManager)
+        FakeSyncManager.tests = 0
+        return Settings(github_repo="user/repo", github_token="token", auto_sync=False)
+
+    def test_recent_check_skips_connection_test(self, settings):
+        """Test a recent check with the same repo and token is reused."""
+        settings.last_sync_check = time.time()
+        settings.last_sync_fingerprint = settings.sync_fingerprint()
+
+        _, (sync_manager, sync_check), error = app._init_sync(settings)
+
+        assert error is None
+        assert sync_manager is not None
+        assert sync_check is None
+        assert FakeSyncManager.tests == 0
+
+    def test_changed_token_forces_connection_test(self, settings):
+        """Test a recent check made with another token is not reused."""
+        settings.last_sync_check = time.time()
+        old_fingerprint = settings.last_sync_fingerprint = settings.sync_fingerprint()
+        settings.github_token = "new-token"
+
+        _, (_, sync_check), _ = app._init_sync(settings)
+
+        assert FakeSyncManager.tests == 1
+        assert sync_check[1] == settings.sync_fingerprint()
+        # The worker leaves settings to the main thread
+        assert settings.last_sync_fingerprint == old_fingerprint
@@ -0,0 +1,67 @@
+"""Tests for application state."""
+
+from unittest.mock import patch
+
+import pytest
+
+from espanded.core.app_state import AppState, get_app_state
+from espanded.core.models import Settings
+
+
+@pytest.fixture
+def app_state(test_database):
+    """Create a fresh app state backed by the test database."""
+    AppState.reset()
+    state = get_app_state()
+    state.database = test_database
+    yield state
+    AppState.reset()
+
+
+class TestAppState:
+    """Tests for AppState class."""
+
+    def test_singleton(self, app_state):
+        """Test get_app_state returns the same instance."""
+        assert get_app_state() is app_state
+
+    def test_sync_manager_defaults_to_none(self, app_state):
+        """Test sync manager is unset until configured."""
+        assert app_state.sync_manager is None
+
+    def test_entry_manager_is_lazy_and_cached(self, app_state):
+        """Test entry manager is created once using the shared database."""
+        manager = app_state.entry_manager
+
+        assert manager.db is app_state.database
+        assert app_state.entry_manager is manager
+
+    def test_settings_loaded_from_database(self, app_state, test_database):
+        """Test settings are read from the database on first access."""
+        test_database.save_settings(Settings(theme="dark"))
+
+        assert app_state.settings.theme == "dark"
+
+    def test_settings_read_from_database_once(self, app_state, test_database):
+        """Test repeated settings access does not re-query the database."""
+        with patch.object(
+            test_database, "get_settings", wraps=test_database.get_settings
+        ) as get_settings:
+            first = app_state.settings
+            for _ in range(5):
+                assert app_state.settings is first
+
+        assert get_settings.call_count == 1
+
+    def test_settings_setter_persists(self, app_state, test_database):
+        """Test assigning settings saves them to the database."""
+        app_state.settings = Settings(theme="light", default_prefix=";")
+
+        saved = test_database.get_settings()
+        assert saved.theme == "light"
+        assert saved.default_prefix == ";"
+
+    def test_unknown_attribute_raises(self, app_state):
+        """Test unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            app_state.not_a_service
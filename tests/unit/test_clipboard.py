@@ -0,0 +1,120 @@
+"""Tests for clipboard helpers."""
+
+import ctypes
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+from espanded.hotkeys import clipboard
+from espanded.hotkeys.clipboard import ClipboardManager
+
+
+class TestClipboardManager:
+    """Tests for ClipboardManager class."""
+
+    def test_windows_uses_win32_api(self):
+        """Test the Win32 path is used without starting PowerShell."""
+        manager = ClipboardManager()
+        manager._system = "Windows"
+
+        with patch.object(manager, "_get_clipboard_win32", return_value="text"), \
+                patch.object(clipboard.subprocess, "run") as run:
+            assert manager.get_clipboard() == "text"
+
+        run.assert_not_called()
+
+    def test_windows_falls_back_to_powershell(self):
+        """Test a failed Win32 call falls back to PowerShell."""
+        manager = ClipboardManager()
+        manager._system = "Windows"
+
+        with patch.object(manager, "_get_clipboard_win32", side_effect=OSError), \
+                patch.object(manager, "_set_clipboard_win32", side_effect=OSError), \
+                patch.object(manager, "_get_clipboard_powershell", return_value="ps") as get, \
+                patch.object(manager, "_set_clipboard_powershell") as set_:
+            assert manager.get_clipboard() == "ps"
+            manager.set_clipboard("new")
+
+        get.assert_called_once()
+        set_.assert_called_once_with("new")
+
+    def test_input_struct_matches_win32_layout(self):
+        """Test INPUT has the size SendInput expects (40 bytes on 64-bit, 28 on 32-bit)."""
+        expected = 40 if ctypes.sizeof(ctypes.c_void_p) == 8 else 28
+
+        assert ctypes.sizeof(clipboard._INPUT) == expected
+
+
+class TestSelectedText:
+    """Tests for get_selected_text and its clipboard wait."""
+
+    def test_wait_returns_once_clipboard_changes(self):
+        """Test the wait ends as soon as the change counter advances."""
+        counts = iter([1, 1, 2])
+
+        with patch.object(clipboard, "_clipboard_change_count", lambda: next(counts)):
+            start = time.monotonic()
+            clipboard._wait_for_clipboard_change(1, timeout=5)
+
+        assert time.monotonic() - start < 1
+
+    def test_wait_without_counter_sleeps(self):
+        """Test platforms without a change counter sleep for the timeout."""
+        with patch.object(clipboard.time, "sleep") as sleep:
+            clipboard._wait_for_clipboard_change(None, timeout=0.1)
+
+        sleep.assert_called_once_with(0.1)
+
+    def test_selection_restores_previous_clipboard(self):
+        """Test the clipboard is cleared, read and restored around the copy."""
+        with patch.object(ClipboardManager, "get_clipboard", side_effect=["old", "picked"]), \
+                patch.object(ClipboardManager, "set_clipboard") as set_, \
+                patch.object(clipboard, "_simulate_copy_linux"), \
+                patch.object(clipboard, "_SYSTEM", "Linux"), \
+                patch.object(clipboard, "_wait_for_clipboard_change"):
+            assert clipboard.get_selected_text() == "picked"
+
+        assert [c.args for c in set_.call_args_list] == [("",), ("old",)]
+
+    def test_selection_skips_redundant_clipboard_writes(self):
+        """Test an empty clipboard isn't cleared, and an unchanged one isn't restored."""
+        with patch.object(ClipboardManager, "get_clipboard", side_effect=["", ""]), \
+                patch.object(ClipboardManager, "set_clipboard") as set_, \
+                patch.object(clipboard, "_simulate_copy_linux"), \
+                patch.object(clipboard, "_SYSTEM", "Linux"), \
+                patch.object(clipboard, "_wait_for_clipboard_change"):
+            assert clipboard.get_selected_text() == ""
+
+        set_.assert_not_called()
+
+    def test_missing_pynput_is_imported_once(self, monkeypatch):
+        """Test the copy fallback doesn't retry a failed pynput import per call."""
+        clipboard._pynput_keyboard.cache_clear()
+        clipboard._copy_keys.cache_clear()
+        monkeypatch.setitem(sys.modules, "pynput", None)
+        try:
+            with patch.object(clipboard.subprocess, "run") as run:
+                clipboard._simulate_copy_linux()
+                clipboard._simulate_copy_linux()
+
+            assert run.call_count == 2
+            assert clipboard._pynput_keyboard.cache_info().misses == 1
+        finally:
+            clipboard._pynput_keyboard.cache_clear()
+            clipboard._copy_keys.cache_clear()
+
+    def test_copy_reuses_one_controller(self, monkeypatch):
+        """Test every copy presses through the same pynput Controller."""
+        controller = MagicMock()
+        keyboard = MagicMock()
+        keyboard.Controller.return_value = controller
+        clipboard._copy_keys.cache_clear()
+        monkeypatch.setattr(clipboard, "_pynput_keyboard", lambda: keyboard)
+        try:
+            clipboard._simulate_copy_linux()
+            clipboard._simulate_copy_linux()
+
+            keyboard.Controller.assert_called_once()
+            assert controller.tap.call_count == 2
+        finally:
+            clipboard._copy_keys.cache_clear()
@@ -0,0 +1,57 @@
+"""Tests for cursor position and active window helpers."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from espanded.hotkeys import cursor_position
+
+
+@pytest.fixture
+def user32(monkeypatch):
+    """Fake Windows user32 whose windows are titled after their handle."""
+    fake = MagicMock()
+    fake.GetWindowTextLengthW.return_value = 8
+
+    def get_window_text(hwnd, buffer, size):
+        buffer.value = f"Window {hwnd}"
+        return 8
+
+    fake.GetWindowTextW.side_effect = get_window_text
+    monkeypatch.setattr(cursor_position, "_SYSTEM", "Windows")
+    monkeypatch.setattr(cursor_position, "_user32", lambda: fake)
+    # Only defined by ctypes on Windows
+    monkeypatch.setattr(cursor_position.ctypes, "get_last_error", lambda: 0, raising=False)
+    return fake
+
+
+class TestActiveWindowInfo:
+    """Tests for get_active_window_info."""
+
+    def test_no_foreground_window(self, user32):
+        """Test None is returned when no window is in front."""
+        user32.GetForegroundWindow.return_value = 0
+
+        assert cursor_position.get_active_window_info() is None
+
+
+class TestCaretPosition:
+    """Tests for the Windows caret lookup."""
+
+    def test_no_caret_falls_back_to_mouse(self, user32, monkeypatch):
+        """Test a failed caret query returns None and the mouse position is used."""
+        user32.GetGUIThreadInfo.return_value = 0
+        mouse = cursor_position.CursorPosition(10, 20)
+        monkeypatch.setattr(cursor_position, "_get_mouse_position", lambda: mouse)
+
+        assert cursor_position._get_windows_caret_position() is None
+        assert cursor_position.get_cursor_position() is mouse
+
+    def test_user32_load_failure_is_not_raised(self, monkeypatch):
+        """Test a user32 that can't be loaded reads as no caret."""
+        def fail():
+            raise OSError("no user32")
+
+        monkeypatch.setattr(cursor_position, "_user32", fail)
+
+        assert cursor_position._get_windows_caret_position() is None
@@ -0,0 +1,285 @@
+"""Tests for the SQLite database."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from espanded.core.database import Database
+from espanded.core.models import HistoryEntry
+
+
+class TestDatabase:
+    """Tests for Database class."""
+
+    def test_connection_uses_wal(self, test_database):
+        """Test the connection is opened in WAL mode."""
+        mode = test_database.conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+    def test_reopen_keeps_entries(self, temp_dir, sample_entry):
+        """Test committed entries survive closing and reopening."""
+        db_path = temp_dir / "reopen.db"
+        db = Database(db_path)
+        db.save_entry(sample_entry)
+        db.close()
+
+        db = Database(db_path)
+        try:
+            assert db.get_entry(sample_entry.id).trigger == sample_entry.trigger
+        finally:
+            db.close()
+
+    def test_save_entries(self, test_database, sample_entries):
+        """Test bulk saving entries in one call."""
+        test_database.save_entries(sample_entries)
+
+        saved = test_database.get_all_entries()
+        assert {e.id for e in saved} == {e.id for e in sample_entries}
+
+    def test_add_history_many(self, test_database, sample_history_entry):
+        """Test bulk adding history entries."""
+        second = HistoryEntry(entry_id="entry-2", action="deleted", trigger_name=":addr")
+
+        test_database.add_history_many([sample_history_entry, second])
+
+        assert len(test_database.get_history()) == 2
+
+    def test_add_history_is_batched(self, temp_dir, sample_history_entry):
+        """Test queued history rows are written on flush and on close."""
+        db_path = temp_dir / "history.db"
+        db = Database(db_path)
+        count_sql = "SELECT COUNT(*) FROM history"
+
+        db.add_history(sample_history_entry)
+        assert db.conn.execute(count_sql).fetchone()[0] == 0
+
+        db.flush_history()
+        assert db.conn.execute(count_sql).fetchone()[0] == 1
+
+        db.add_history(HistoryEntry(entry_id="entry-2", action="deleted"))
+        db.close()
+
+        db = Database(db_path)
+        try:
+            assert len(db.get_history()) == 2
+        finally:
+            db.close()
+
+    def test_search_matches_substrings(self, test_database, sample_entries):
+        """Test search finds text in the middle of a word, ignoring case."""
+        test_database.save_entries(sample_entries)
+
+        results = test_database.search_entries("REGARD")
+
+        assert [e.id for e in results] == ["entry-1"]
+
+    def test_search_reflects_replaced_entry(self, test_database, sample_entry):
+        """Test the search index follows an entry whose text changed."""
+        test_database.save_entry(sample_entry)
+        sample_entry.replacement = "Updated body"
+        test_database.save_entry(sample_entry)
+
+        assert test_database.search_entries("replacement") == []
+        assert [e.id for e in test_database.search_entries("updated")] == [sample_entry.id]
+
+    def test_search_index_built_for_existing_database(self, temp_dir, sample_entry):
+        """Test entries saved before the index existed are searchable."""
+        db_path = temp_dir / "legacy.db"
+        db = Database(db_path)
+        db.save_entry(sample_entry)
+        db.conn.execute("DROP TABLE entries_fts")
+        db.conn.commit()
+        db.close()
+
+        db = Database(db_path)
+        try:
+            assert [e.id for e in db.search_entries("replacement")] == [sample_entry.id]
+        finally:
+            db.close()
+
+    def test_search_by_tags_only(self, test_database, sample_entries):
+        """Test an empty query with tags filters on tags alone."""
+        test_database.save_entries(sample_entries)
+
+        results = test_database.search_entries("", tags=["address", "template"])
+
+        assert {e.id for e in results} == {"entry-2", "entry-3"}
+
+    def test_get_all_tags_skips_deleted(self, test_database, sample_entries):
+        """Test tag counts only include active entries."""
+        test_database.save_entries(sample_entries)
+        test_database.soft_delete_entry("entry-1")
+
+        tags = test_database.get_all_tags()
+
+        assert "email" not in tags
+        assert tags == {"address": 1, "personal": 1, "template": 1, "work": 1}
+
+    def test_get_all_tags_refreshes_after_write(self, test_database, sample_entries):
+        """Test cached tag counts are dropped when entries change."""
+        test_database.save_entries(sample_entries[:1])
+        assert test_database.get_all_tags() == {"email": 1, "signature": 1}
+
+        test_database.save_entry(sample_entries[2])
+
+        assert test_database.get_all_tags()["work"] == 1
+        assert test_database.get_stats()["tag_count"] == 4
+
+    def test_get_all_tags_ignores_counts_stale_on_arrival(
+        self, test_database, sample_entries, monkeypatch
+    ):
+        """Test counts read before a concurrent write are not cached."""
+        test_database.save_entries(sample_entries[:1])
+        read = test_database._read
+
+        def read_then_write(sql, params=()):
+            rows = read(sql, params)
+            monkeypatch.setattr(test_database, "_read", read)
+            test_database.save_entry(sample_entries[2])
+            return rows
+
+        monkeypatch.setattr(test_database, "_read", read_then_write)
+
+        assert test_database.get_all_tags() == {"email": 1, "signature": 1}
+        assert test_database._tag_counts is None
+        assert test_database.get_all_tags()["work"] == 1
+
+    def test_get_all_tags_from_another_thread_during_save_entries(
+        self, test_database, sample_entries, monkeypatch
+    ):
+        """Test tags read while save_entries invalidates the cache are not cached stale."""
+        test_database.save_entries(sample_entries[:1])
+        read = test_database._read
+        entries_changed = test_database._entries_changed
+        queried = threading.Event()
+
+        def read_and_signal(sql, params=()):
+            rows = read(sql, params)
+            queried.set()
+            return rows
+
+        monkeypatch.setattr(test_database, "_read", read_and_signal)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = []
+
+            def changed_then_read_tags():
+                entries_changed()
+                # Let the other thread query while save_entries still runs
+                futures.append(executor.submit(test_database.get_all_tags))
+                assert queried.wait(5)
+
+            monkeypatch.setattr(test_database, "_entries_changed", changed_then_read_tags)
+            test_database.save_entries(sample_entries[1:])
+
+        assert futures[0].result()["work"] == 1
+        assert test_database.get_all_tags()["work"] == 1
+
+    def test_get_stats_empty_database(self, test_database):
+        """Test stats on an empty database are zero rather than None."""
+        stats = test_database.get_stats()
+
+        assert stats["total_entries"] == 0
+        assert stats["deleted_entries"] == 0
+        assert stats["modified_today"] == 0
+        assert stats["last_modified"] is None
+
+    def test_loaded_tags_are_independent(self, test_database, sample_entries):
+        """Test entries with identical tags don't share a mutable list."""
+        sample_entries[1].tags = list(sample_entries[0].tags)
+        test_database.save_entries(sample_entries[:2])
+
+        first = test_database.get_entry("entry-1")
+        first.tags.append("changed")
+
+        assert test_database.get_entry("entry-2").tags == ["email", "signature"]
+
+    def test_entry_tags_follow_entry_changes(self, test_database, sample_entry):
+        """Test the entry_tags table tracks saves and permanent deletes."""
+        test_database.save_entry(sample_entry)
+        sample_entry.tags = ["personal"]
+        test_database.save_entry(sample_entry)
+
+        rows = test_database.conn.execute("SELECT tag FROM entry_tags").fetchall()
+        assert [row["tag"] for row in rows] == ["personal"]
+
+        test_database.permanent_delete_entry(sample_entry.id)
+        assert test_database.conn.execute("SELECT COUNT(*) FROM entry_tags").fetchone()[0] == 0
+
+    def test_entry_tags_filled_for_existing_database(self, temp_dir, sample_entry):
+        """Test tags of entries saved before entry_tags existed are counted."""
+        db_path = temp_dir / "legacy-tags.db"
+        db = Database(db_path)
+        db.save_entry(sample_entry)
+        db.conn.execute("DROP TABLE entry_tags")
+        db.conn.commit()
+        db.close()
+
+        db = Database(db_path)
+        try:
+            assert db.get_all_tags() == {"template": 1, "work": 1}
+        finally:
+            db.close()
+
+    def test_history_without_changes_round_trips(self, test_database, sample_history_entry):
+        """Test history stored without changes loads back with an empty dict."""
+        test_database.add_history(sample_history_entry)
+        test_database.flush_history()
+
+        row = test_database.conn.execute("SELECT changes FROM history").fetchone()
+        assert row["changes"] is None
+        assert test_database.get_history()[0].changes == {}
+
+    def test_entry_lookups_without_loading(self, test_database, sample_entry):
+        """Test the column-only lookups used on mutation paths."""
+        assert not test_database.entry_exists(sample_entry.id)
+        assert test_database.get_entry_trigger(sample_entry.id) is None
+
+        test_database.save_entry(sample_entry)
+
+        assert test_database.entry_exists(sample_entry.id)
+        assert test_database.get_entry_trigger(sample_entry.id) == ":test"
+        assert test_database.get_entry_content(sample_entry.id) == (
+            "test", "Test replacement text", ["work", "template"]
+        )
+
+    def test_soft_delete_and_restore_return_trigger(self, test_database, sample_entry):
+        """Test trash moves report the entry's full trigger, or None if missing."""
+        test_database.save_entry(sample_entry)
+
+        assert test_database.soft_delete_entry(sample_entry.id) == ":test"
+        assert test_database.get_entry(sample_entry.id).is_deleted
+        assert test_database.restore_entry(sample_entry.id) == ":test"
+        assert test_database.soft_delete_entry("missing") is None
+
+    def test_reads_from_worker_threads(self, test_database, sample_entries):
+        """Test reads on other threads see committed writes."""
+        test_database.save_entries(sample_entries)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(test_database.get_entry, ["entry-1", "entry-2", "entry-3"]))
+
+        assert [e.trigger for e in results] == ["sig", "addr", "meeting"]
+
+    def test_in_memory_database(self, sample_entry):
+        """Test an in-memory database reads through its single connection."""
+        db = Database(":memory:")
+        try:
+            db.save_entry(sample_entry)
+            assert db.get_entry(sample_entry.id).trigger == "test"
+        finally:
+            db.close()
+
+    def test_iter_entries(self, test_database, sample_entries):
+        """Test streamed reads match the full list order."""
+        for entry in sample_entries:
+            test_database.save_entry(entry)
+        expected = [e.id for e in test_database.get_all_entries()]
+
+        assert [e.id for e in test_database.iter_entries()] == expected
+
+    def test_iter_history(self, test_database, sample_history_entry):
+        """Test history can be streamed."""
+        test_database.add_history(sample_history_entry)
+
+        assert [h.id for h in test_database.iter_history()] == ["history-1"]
@@ -1,5 +1,7 @@
 """Tests for entry manager."""
 
+import threading
+
 import pytest
 from datetime import datetime
 from unittest.mock import MagicMock, patch
@@ -130,6 +132,17 @@ class TestEntryManager:
         all_entries = entry_manager.get_all_entries()
         assert len(all_entries) == len(sample_entries)
 
+    def test_iter_entries_skips_deleted(self, entry_manager, sample_entries):
+        """Test streamed entries match get_all_entries, without the trash."""
+        for entry in sample_entries:
+            entry_manager.create_entry(entry)
+        entry_manager.delete_entry(sample_entries[0].id)
+
+        streamed = [e.id for e in entry_manager.iter_entries()]
+
+        assert streamed == [e.id for e in entry_manager.get_all_entries()]
+        assert sample_entries[0].id not in streamed
+
     def test_get_deleted_entries(self, entry_manager, sample_entries):
         """Test getting deleted entries."""
         # Create and delete some entries
@@ -232,6 +245,27 @@ class TestEntryManager:
         entry_manager.create_entry(sample_entry)
         assert callback_called is False
 
+    def test_change_listeners_survive_errors_and_removal(self, entry_manager, sample_entry):
+        """Test a failing or self-removing listener doesn't skip the others."""
+        calls = []
+
+        def failing():
+            calls.append("failing")
+            raise RuntimeError("listener error")
+
+        def one_shot():
+            calls.append("one_shot")
+            entry_manager.remove_change_listener(one_shot)
+
+        entry_manager.add_change_listener(failing)
+        entry_manager.add_change_listener(one_shot)
+        entry_manager.add_change_listener(lambda: calls.append("last"))
+
+        entry_manager.create_entry(sample_entry)
+        entry_manager.delete_entry(sample_entry.id)
+
+        assert calls == ["failing", "one_shot", "last", "failing", "last"]
+
     def test_history_on_create(self, entry_manager, sample_entry):
         """Test that history is logged on entry creation."""
         created = entry_manager.create_entry(sample_entry)
@@ -242,6 +276,14 @@ class TestEntryManager:
         assert history[0].action == "created"
         assert history[0].entry_id == created.id
 
+    def test_create_uses_one_timestamp(self, entry_manager, sample_entry):
+        """Test that created_at, modified_at and the history row share a timestamp."""
+        created = entry_manager.create_entry(sample_entry)
+
+        history = entry_manager.db.get_entry_history(created.id)
+        assert created.created_at == created.modified_at
+        assert history[0].timestamp == created.modified_at
+
     def test_history_on_update(self, entry_manager, sample_entry):
         """Test that history is logged on entry update."""
         created = entry_manager.create_entry(sample_entry)
@@ -274,3 +316,113 @@ class TestEntryManager:
         history = entry_manager.db.get_entry_history(created.id)
         actions = [h.action for h in history]
         assert "restored" in actions
+
+    def test_mutations_share_one_espanso_sync(self, entry_manager, sample_entries):
+        """Test back-to-back mutations are written to Espanso once."""
+        entry_manager.SYNC_DELAY = 60  # only flush_sync() should run it
+        with patch.object(entry_manager, "_sync_to_espanso") as sync:
+            for entry in sample_entries:
+                entry_manager.create_entry(entry)
+            entry_manager.delete_entry(sample_entries[0].id)
+
+            assert sync.call_count == 0
+            entry_manager.flush_sync()
+            entry_manager.flush_sync()
+
+        assert sync.call_count == 1
+
+    def test_flush_waits_for_sync_in_flight(self, entry_manager, sample_entries, temp_dir):
+        """Test flush_sync waits for a running sync and syncs never overlap."""
+        entry_manager.espanso.exists.return_value = True
+        entry_manager.espanso.match_dir = temp_dir
+        entry_manager.yaml_handler = MagicMock()
+        entry_manager.SYNC_DELAY = 60  # only flush_sync() should run the pending one
+        in_reload = threading.Event()
+        release = threading.Event()
+        running = []
+        peak = []
+
+        def reload():
+            running.append(None)
+            peak.append(len(running))
+            in_reload.set()
+            release.wait(5)
+            running.pop()
+
+        entry_manager.espanso.reload.side_effect = reload
+        entry_manager.db.save_entry(sample_entries[0])
+        worker = threading.Thread(target=entry_manager._sync_to_espanso)
+        worker.start()
+        assert in_reload.wait(5)
+
+        # A mutation during the sync arms a new one; flushing it must wait
+        entry_manager.create_entry(sample_entries[1])
+        flusher = threading.Thread(target=entry_manager.flush_sync)
+        flusher.start()
+        flusher.join(0.2)
+        assert flusher.is_alive()
+
+        release.set()
+        flusher.join(5)
+        worker.join(5)
+        assert not flusher.is_alive()
+        assert entry_manager.espanso.reload.call_count == 2
+        assert max(peak) == 1
+
+    def test_sync_rewrites_only_changed_files(self, entry_manager, sample_entries, temp_dir):
+        """Test unchanged match files are not rewritten on sync."""
+        entry_manager.espanso.exists.return_value = True
+        entry_manager.espanso.match_dir = temp_dir
+        entry_manager.yaml_handler = MagicMock()
+        sample_entries[2].source_file = "work.yml"
+        for entry in sample_entries:
+            entry_manager.db.save_entry(entry)
+
+        entry_manager._sync_to_espanso()
+        assert entry_manager.yaml_handler.write_match_file.call_count == 2
+
+        entry_manager.yaml_handler.reset_mock()
+        entry_manager.espanso.reload.reset_mock()
+        entry_manager._sync_to_espanso()
+        entry_manager.yaml_handler.write_match_file.assert_not_called()
+        entry_manager.espanso.reload.assert_not_called()
+
+        sample_entries[2].replacement = "Changed"
+        entry_manager.db.save_entry(sample_entries[2])
+        entry_manager._sync_to_espanso()
+        written = entry_manager.yaml_handler.write_match_file.call_args[0][0]
+        assert written == temp_dir / "work.yml"
+        assert entry_manager.yaml_handler.write_match_file.call_count == 1
+
+    def test_export_rewrites_unchanged_files(self, entry_manager, sample_entries, temp_dir):
+        """Test an export writes every file, even right after a sync wrote them."""
+        entry_manager.espanso.exists.return_value = True
+        entry_manager.espanso.match_dir = temp_dir
+        entry_manager.yaml_handler = MagicMock()
+        for entry in sample_entries:
+            entry_manager.db.save_entry(entry)
+
+        entry_manager._sync_to_espanso()
+        entry_manager.export_to_espanso()
+
+        assert entry_manager.yaml_handler.write_match_file.call_count == 2
+        assert entry_manager.espanso.reload.call_count == 2
+
+    def test_import_from_espanso_keeps_source_files(self, entry_manager, temp_dir):
+        """Test entries from every match file are imported under their file name."""
+        match_dir = temp_dir / "match"
+        match_dir.mkdir()
+        (match_dir / "base.yml").write_text(
+            "matches:\n  - trigger: ':a'\n    replace: 'A'\n  - trigger: ':b'\n    replace: 'B'\n",
+            encoding="utf-8",
+        )
+        (match_dir / "work.yml").write_text(
+            "matches:\n  - trigger: ':w'\n    replace: 'W'\n", encoding="utf-8"
+        )
+        entry_manager.espanso.exists.return_value = True
+        entry_manager.espanso.config_path = temp_dir
+
+        assert entry_manager.import_from_espanso() == 3
+
+        saved = {e.trigger: e.source_file for e in entry_manager.get_all_entries()}
+        assert saved == {"a": "base.yml", "b": "base.yml", "w": "work.yml"}
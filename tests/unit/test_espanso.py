@@ -0,0 +1,125 @@
+"""Tests for Espanso integration."""
+
+import os
+import subprocess
+from unittest.mock import patch
+
+from espanded.core.espanso import EspansoManager
+
+
+class TestEspansoManager:
+    """Tests for EspansoManager class."""
+
+    def test_paths_follow_set_config_path(self, temp_dir):
+        """Test the cached paths are recomputed after set_config_path."""
+        manager = EspansoManager(temp_dir / "first")
+        assert manager.match_dir == temp_dir / "first" / "match"
+
+        manager.set_config_path(temp_dir / "second")
+
+        assert manager.config_path == temp_dir / "second"
+        assert manager.match_dir == temp_dir / "second" / "match"
+        assert manager.config_file == temp_dir / "second" / "config" / "default.yml"
+
+    def test_detected_path_uses_xdg_config_home(self, temp_dir, monkeypatch):
+        """Test Linux detection honours XDG_CONFIG_HOME."""
+        monkeypatch.setattr("espanded.core.espanso._SYSTEM", "Linux")
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(temp_dir))
+
+        assert EspansoManager().config_path == temp_dir / "espanso"
+
+    def test_cli_probe_is_shared(self, temp_dir):
+        """Test install, version and status checks share one CLI probe."""
+        def run(args, **kwargs):
+            stdout = "espanso 2.2.1" if args[1] == "--version" else "espanso is running"
+            return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+        manager = EspansoManager(temp_dir)
+        with patch("espanded.core.espanso.subprocess.run", side_effect=run) as mock_run:
+            assert manager.is_installed() is True
+            assert manager.get_version() == "espanso 2.2.1"
+            assert manager.get_status() == "running"
+            assert mock_run.call_count == 2
+
+            info = manager.get_config_info()
+            assert info["status"] == "running"
+            assert mock_run.call_count == 4
+
+    def test_cli_probe_when_not_installed(self, temp_dir):
+        """Test a missing espanso binary is probed once and reported as unknown."""
+        manager = EspansoManager(temp_dir)
+        with patch(
+            "espanded.core.espanso.subprocess.run", side_effect=FileNotFoundError
+        ) as mock_run:
+            assert manager.is_installed() is False
+            assert manager.get_version() is None
+            assert manager.get_status() == "unknown"
+            assert mock_run.call_count == 1
+
+    def test_config_info_counts_entries_in_every_file(self, temp_dir):
+        """Test total_entries sums the matches of all match files."""
+        match_dir = temp_dir / "match"
+        match_dir.mkdir()
+        for i in range(3):
+            (match_dir / f"file{i}.yml").write_text(
+                "matches:\n"
+                + "".join(f"  - trigger: ':t{i}{j}'\n    replace: 'x'\n" for j in range(i + 1)),
+                encoding="utf-8",
+            )
+
+        manager = EspansoManager(temp_dir)
+        with patch("espanded.core.espanso.subprocess.run", side_effect=FileNotFoundError):
+            info = manager.get_config_info()
+
+        assert info["match_files"] == ["file0.yml", "file1.yml", "file2.yml"]
+        assert info["total_entries"] == 6
+
+    def test_config_info_reuses_parsed_match_files(self, temp_dir):
+        """Test repeated counts come from one handler's cache and build no Entries."""
+        match_dir = temp_dir / "match"
+        match_dir.mkdir()
+        for i in range(2):
+            (match_dir / f"file{i}.yml").write_text(
+                "matches:\n  - trigger: ':a'\n    replace: 'A'\n", encoding="utf-8"
+            )
+
+        manager = EspansoManager(temp_dir)
+        build = patch("espanded.core.yaml_handler.Entry.from_espanso_dicts")
+        with patch("espanded.core.espanso.subprocess.run", side_effect=FileNotFoundError):
+            with build as build:
+                assert manager.get_config_info()["total_entries"] == 2
+                handler = manager.yaml_handler
+                with patch.object(handler, "_read_sidecar") as read_sidecar:
+                    assert manager.get_config_info()["total_entries"] == 2
+
+        assert manager.yaml_handler is handler
+        read_sidecar.assert_not_called()
+        build.assert_not_called()
+
+    def test_match_files_rescanned_when_directory_changes(self, temp_dir):
+        """Test get_match_files picks up added files and ignores other extensions."""
+        manager = EspansoManager(temp_dir)
+        assert manager.get_match_files() == []
+
+        match_dir = temp_dir / "match"
+        match_dir.mkdir()
+        (match_dir / "base.yml").write_text("matches: []\n", encoding="utf-8")
+        (match_dir / "notes.txt").write_text("", encoding="utf-8")
+        assert manager.get_match_files() == [match_dir / "base.yml"]
+
+        (match_dir / "extra.yaml").write_text("matches: []\n", encoding="utf-8")
+        stat = match_dir.stat()
+        os.utime(match_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert manager.get_match_files() == [match_dir / "base.yml", match_dir / "extra.yaml"]
+
+    def test_backup_config_copies_files(self, temp_dir):
+        """Test backup_config copies the config tree into a timestamped folder."""
+        config_dir = temp_dir / "espanso"
+        (config_dir / "match").mkdir(parents=True)
+        (config_dir / "match" / "base.yml").write_text("matches: []\n", encoding="utf-8")
+
+        backup_path = EspansoManager(config_dir).backup_config(temp_dir / "backups")
+
+        assert backup_path.parent == temp_dir / "backups"
+        assert backup_path.name.startswith("espanso_backup_")
+        assert (backup_path / "match" / "base.yml").read_text(encoding="utf-8") == "matches: []\n"
@@ -0,0 +1,77 @@
+"""Tests for Espanso default.yml configuration management."""
+
+import os
+from unittest.mock import patch
+
+from espanded.core.espanso_config import EspansoConfig, EspansoConfigHandler
+
+
+class TestEspansoConfigHandler:
+    """Tests for EspansoConfigHandler class."""
+
+    def test_load_missing_file_returns_defaults(self, temp_dir):
+        """Test loading without a default.yml gives the default config."""
+        assert EspansoConfigHandler(temp_dir).load() == EspansoConfig()
+
+    def test_load_reads_known_keys(self, temp_dir):
+        """Test known keys are applied and unknown keys are ignored."""
+        handler = EspansoConfigHandler(temp_dir)
+        handler.config_dir.mkdir()
+        handler.default_yml_path.write_text(
+            "backend: clipboard\nkey_delay: 5\nshow_icon: false\nunknown_key: 1\n",
+            encoding="utf-8",
+        )
+
+        config = handler.load()
+
+        assert config.backend == "Clipboard"
+        assert config.key_delay == 5
+        assert config.show_icon is False
+        assert not hasattr(config, "unknown_key")
+
+    def test_save_and_load_reuse_parsed_file(self, temp_dir):
+        """Test unchanged default.yml is parsed once, and edits are picked up."""
+        handler = EspansoConfigHandler(temp_dir)
+        handler.config_dir.mkdir()
+        handler.default_yml_path.write_text("custom_key: kept\n", encoding="utf-8")
+
+        with patch.object(handler.yaml, "load", wraps=handler.yaml.load) as load:
+            config = handler.load()
+            config.key_delay = 7
+            assert handler.save(config) is True
+            assert "custom_key: kept" in handler.default_yml_path.read_text(encoding="utf-8")
+            assert handler.load().key_delay == 7
+            assert load.call_count == 1
+
+            handler.default_yml_path.write_text("key_delay: 9\n", encoding="utf-8")
+            stat = handler.default_yml_path.stat()
+            os.utime(handler.default_yml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert handler.load().key_delay == 9
+            assert load.call_count == 2
+
+    def test_save_writes_only_non_default_values(self, temp_dir):
+        """Test defaults are dropped from default.yml and backend is lower-cased."""
+        handler = EspansoConfigHandler(temp_dir)
+        handler.config_dir.mkdir()
+        handler.default_yml_path.write_text("show_icon: false\n", encoding="utf-8")
+
+        config = EspansoConfig(backend="Clipboard", key_delay=3)
+        assert handler.save(config) is True
+
+        text = handler.default_yml_path.read_text(encoding="utf-8")
+        assert "backend: clipboard" in text
+        assert "key_delay: 3" in text
+        assert "show_icon" not in text
+        assert "word_separators" not in text
+
+    def test_failed_save_keeps_existing_file(self, temp_dir):
+        """Test an error while writing leaves default.yml and no temp file behind."""
+        handler = EspansoConfigHandler(temp_dir)
+        handler.config_dir.mkdir()
+        handler.default_yml_path.write_text("key_delay: 4\n", encoding="utf-8")
+
+        with patch.object(handler.yaml, "dump", side_effect=RuntimeError("disk full")):
+            assert handler.save(EspansoConfig(key_delay=8)) is False
+
+        assert handler.default_yml_path.read_text(encoding="utf-8") == "key_delay: 4\n"
+        assert list(handler.config_dir.iterdir()) == [handler.default_yml_path]
@@ -0,0 +1,46 @@
+"""Tests for the hotkey service."""
+
+import pytest
+
+from espanded.services import hotkey_service
+from espanded.services.hotkey_service import HotkeyService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Create a hotkey service with the pynput import state reset."""
+    monkeypatch.setattr(hotkey_service, "PYNPUT_AVAILABLE", None)
+    return HotkeyService()
+
+
+class TestHotkeyService:
+    """Tests for HotkeyService class."""
+
+    def test_disabled_start_skips_pynput_import(self, service, monkeypatch):
+        """Test starting disabled only records the hotkey."""
+        def fail():
+            raise AssertionError("pynput should not be imported")
+
+        monkeypatch.setattr(hotkey_service, "_load_hotkeys", fail)
+
+        service.start("<ctrl>+<alt>+q", enabled=False)
+
+        assert not service.is_running
+        assert not service.is_enabled
+        assert service._hotkey == "<ctrl>+<alt>+q"
+
+    def test_default_hotkey_is_shared_with_listener(self, service):
+        """Test the service falls back to the one default the listener also uses."""
+        from espanded.hotkeys import listener
+
+        service.start(enabled=False)
+
+        assert service._hotkey == listener.DEFAULT_HOTKEY
+        assert HotkeyService.DEFAULT_QUICK_ADD_HOTKEY is listener.DEFAULT_HOTKEY
+
+    def test_update_hotkey_while_stopped_is_remembered(self, service):
+        """Test a hotkey set while stopped is used by the next start."""
+        service.start(enabled=False)
+        service.update_hotkey("<ctrl>+<shift>+h")
+
+        assert service._hotkey == "<ctrl>+<shift>+h"
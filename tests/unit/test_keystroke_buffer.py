@@ -0,0 +1,312 @@
+"""Tests for the keystroke buffer."""
+
+import dataclasses
+import threading
+import time
+
+import pytest
+
+from espanded.hotkeys.keystroke_buffer import (
+    UPDATE_DEBOUNCE,
+    KeystrokeBuffer,
+    TriggerMatch,
+    _TriggerAutomaton,
+)
+
+
+def _type(buffer, text):
+    """Feed text to the buffer one character at a time."""
+    for char in text:
+        buffer.add_character(char)
+
+
+class TestTriggerMatch:
+    """Tests for TriggerMatch."""
+
+    def test_match_is_immutable_and_slotted(self):
+        """Test a match handed to a callback can't be changed and has no __dict__."""
+        match = TriggerMatch(trigger=":", filter_text="sig", total_chars=4)
+
+        assert match.search_text == ":sig"
+        assert not hasattr(match, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            match.filter_text = "x"
+
+
+class TestTriggerAutomaton:
+    """Tests for the trigger automaton."""
+
+    def test_reports_longest_trigger_ending_the_text(self):
+        """Test every trigger is found, preferring the longest at each position."""
+        automaton = _TriggerAutomaton(["x", "abx", "bxy", ""])
+
+        assert automaton.match(automaton.run("zzx")) == "x"
+        assert automaton.match(automaton.run("zabx")) == "abx"
+        assert automaton.match(automaton.run("abxy")) == "bxy"
+        assert automaton.match(automaton.run("abz")) is None
+        assert automaton.match(automaton.run("")) is None
+
+    def test_tail_reaches_same_state_as_whole_text(self):
+        """Test replaying the last max_length characters is enough."""
+        automaton = _TriggerAutomaton([":", "//", "abx"])
+        assert automaton.max_length == 3
+
+        for text in ("hello ab", "x//", "zzzzab", "a" * 50, "", "ab"):
+            assert automaton.run_tail(text) == automaton.run(text)
+
+
+class TestKeystrokeBuffer:
+    """Tests for KeystrokeBuffer class."""
+
+    def test_detects_longest_trigger(self):
+        """Test a trigger that ends with a shorter one wins over it."""
+        buffer = KeystrokeBuffer(triggers=["x", "abx"])
+        try:
+            _type(buffer, "ab")
+            assert not buffer.is_active
+            buffer.add_character("x")
+
+            match = buffer.current_match
+            assert (match.trigger, match.total_chars) == ("abx", 3)
+        finally:
+            buffer.close()
+
+    def test_trigger_found_again_after_backspacing_over_it(self):
+        """Test deleting a trigger cancels it and retyping it activates it again."""
+        buffer = KeystrokeBuffer(triggers=["//"])
+        try:
+            _type(buffer, "//")
+            assert buffer.current_match.trigger == "//"
+
+            buffer.handle_backspace()
+            assert not buffer.is_active
+            buffer.add_character("/")
+            assert buffer.current_match.trigger == "//"
+
+            buffer.handle_word_boundary()
+            _type(buffer, "/")
+            assert not buffer.is_active
+        finally:
+            buffer.close()
+
+    def test_filter_text_follows_typing_and_backspace(self):
+        """Test the match reports the text typed after the trigger."""
+        buffer = KeystrokeBuffer(triggers=[":"])
+        try:
+            _type(buffer, "x:sig")
+            buffer.handle_backspace()
+
+            match = buffer.current_match
+            assert (match.search_text, match.total_chars) == (":si", 4)
+        finally:
+            buffer.close()
+
+    def test_backspace_into_trigger_after_other_text_cancels(self):
+        """Test deleting a trigger typed mid-word cancels it."""
+        buffer = KeystrokeBuffer(triggers=["//"])
+        try:
+            _type(buffer, "ab//x")
+            buffer.handle_backspace()
+            assert buffer.current_match.filter_text == ""
+
+            buffer.handle_backspace()
+            assert not buffer.is_active
+            assert buffer.current_match is None
+        finally:
+            buffer.close()
+
+    def test_selection_returns_match_and_clears(self):
+        """Test selecting takes the active match and resets the buffer."""
+        buffer = KeystrokeBuffer(triggers=[":"])
+        try:
+            assert buffer.handle_selection() is None
+
+            _type(buffer, ":sig")
+            match = buffer.handle_selection()
+
+            assert (match.search_text, match.total_chars) == (":sig", 4)
+            assert not buffer.is_active
+            assert buffer.current_match is None
+        finally:
+            buffer.close()
+
+    def test_update_triggers_applies_to_next_character(self):
+        """Test new triggers are matched against what was already typed."""
+        buffer = KeystrokeBuffer(triggers=[":"])
+        try:
+            _type(buffer, ";")
+            buffer.update_triggers((";;",))
+            buffer.add_character(";")
+
+            assert buffer.current_match.trigger == ";;"
+        finally:
+            buffer.close()
+
+    def test_unchanged_triggers_keep_automaton(self):
+        """Test updating to the same triggers doesn't rebuild the automaton."""
+        buffer = KeystrokeBuffer(triggers=[":", "//"])
+        try:
+            automaton = buffer._automaton
+            buffer.update_triggers((":", "//"))
+            assert buffer._automaton is automaton
+
+            buffer.update_triggers((":",))
+            assert buffer._automaton is not automaton
+        finally:
+            buffer.close()
+
+    def test_callbacks_run_in_order_on_one_reused_thread(self):
+        """Test callbacks share a worker thread instead of starting one each."""
+        calls = []
+        done = threading.Event()
+
+        def record(name):
+            def callback(*args):
+                calls.append((name, threading.current_thread()))
+                if len(calls) == 4:
+                    done.set()
+            return callback
+
+        buffer = KeystrokeBuffer(
+            triggers=[":"],
+            on_trigger_detected=record("detected"),
+            on_trigger_cancelled=record("cancelled"),
+        )
+        try:
+            for _ in range(2):
+                buffer.add_character(":")
+                buffer.handle_cancel()
+            assert done.wait(5)
+        finally:
+            buffer.close()
+
+        assert [name for name, _ in calls] == ["detected", "cancelled"] * 2
+        assert len({thread for _, thread in calls}) == 1
+
+    def test_burst_of_keystrokes_sends_one_update(self):
+        """Test updates are coalesced and carry the text typed by the end of the burst."""
+        updates = []
+        done = threading.Event()
+
+        def on_updated(match):
+            updates.append(match.filter_text)
+            done.set()
+
+        buffer = KeystrokeBuffer(triggers=[":"], on_trigger_updated=on_updated)
+        try:
+            _type(buffer, ":sigx")
+            buffer.handle_backspace()
+            assert done.wait(5)
+            time.sleep(UPDATE_DEBOUNCE * 3)
+
+            _type(buffer, "n")
+            buffer.handle_word_boundary()
+            time.sleep(UPDATE_DEBOUNCE * 3)
+        finally:
+            buffer.close()
+
+        assert updates == ["sig"]
+
+    def test_typing_starts_no_timer_threads(self):
+        """Test keystrokes reuse the buffer's one timeout thread, which close() stops."""
+        buffer = KeystrokeBuffer(triggers=[":"], buffer_timeout=0.05)
+        try:
+            before = threading.active_count()
+            _type(buffer, "abc" * 20)
+            assert threading.active_count() == before
+
+            buffer.add_character(":")
+            time.sleep(0.3)
+            assert not buffer.is_active
+        finally:
+            buffer.close()
+
+        assert not buffer._timeout_thread.is_alive()
+
+    def test_debounced_updates_start_no_timer_threads(self):
+        """Test typing after a trigger debounces on the timeout thread."""
+        updates = []
+        updated = threading.Event()
+
+        def on_updated(match):
+            updates.append(match.filter_text)
+            updated.set()
+
+        buffer = KeystrokeBuffer(triggers=[":"], on_trigger_updated=on_updated)
+        try:
+            _type(buffer, ":a")
+            assert updated.wait(5)
+            updated.clear()
+
+            before = threading.active_count()
+            _type(buffer, "bcdefgh" * 5)
+            assert threading.active_count() == before
+            assert updated.wait(5)
+        finally:
+            buffer.close()
+
+        assert updates == ["a", "a" + "bcdefgh" * 5]
+
+    def test_keys_after_close_are_ignored(self):
+        """Test keystrokes that arrive during teardown don't reach the stopped worker."""
+        detected = []
+        buffer = KeystrokeBuffer(
+            triggers=[":"],
+            on_trigger_detected=detected.append,
+            on_trigger_updated=detected.append,
+        )
+        buffer.close()
+
+        _type(buffer, ":abc")
+        buffer.handle_backspace()
+
+        assert not buffer.is_active
+        assert detected == []
+
+    def test_timeout_counts_from_last_keystroke(self):
+        """Test steady typing keeps the buffer until it goes idle."""
+        buffer = KeystrokeBuffer(triggers=[":"], buffer_timeout=0.2)
+        try:
+            buffer.add_character(":")
+            for char in "abcdef":
+                time.sleep(0.05)
+                buffer.add_character(char)
+            assert buffer.current_match.filter_text == "abcdef"
+
+            time.sleep(0.5)
+            assert not buffer.is_active
+        finally:
+            buffer.close()
+
+    def test_slow_callback_never_loses_detect_or_cancel(self):
+        """Test a blocked worker still gets every detect and cancel, with updates merged."""
+        release = threading.Event()
+        calls = []
+
+        def on_detected(match):
+            release.wait(5)
+            calls.append("detected")
+
+        buffer = KeystrokeBuffer(
+            triggers=[":"],
+            on_trigger_detected=on_detected,
+            on_trigger_updated=lambda match: calls.append(match.filter_text),
+            on_trigger_cancelled=lambda: calls.append("cancelled"),
+        )
+        try:
+            buffer.add_character(":")
+            for char in "ab":
+                buffer.add_character(char)
+                time.sleep(UPDATE_DEBOUNCE * 3)
+            buffer.handle_cancel()
+            for _ in range(20):
+                buffer.add_character(":")
+                buffer.handle_cancel()
+
+            release.set()
+        finally:
+            buffer.close()
+        buffer._executor.shutdown(wait=True)
+
+        assert calls[:3] == ["detected", "ab", "cancelled"]
+        assert calls[3:] == ["detected", "cancelled"] * 20
@@ -0,0 +1,44 @@
+"""Tests for lazy package re-exports."""
+
+import importlib
+import sys
+
+import pytest
+
+
+class TestLazyExports:
+    """Tests for make_lazy_getattr."""
+
+    def test_name_is_imported_on_first_access_and_cached(self, monkeypatch):
+        """Test a re-exported name is looked up once, then lives on the package."""
+        hotkeys = importlib.import_module("espanded.hotkeys")
+        monkeypatch.delattr(hotkeys, "KeystrokeBuffer", raising=False)
+
+        buffer_cls = hotkeys.KeystrokeBuffer
+
+        assert buffer_cls is sys.modules["espanded.hotkeys.keystroke_buffer"].KeystrokeBuffer
+        assert vars(hotkeys)["KeystrokeBuffer"] is buffer_cls
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test names outside the export table fail like a normal missing attribute."""
+        hotkeys = importlib.import_module("espanded.hotkeys")
+
+        with pytest.raises(AttributeError, match="espanded.hotkeys"):
+            hotkeys.NotExported
+
+    @pytest.mark.parametrize(
+        "package",
+        [
+            "espanded.hotkeys",
+            "espanded.services",
+            "espanded.sync",
+            "espanded.ui",
+            "espanded.ui.components",
+        ],
+    )
+    def test_all_matches_export_table(self, package):
+        """Test each package's literal __all__ lists exactly its lazy exports."""
+        module = importlib.import_module(package)
+
+        assert module.__all__ == list(module._EXPORTS)
+        assert module.__getattr__.__name__ == "__getattr__"
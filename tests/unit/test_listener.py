@@ -0,0 +1,157 @@
+"""Tests for the global hotkey listener."""
+
+import threading
+import types
+
+import pytest
+
+from espanded.hotkeys import listener
+from espanded.hotkeys.listener import HotkeyListener, KeystrokeMonitor, normalize_hotkey
+
+
+class _FakeGlobalHotKeys:
+    """Records the hotkey maps listeners are started with."""
+
+    started: list[dict] = []
+
+    def __init__(self, hotkeys):
+        self.hotkeys = dict(hotkeys)
+
+    def start(self):
+        _FakeGlobalHotKeys.started.append(self.hotkeys)
+
+    def stop(self):
+        pass
+
+    def join(self, timeout=None):
+        pass
+
+
+class _FakeListener:
+    """Keeps the on_press handler so tests can press keys."""
+
+    def __init__(self, on_press):
+        self.on_press = on_press
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class _FakeKeyCode:
+    """Stands in for pynput's KeyCode."""
+
+    def __init__(self, char):
+        self.char = char
+
+
+@pytest.fixture
+def fake_pynput(monkeypatch):
+    """Replace the pynput names the listener module uses with fakes."""
+    _FakeGlobalHotKeys.started = []
+    monkeypatch.setattr(listener, "PYNPUT_AVAILABLE", True)
+    monkeypatch.setattr(listener, "KeyCode", _FakeKeyCode)
+    monkeypatch.setattr(
+        listener,
+        "keyboard",
+        types.SimpleNamespace(GlobalHotKeys=_FakeGlobalHotKeys, Listener=_FakeListener),
+    )
+
+
+@pytest.fixture
+def hotkey_listener(fake_pynput):
+    """Create a listener backed by a fake pynput GlobalHotKeys."""
+    return HotkeyListener()
+
+
+class TestNormalizeHotkey:
+    """Tests for normalize_hotkey."""
+
+    def test_formats_are_normalized(self):
+        """Test plain, upper-case and bracketed hotkeys give the pynput form."""
+        assert normalize_hotkey("ctrl+alt+e") == "<ctrl>+<alt>+e"
+        assert normalize_hotkey("CTRL+Shift+F5") == "<ctrl>+<shift>+<f5>"
+        assert normalize_hotkey("<cmd>+space") == "<cmd>+<space>"
+        assert normalize_hotkey("") == listener.DEFAULT_HOTKEY
+
+
+class TestHotkeyListener:
+    """Tests for HotkeyListener class."""
+
+    def test_reregistering_same_callback_skips_restart(self, hotkey_listener):
+        """Test registering an unchanged hotkey doesn't restart the listener."""
+        def on_add():
+            pass
+
+        hotkey_listener.register("ctrl+alt+e", on_add)
+        hotkey_listener.start()
+        hotkey_listener.register("<ctrl>+<alt>+e", on_add)
+        hotkey_listener.apply()
+
+        assert len(_FakeGlobalHotKeys.started) == 1
+
+    def test_restart_reuses_wrapped_callbacks(self, hotkey_listener):
+        """Test existing hotkeys keep their wrappers when another is added or removed."""
+        hotkey_listener.register("ctrl+alt+e", lambda: None)
+        hotkey_listener.start()
+        hotkey_listener.register("ctrl+alt+q", lambda: None)
+        hotkey_listener.apply()
+        hotkey_listener.unregister("ctrl+alt+q")
+        hotkey_listener.apply()
+
+        first, second, third = _FakeGlobalHotKeys.started
+        assert sorted(second) == ["<ctrl>+<alt>+e", "<ctrl>+<alt>+q"]
+        assert first["<ctrl>+<alt>+e"] is second["<ctrl>+<alt>+e"] is third["<ctrl>+<alt>+e"]
+        assert list(third) == ["<ctrl>+<alt>+e"]
+
+    def test_burst_of_changes_restarts_once(self, hotkey_listener):
+        """Test changes made while running coalesce into one restart."""
+        hotkey_listener.register("ctrl+alt+e", lambda: None)
+        hotkey_listener.start()
+        for key in "abcd":
+            hotkey_listener.register(f"ctrl+alt+{key}", lambda: None)
+        hotkey_listener.unregister("ctrl+alt+d")
+        assert len(_FakeGlobalHotKeys.started) == 1
+
+        hotkey_listener.apply()
+        hotkey_listener.apply()
+
+        assert len(_FakeGlobalHotKeys.started) == 2
+        assert len(_FakeGlobalHotKeys.started[-1]) == 4
+        assert hotkey_listener._restart_timer is None
+
+
+class TestKeystrokeMonitor:
+    """Tests for KeystrokeMonitor class."""
+
+    def test_callback_runs_off_the_listener_thread(self, fake_pynput):
+        """Test pressing a key only queues it, and the callback gets keys in order."""
+        release = threading.Event()
+        received = []
+        done = threading.Event()
+
+        def on_key_press(key, char):
+            release.wait(5)
+            received.append((char, threading.current_thread()))
+            if len(received) == 3:
+                done.set()
+
+        monitor = KeystrokeMonitor(on_key_press)
+        monitor.start()
+        try:
+            for char in "ab":
+                monitor._listener.on_press(_FakeKeyCode(char))
+            monitor._listener.on_press(_FakeKeyCode(None))
+            # The presses returned while the callback was still blocked
+            assert received == []
+
+            release.set()
+            assert done.wait(5)
+        finally:
+            monitor.stop()
+
+        assert [char for char, _ in received] == ["a", "b", None]
+        assert received[0][1] is not threading.current_thread()
+        assert monitor._consumer is None
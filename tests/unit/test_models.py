@@ -19,6 +19,13 @@ class TestEntry:
         assert entry.word is True
         assert entry.id != ""  # Auto-generated
 
+    def test_generated_ids_are_unique(self):
+        """Test generated IDs are distinct 32-character hex strings."""
+        ids = {Entry().id for _ in range(1000)}
+
+        assert len(ids) == 1000
+        assert all(len(i) == 32 and int(i, 16) >= 0 for i in ids)
+
     def test_full_trigger(self):
         """Test full_trigger property."""
         entry = Entry(trigger="sig", prefix=":", replacement="Signature")
@@ -44,6 +51,28 @@ class TestEntry:
         assert result["propagate_case"] is True
         assert "word" not in result  # word=True is default, not included
 
+    def test_to_espanso_dict_writes_non_default_options(self):
+        """Test every option differing from Espanso's default is written."""
+        entry = Entry(
+            trigger="x", replacement="X", word=False, propagate_case=True,
+            uppercase_style="uppercase", regex=True, case_insensitive=True,
+            force_clipboard=True, passive=True, markdown=True,
+            cursor_hint="", filter_apps=[],
+        )
+
+        assert entry.to_espanso_dict() == {
+            "trigger": ":x",
+            "replace": "X",
+            "word": False,
+            "propagate_case": True,
+            "uppercase_style": "uppercase",
+            "regex": True,
+            "case_insensitive": True,
+            "force_clipboard": True,
+            "passive_only": True,
+            "markdown": True,
+        }
+
     def test_from_espanso_dict(self):
         """Test creation from Espanso YAML data."""
         data = {
@@ -61,6 +90,33 @@ class TestEntry:
         assert entry.word is False
         assert entry.propagate_case is True
 
+    def test_from_espanso_dict_splits_prefix(self):
+        """Test the longest known prefix is split off the trigger."""
+        cases = {"::addr": ("::", "addr"), "//x": ("//", "x"), ";d": (";", "d"), "hi": ("", "hi")}
+
+        for trigger, expected in cases.items():
+            entry = Entry.from_espanso_dict({"trigger": trigger, "replace": ""})
+            assert (entry.prefix, entry.trigger) == expected
+
+    def test_from_espanso_dicts_shares_timestamp(self):
+        """Test bulk conversion stamps every entry with one time."""
+        entries = Entry.from_espanso_dicts(
+            [{"trigger": ":a", "replace": "A"}, {"trigger": ":b", "replace": "B"}],
+            source_file="work.yml",
+        )
+
+        assert [e.trigger for e in entries] == ["a", "b"]
+        assert entries[0].created_at is entries[1].modified_at
+        assert all(e.source_file == "work.yml" for e in entries)
+
+    def test_shared_strings_are_interned(self):
+        """Test entries built from separate strings share prefix and source_file."""
+        first = Entry(prefix="".join([":", ":"]), source_file="".join(["a", ".yml"]))
+        second = Entry(prefix="".join([":", ":"]), source_file="".join(["a", ".yml"]))
+
+        assert first.prefix is second.prefix
+        assert first.source_file is second.source_file
+
     def test_soft_delete(self):
         """Test soft delete functionality."""
         entry = Entry(trigger="test", replacement="Test")
@@ -69,6 +125,13 @@ class TestEntry:
         entry.deleted_at = datetime.now()
         assert entry.is_deleted is True
 
+    def test_entry_rejects_unknown_attributes(self):
+        """Test Entry uses slots, so a misspelled field can't be set silently."""
+        entry = Entry(trigger="test", replacement="Test")
+
+        with pytest.raises(AttributeError):
+            entry.replacment = "typo"
+
 
 class TestSettings:
     """Tests for Settings model."""
@@ -98,6 +161,55 @@ class TestSettings:
         assert settings.theme == "light"
         assert settings.github_repo == "user/repo"
 
+    def test_settings_from_dict_fills_missing_fields(self):
+        """Test settings saved before a field existed load with its default."""
+        data = {"theme": "dark", "quick_add_hotkey": "<ctrl>+<alt>+e"}
+        settings = Settings.from_dict(data)
+
+        assert settings.hotkeys_enabled is True
+        assert settings.autocomplete_enabled is True
+        assert settings.minimize_to_tray is True
+        assert settings.last_sync_check == 0.0
+        assert settings.autocomplete_triggers == (":",)
+
+    def test_sync_fingerprint_tracks_repo_and_token(self):
+        """Test the sync fingerprint changes with the repo or token, and hides the token."""
+        settings = Settings(github_repo="user/repo", github_token="secret")
+        fingerprint = settings.sync_fingerprint()
+
+        assert fingerprint == Settings(github_repo="user/repo", github_token="secret").sync_fingerprint()
+        assert fingerprint != Settings(github_repo="user/other", github_token="secret").sync_fingerprint()
+        assert fingerprint != Settings(github_repo="user/repo", github_token="other").sync_fingerprint()
+        assert "secret" not in fingerprint
+
+    def test_settings_triggers_load_as_tuple(self):
+        """Test stored trigger lists load back as tuples, like the default."""
+        settings = Settings.from_dict({"autocomplete_triggers": [":", "//"]})
+
+        assert settings.autocomplete_triggers == (":", "//")
+
+    def test_settings_dict_round_trip(self, sample_settings):
+        """Test every field survives to_dict/from_dict, including last_sync."""
+        sample_settings.last_sync = datetime(2024, 5, 1, 8, 30)
+        sample_settings.autocomplete_triggers = (";",)
+
+        data = sample_settings.to_dict()
+
+        assert data["last_sync"] == "2024-05-01T08:30:00"
+        assert Settings.from_dict(data) == sample_settings
+
+    def test_settings_round_trip_through_database(self, test_database):
+        """Test settings rows missing newer keys get dataclass defaults."""
+        test_database.conn.execute(
+            "INSERT INTO settings (key, value) VALUES (?, ?)", ("theme", '"dark"')
+        )
+        test_database.conn.commit()
+
+        settings = test_database.get_settings()
+
+        assert settings.theme == "dark"
+        assert settings.hotkeys_enabled is True
+
 
 class TestHistoryEntry:
     """Tests for HistoryEntry model."""
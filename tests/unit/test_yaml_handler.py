@@ -0,0 +1,232 @@
+"""Tests for the YAML handler."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from espanded.core.yaml_handler import YAMLHandler
+
+
+def _touch_later(path):
+    """Bump a file's mtime so a rewrite within the same tick is noticed."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestYAMLHandler:
+    """Tests for YAMLHandler class."""
+
+    def test_read_match_file_parses_once_while_unchanged(self, temp_dir):
+        """Test repeated reads reuse the parse but return fresh entries."""
+        match_file = temp_dir / "base.yml"
+        match_file.write_text(
+            "matches:\n  - trigger: ':hi'\n    replace: 'Hello'\n", encoding="utf-8"
+        )
+        handler = YAMLHandler()
+
+        with patch.object(handler.safe_yaml, "load", wraps=handler.safe_yaml.load) as load:
+            first = handler.read_match_file(match_file)
+            second = handler.read_match_file(match_file)
+            assert load.call_count == 1
+
+            match_file.write_text(
+                "matches:\n  - trigger: ':bye'\n    replace: 'Goodbye'\n", encoding="utf-8"
+            )
+            _touch_later(match_file)
+            third = handler.read_match_file(match_file)
+            assert load.call_count == 2
+
+        assert first[0].replacement == second[0].replacement == "Hello"
+        assert first[0] is not second[0]
+        assert third[0].trigger == "bye"
+
+    def test_read_config_file_returns_independent_copies(self, temp_dir):
+        """Test editing a returned config doesn't change later reads."""
+        config_file = temp_dir / "default.yml"
+        config_file.write_text("toggle_key: ALT\n", encoding="utf-8")
+        handler = YAMLHandler()
+
+        config = handler.read_config_file(config_file)
+        config["toggle_key"] = "CTRL"
+
+        assert handler.read_config_file(config_file)["toggle_key"] == "ALT"
+
+    def test_config_round_trip_keeps_comments_and_order(self, temp_dir):
+        """Test a config read, edited and written back keeps its comments and key order."""
+        config_file = temp_dir / "default.yml"
+        config_file.write_text(
+            "# Espanso settings\ntoggle_key: ALT  # double tap\nbackend: Auto\n",
+            encoding="utf-8",
+        )
+        handler = YAMLHandler()
+
+        config = handler.read_config_file(config_file)
+        config["toggle_key"] = "CTRL"
+        handler.write_config_file(config_file, config)
+
+        lines = config_file.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "# Espanso settings"
+        assert lines[1].startswith("toggle_key: CTRL") and lines[1].endswith("# double tap")
+        assert lines[2] == "backend: Auto"
+
+    def test_missing_files_read_as_empty(self, temp_dir):
+        """Test reading files that don't exist."""
+        handler = YAMLHandler()
+
+        assert handler.read_match_file(temp_dir / "missing.yml") == []
+        assert handler.read_config_file(temp_dir / "missing.yml") == {}
+
+    def test_import_keeps_yaml_1_2_scalars(self):
+        """Test replacements like 'yes' and 'on' load as text, not booleans."""
+        handler = YAMLHandler()
+
+        entries = handler.import_from_yaml(
+            "matches:\n  - trigger: ':y'\n    replace: yes\n  - trigger: ':o'\n    replace: on\n"
+        )
+
+        assert [e.replacement for e in entries] == ["yes", "on"]
+
+    def test_import_skips_incomplete_matches(self):
+        """Test items without a trigger or replacement, or with empty ones, are skipped."""
+        handler = YAMLHandler()
+
+        entries = handler.import_from_yaml(
+            "matches:\n"
+            "  - trigger: ':a'\n    replace: 'A'\n"
+            "  - trigger: ':b'\n"
+            "  - replace: 'C'\n"
+            "  - trigger:\n    replace: 'D'\n"
+        )
+
+        assert [e.trigger for e in entries] == ["a"]
+        assert handler.import_from_yaml("matches:\n") == []
+
+    def test_validate_reports_first_bad_match(self):
+        """Test validation names the first invalid match and rejects non-mapping files."""
+        handler = YAMLHandler()
+
+        assert handler.validate_yaml(
+            "matches:\n  - trigger: ':a'\n    replace: 'A'\n  - trigger: ':b'\n  - 3\n"
+        ) == (False, "Match 2 is missing 'replace'")
+        assert handler.validate_yaml("matches:\n  - 3\n") == (False, "Match 1 must be a dictionary")
+        assert handler.validate_yaml("- trigger: ':a'\n") == (False, "Top level must be a dictionary")
+        assert handler.validate_yaml("") == (True, "")
+
+    def test_import_and_validate_from_open_file(self, temp_dir):
+        """Test a file object is parsed directly."""
+        match_file = temp_dir / "shared.yml"
+        match_file.write_text(
+            "matches:\n  - trigger: ':tel'\n    replace: '555-0100'\n", encoding="utf-8"
+        )
+        handler = YAMLHandler()
+
+        with open(match_file, encoding="utf-8") as f:
+            entries = handler.import_from_yaml(f, source_file="shared.yml")
+        with open(match_file, encoding="utf-8") as f:
+            assert handler.validate_yaml(f) == (True, "")
+
+        assert [(e.trigger, e.source_file) for e in entries] == [("tel", "shared.yml")]
+
+    def test_read_all_match_files(self, temp_dir):
+        """Test every .yml and .yaml file with matches is read."""
+        match_dir = temp_dir / "match"
+        match_dir.mkdir()
+        for i in range(4):
+            (match_dir / f"file{i}.yml").write_text(
+                f"matches:\n  - trigger: ':t{i}'\n    replace: 'r{i}'\n", encoding="utf-8"
+            )
+        (match_dir / "extra.yaml").write_text(
+            "matches:\n  - trigger: ':x'\n    replace: 'X'\n", encoding="utf-8"
+        )
+        (match_dir / "empty.yml").write_text("matches: []\n", encoding="utf-8")
+
+        result = YAMLHandler().read_all_match_files(temp_dir)
+
+        assert sorted(result) == ["extra.yaml", "file0.yml", "file1.yml", "file2.yml", "file3.yml"]
+        assert result["file2.yml"][0].replacement == "r2"
+
+    def test_read_all_shares_repeated_replacements(self, temp_dir):
+        """Test identical replacement texts across files load as one string object."""
+        match_dir = temp_dir / "match"
+        match_dir.mkdir()
+        for name in ("a.yml", "b.yml"):
+            (match_dir / name).write_text(
+                "matches:\n  - trigger: ':x'\n    replace: 'Kind regards, the team'\n"
+                "  - trigger: ':y'\n    replace: 'Kind regards, the team'\n",
+                encoding="utf-8",
+            )
+
+        result = YAMLHandler().read_all_match_files(temp_dir)
+
+        texts = [e.replacement for entries in result.values() for e in entries]
+        assert len(texts) == 4
+        assert all(text is texts[0] for text in texts)
+
+    def test_sidecar_skips_parsing_on_next_start(self, temp_dir, isolated_home):
+        """Test a new handler loads an unchanged file from its sidecar in ~/.espanded."""
+        match_file = temp_dir / "base.yml"
+        match_file.write_text(
+            "matches:\n  - trigger: ':hi'\n    replace: 'Hello'\n", encoding="utf-8"
+        )
+        YAMLHandler().read_match_file(match_file)
+        assert [p.name for p in temp_dir.iterdir()] == ["base.yml"]
+        sidecars = list((isolated_home / ".espanded" / "cache" / "matches").iterdir())
+        assert len(sidecars) == 1
+        assert json.loads(sidecars[0].read_text(encoding="utf-8"))["matches"] == [
+            {"trigger": ":hi", "replace": "Hello"}
+        ]
+
+        handler = YAMLHandler()
+        with patch.object(handler.safe_yaml, "load") as load:
+            entries = handler.read_match_file(match_file)
+        assert load.call_count == 0
+        assert entries[0].replacement == "Hello"
+
+        match_file.write_text(
+            "matches:\n  - trigger: ':bye'\n    replace: 'Goodbye'\n", encoding="utf-8"
+        )
+        _touch_later(match_file)
+        assert YAMLHandler().read_match_file(match_file)[0].trigger == "bye"
+
+    def test_write_match_file_refreshes_sidecar(self, temp_dir, sample_entries):
+        """Test written entries read back without parsing, and a bad sidecar is ignored."""
+        match_file = temp_dir / "base.yml"
+        cache_dir = temp_dir / "cache"
+        YAMLHandler(cache_dir).write_match_file(match_file, sample_entries)
+
+        handler = YAMLHandler(cache_dir)
+        with patch.object(handler.safe_yaml, "load") as load:
+            entries = handler.read_match_file(match_file)
+        assert load.call_count == 0
+        assert [e.full_trigger for e in entries] == [":sig", ":addr", "::meeting"]
+
+        handler._sidecar_path(match_file).write_bytes(b"not json")
+        assert len(YAMLHandler(cache_dir).read_match_file(match_file)) == 3
+
+    def test_sidecar_skipped_for_items_json_cannot_hold(self, temp_dir):
+        """Test a file whose items don't survive JSON is parsed again rather than cached."""
+        match_file = temp_dir / "base.yml"
+        match_file.write_text(
+            "matches:\n  - trigger: ':d'\n    replace: 'x'\n    when: 2024-01-01\n",
+            encoding="utf-8",
+        )
+        handler = YAMLHandler(temp_dir / "cache")
+        handler.read_match_file(match_file)
+
+        assert not handler._sidecar_path(match_file).exists()
+
+    def test_failed_write_keeps_existing_file(self, temp_dir, sample_entries):
+        """Test a write that fails midway leaves the old file and no temp file."""
+        match_file = temp_dir / "base.yml"
+        handler = YAMLHandler()
+        handler.write_match_file(match_file, sample_entries)
+        before = match_file.read_bytes()
+
+        with patch("espanded.core.yaml_handler.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                handler.write_match_file(match_file, sample_entries[:1])
+
+        assert match_file.read_bytes() == before
+        assert [p.name for p in temp_dir.iterdir()] == ["base.yml"]